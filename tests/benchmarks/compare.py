@@ -0,0 +1,75 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that compares two benchmark result files stored with TPRIGTOOLKIT_BENCHMARK_OUTPUT
+Usage: python -m tests.benchmarks.compare <base.json> <new.json> [--threshold 1.25]
+Exits with code 1 if any benchmark is slower than the given threshold
+"""
+
+from __future__ import print_function
+
+import sys
+import json
+import argparse
+
+
+def load_results(file_path):
+    """
+    Returns benchmark results of the given file indexed by benchmark name and parameters
+    :param file_path: str
+    :return: tuple(dict, dict), results file metadata and minimum timing of each benchmark
+    """
+
+    with open(file_path, 'r') as fh:
+        data = json.load(fh)
+
+    results = dict()
+    for result in data.get('results', list()):
+        key = (result['name'], json.dumps(result.get('params', dict()), sort_keys=True))
+        results[key] = result['min']
+
+    return data, results
+
+
+def compare(base_results, new_results, threshold=1.25):
+    """
+    Compares the timings of the benchmarks found in both results
+    :param base_results: dict
+    :param new_results: dict
+    :param threshold: float, ratio (new / base) from which a benchmark is considered a regression
+    :return: list(tuple(str, str, float, float, float, bool)), name, parameters, base timing, new timing, ratio and
+        whether the benchmark is a regression
+    """
+
+    comparison = list()
+    for key in sorted(set(base_results) & set(new_results)):
+        base_time, new_time = base_results[key], new_results[key]
+        ratio = new_time / base_time if base_time else float('inf')
+        comparison.append((key[0], key[1], base_time, new_time, ratio, ratio > threshold))
+
+    return comparison
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description='Compares tpRigToolkit benchmark results')
+    parser.add_argument('base')
+    parser.add_argument('new')
+    parser.add_argument('--threshold', type=float, default=1.25)
+    args = parser.parse_args(args)
+
+    base_data, base_results = load_results(args.base)
+    new_data, new_results = load_results(args.new)
+    print('Base: {} | New: {}'.format(base_data.get('commit'), new_data.get('commit')))
+
+    regressions = 0
+    for name, params, base_time, new_time, ratio, regression in compare(base_results, new_results, args.threshold):
+        regressions += int(regression)
+        print('{:<30} {:<50} {:>10.5f} {:>10.5f} {:>7.2f}x{}'.format(
+            name, params, base_time, new_time, ratio, ' REGRESSION' if regression else ''))
+
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,71 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains fixtures used by tpRigToolkit benchmarks
+By default benchmarks run with small sizes so they can be executed with the rest of the tests. Use
+TPRIGTOOLKIT_BENCHMARK_SCALE=full to run the complete sizes and TPRIGTOOLKIT_BENCHMARK_OUTPUT=<file.json> to store
+the results in a machine readable file that can be compared between commits with tests.benchmarks.compare
+"""
+
+import os
+import sys
+import json
+import timeit
+import platform
+import subprocess
+
+import pytest
+
+from tests.benchmarks.helpers import BENCHMARK_SCALE, BENCHMARK_OUTPUT
+
+_RESULTS = list()
+
+
+@pytest.fixture
+def bench(request):
+    """
+    Returns a function that times the given callable and stores the result
+    """
+
+    def _bench(name, fn, repeat=3, setup=None, **params):
+        timings = list()
+        result = None
+        for _ in range(repeat):
+            if setup:
+                setup()
+            start = timeit.default_timer()
+            result = fn()
+            timings.append(timeit.default_timer() - start)
+        _RESULTS.append({
+            'test': request.node.nodeid,
+            'name': name,
+            'params': params,
+            'repeat': repeat,
+            'min': min(timings),
+            'mean': sum(timings) / len(timings),
+            'max': max(timings)
+        })
+        return result, min(timings)
+
+    return _bench
+
+
+def pytest_sessionfinish(session, exitstatus):
+    if not BENCHMARK_OUTPUT or not _RESULTS:
+        return
+
+    try:
+        commit = subprocess.check_output(
+            ['git', 'rev-parse', 'HEAD'], cwd=os.path.dirname(__file__)).decode('utf-8').strip()
+    except Exception:
+        commit = None
+
+    with open(BENCHMARK_OUTPUT, 'w') as fh:
+        json.dump({
+            'commit': commit,
+            'python': sys.version.split()[0],
+            'platform': platform.platform(),
+            'scale': BENCHMARK_SCALE,
+            'results': _RESULTS
+        }, fh, indent=4)
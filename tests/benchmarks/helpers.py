@@ -0,0 +1,22 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains helper functions used by tpRigToolkit benchmarks
+"""
+
+import os
+
+BENCHMARK_SCALE = os.environ.get('TPRIGTOOLKIT_BENCHMARK_SCALE', 'quick')
+BENCHMARK_OUTPUT = os.environ.get('TPRIGTOOLKIT_BENCHMARK_OUTPUT', '')
+
+
+def scaled(quick, full):
+    """
+    Returns the sizes that should be used by a benchmark depending on the current benchmark scale
+    :param quick: list(int)
+    :param full: list(int)
+    :return: list(int)
+    """
+
+    return full if BENCHMARK_SCALE == 'full' else quick
@@ -0,0 +1,45 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains benchmarks for tpRigToolkit batch runner
+"""
+
+import os
+import json
+
+import pytest
+
+from tpRigToolkit.core import batch
+
+from tests.benchmarks.helpers import scaled
+
+
+def _run_export(directory, items_count, max_workers):
+    def _create_task(index):
+        file_path = os.path.join(directory, 'item{}.json'.format(index))
+
+        def _process(data):
+            with open(file_path, 'w') as fh:
+                json.dump(data, fh)
+            return file_path
+
+        return batch.BatchTask(
+            'item{}'.format(index), prepare=lambda: {'weights': [[index, i * 0.5] for i in range(2000)]},
+            process=_process)
+
+    runner = batch.BatchRunner(max_workers=max_workers)
+    for i in range(items_count):
+        runner.add_task(_create_task(i))
+
+    return runner.run()
+
+
+@pytest.mark.parametrize('items_count', scaled([50], [50, 500]))
+def test_batch_export_throughput(bench, tmp_path, items_count):
+    directory = str(tmp_path)
+
+    serial_tasks, _ = bench('batch_export_serial', lambda: _run_export(directory, items_count, 0), items=items_count)
+    pool_tasks, _ = bench('batch_export_pool', lambda: _run_export(directory, items_count, 4), items=items_count)
+
+    assert all(task.succeeded for task in serial_tasks + pool_tasks)
@@ -0,0 +1,39 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains benchmarks for tpRigToolkit chunked container file format
+"""
+
+import json
+
+import pytest
+
+from tpRigToolkit.core import container
+
+from tests.benchmarks.helpers import scaled
+
+
+def _read_json_section(file_path, section_name):
+    with open(file_path, 'r') as fh:
+        return json.load(fh)[section_name]
+
+
+@pytest.mark.parametrize('nodes_count', scaled([10000], [10000, 100000]))
+def test_container_partial_read(bench, tmp_path, nodes_count):
+    document = {
+        'spaces': ['world', 'root', 'cog'],
+        'weights': [{'name': 'joint{}'.format(i), 'matrix': [float(i)] * 16} for i in range(nodes_count)]
+    }
+    json_file = str(tmp_path / 'data.json')
+    with open(json_file, 'w') as fh:
+        json.dump(document, fh)
+    container_file = container.convert_json_file(json_file, str(tmp_path / 'data.sswitch'))
+
+    json_spaces, _ = bench('json_read_section', lambda: _read_json_section(json_file, 'spaces'), nodes=nodes_count)
+    container_spaces, _ = bench(
+        'container_read_section', lambda: container.read_document(container_file, section_names=['spaces']),
+        nodes=nodes_count)
+    bench('container_read_document', lambda: container.read_document(container_file), nodes=nodes_count)
+
+    assert container_spaces['spaces'] == json_spaces
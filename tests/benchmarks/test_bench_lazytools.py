@@ -0,0 +1,71 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains benchmarks for tpRigToolkit lazy tools loading
+"""
+
+import os
+import sys
+import importlib
+
+import pytest
+
+from tpRigToolkit.core import lazytools
+
+from tests.benchmarks.helpers import scaled
+
+TOOL_IMPORT_TIME = 0.002
+USED_TOOLS = 3
+
+
+@pytest.fixture
+def fake_tools_package(tmp_path):
+    package_name = 'faketools_{}'.format(os.getpid())
+    tools_path = tmp_path / package_name / 'tools'
+    tools_path.mkdir(parents=True)
+    (tmp_path / package_name / '__init__.py').write_text(u'')
+    (tools_path / '__init__.py').write_text(u'')
+    for i in range(max(scaled([32], [32, 128]))):
+        tool_path = tools_path / 'tool{}'.format(i)
+        tool_path.mkdir()
+        (tool_path / '__init__.py').write_text(u'import time\ntime.sleep({})\n'.format(TOOL_IMPORT_TIME))
+
+    sys.path.insert(0, str(tmp_path))
+    yield package_name
+    sys.path.remove(str(tmp_path))
+    for module_name in list(sys.modules):
+        if module_name.startswith(package_name):
+            sys.modules.pop(module_name)
+
+
+@pytest.mark.parametrize('tools_count', scaled([32], [32, 128]))
+def test_lazy_tools_cold_start(bench, fake_tools_package, tools_count):
+    tool_names = ['tool{}'.format(i) for i in range(tools_count)]
+
+    def _purge():
+        for module_name in list(sys.modules):
+            if module_name.startswith('{}.tools.'.format(fake_tools_package)):
+                sys.modules.pop(module_name)
+
+    def _load(names):
+        for name in names:
+            importlib.import_module('{}.tools.{}'.format(fake_tools_package, name))
+
+    def _eager():
+        _load(tool_names)
+
+    def _lazy():
+        registry = lazytools.LazyToolsRegistry(load_fn=_load)
+        for name in tool_names:
+            registry.register_stub(lazytools.ToolStub('{}-tools-{}'.format(fake_tools_package, name), name))
+        launch = registry.wrap_launcher(lambda tool_id: tool_id)
+        for name in tool_names[:USED_TOOLS]:
+            launch(name)
+        return registry
+
+    _, eager_time = bench('eager_tools_load', _eager, setup=_purge, tools=tools_count)
+    registry, lazy_time = bench('lazy_tools_load', _lazy, setup=_purge, tools=tools_count, used=USED_TOOLS)
+
+    assert len([stub for stub in registry.stubs() if stub.loaded]) == USED_TOOLS
+    assert lazy_time < eager_time
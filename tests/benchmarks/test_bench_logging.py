@@ -0,0 +1,46 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains benchmarks for tpRigToolkit asynchronous logging
+"""
+
+import logging
+import logging.handlers
+
+import pytest
+
+from tpRigToolkit.core import logs
+
+from tests.benchmarks.helpers import scaled
+
+FORMAT = '[%(levelname)1.1s  %(asctime)s | %(name)s | %(module)s:%(funcName)s:%(lineno)d] > %(message)s'
+
+
+@pytest.mark.parametrize('lines_count', scaled([5000], [5000, 50000]))
+def test_logging_lines_per_second(bench, tmp_path, lines_count):
+    logger = logging.getLogger('tpRigToolkit-bench-logging')
+    logger.propagate = False
+    logger.setLevel(logging.DEBUG)
+
+    def _log(handler):
+        handler.setFormatter(logging.Formatter(FORMAT))
+        logger.addHandler(handler)
+        try:
+            for i in range(lines_count):
+                logger.info('Found Data Class: %s', i)
+        finally:
+            logger.removeHandler(handler)
+            handler.close()
+
+    def _sync():
+        return _log(logging.handlers.RotatingFileHandler(str(tmp_path / 'sync.log'), 'w', 50000000, 3))
+
+    def _async():
+        return _log(logs.AsyncFileHandler(str(tmp_path / 'async.log'), mode='w', max_bytes=50000000, backup_count=3))
+
+    _, sync_time = bench('sync_file_logging', _sync, lines=lines_count)
+    _, async_time = bench('async_file_logging', _async, lines=lines_count)
+
+    with open(str(tmp_path / 'async.log')) as fh:
+        assert len(fh.readlines()) == lines_count
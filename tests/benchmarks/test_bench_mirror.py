@@ -0,0 +1,46 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains benchmarks for tpRigToolkit mirror name engine
+"""
+
+import pytest
+
+from tpRigToolkit.core import naming, sides, mirror
+
+from tests.test_naming import NAMING_DATA
+from tests.benchmarks.helpers import scaled
+
+SIDES = ['l', 'r', 'c']
+
+
+def _mirror_one_by_one(side_table, rule, node_names):
+    # Per name algorithm used before the mirror engine: sides are retrieved and the name is parsed for each name
+    mirror_names = list()
+    for node_name in node_names:
+        all_sides = side_table.get_sides(skip_default=True)
+        side = rule.parse(node_name, get_keys=True).get('side')
+        mirror_name = node_name
+        if side in all_sides:
+            mirror_side = [other_side for other_side in all_sides if other_side != side][0]
+            mirror_name = rule.solve(**dict(rule.parse(node_name), side=mirror_side))
+        mirror_names.append(mirror_name)
+
+    return mirror_names
+
+
+@pytest.mark.parametrize('names_count', scaled([10000], [10000, 100000]))
+def test_mirror_names_throughput(bench, names_count):
+    side_table = sides.SideTable.from_project(None)
+    rule = naming.CompiledNaming(NAMING_DATA).get_rule('default')
+    node_names = ['{}_limb{}_jnt'.format(SIDES[i % 3], i) for i in range(names_count)]
+
+    loop_names, _ = bench('get_mirror_name_loop', lambda: _mirror_one_by_one(side_table, rule, node_names),
+                          names=names_count)
+    (mirror_names, unmirrored_names), _ = bench(
+        'get_mirror_names', lambda: mirror.MirrorEngine(side_table, rule=rule).get_mirror_names(node_names),
+        names=names_count)
+
+    assert len(unmirrored_names) == len(node_names[2::3])
+    assert [mirror_names.get(node_name, node_name) for node_name in node_names] == loop_names
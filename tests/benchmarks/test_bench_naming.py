@@ -0,0 +1,90 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains benchmarks for tpRigToolkit naming
+"""
+
+import pytest
+
+from tpRigToolkit.core import naming
+
+from tests.test_naming import NAMING_DATA
+from tests.benchmarks.helpers import scaled
+
+SIDES = ['left', 'right', 'center']
+NODE_TYPES = ['joint', 'group', 'controller']
+
+
+@pytest.mark.parametrize('names_count', scaled([10000], [10000, 100000]))
+def test_batch_naming_throughput(bench, names_count):
+    rule = naming.CompiledNaming(NAMING_DATA).get_rule('default')
+    records = {
+        'description': ['part{}'.format(i // 9) for i in range(names_count)],
+        'side': [SIDES[i % 3] for i in range(names_count)],
+        'node_type': [NODE_TYPES[(i // 3) % 3] for i in range(names_count)]
+    }
+    scene_names = ['l_part{}_jnt'.format(i) for i in range(names_count // 9)]
+
+    def _solve_one_by_one():
+        unique_names = naming.UniqueNames(scene_names)
+        return [unique_names.get_unique_name(rule.solve(**record)) for record in naming.iterate_records(records)]
+
+    def _solve_batch():
+        return naming.solve_names(rule, records, unique_names=naming.UniqueNames(scene_names))
+
+    solved_names, _ = bench('solve_name_loop', _solve_one_by_one, names=names_count)
+    batch_names, _ = bench('solve_names', _solve_batch, names=names_count)
+    parsed_names, _ = bench('parse_names', lambda: naming.parse_names(rule, batch_names), names=names_count)
+
+    assert batch_names == solved_names
+    assert len(set(batch_names) | set(scene_names)) == names_count + len(scene_names)
+    assert len(parsed_names) == names_count
+
+
+@pytest.mark.parametrize('rules_count', scaled([200], [200, 2000]))
+def test_naming_file_cold_load(bench, tmp_path, rules_count):
+    yaml = pytest.importorskip('yaml')
+
+    naming_data = dict(NAMING_DATA, rules=[dict(NAMING_DATA['rules'][i % 3], name='rule{}'.format(i)) for i in range(
+        rules_count)])
+    naming_file = tmp_path / 'naming.yml'
+    naming_file.write_text(yaml.safe_dump(naming_data))
+    naming_file = str(naming_file)
+    cache_directory = str(tmp_path / 'cache')
+    naming.read_naming_data(naming_file, cache_directory=cache_directory)
+
+    parsed_data, _ = bench('read_naming_data_yaml', lambda: naming.read_naming_data(naming_file), rules=rules_count)
+    cached_data, _ = bench(
+        'read_naming_data_cached', lambda: naming.read_naming_data(naming_file, cache_directory=cache_directory),
+        rules=rules_count)
+
+    assert cached_data == parsed_data == naming_data
+
+
+@pytest.mark.parametrize('names_count', scaled([10000], [10000, 100000]))
+def test_parse_index_throughput(bench, names_count):
+    compiled_naming = naming.CompiledNaming(NAMING_DATA)
+    rules = [compiled_naming.get_rule(rule_name) for rule_name in ('default', 'node', 'joint')]
+    node_names = [
+        rules[i % 3].solve('part{}'.format(i), side=SIDES[i % 3], node_type=NODE_TYPES[i % 3], index=i)
+        for i in range(names_count)]
+
+    def _try_every_rule():
+        matched_rules = list()
+        for node_name in node_names:
+            for rule in rules:
+                split_name = node_name.split('_')
+                if len(split_name) == len(rule.fields) and None not in rule.parse(node_name).values():
+                    matched_rules.append(rule)
+                    break
+        return matched_rules
+
+    def _parse_index():
+        parse_index = compiled_naming.get_parse_index()
+        return [parse_index.match(node_name) for node_name in node_names]
+
+    loop_rules, _ = bench('match_rule_loop', _try_every_rule, names=names_count)
+    index_rules, _ = bench('match_rule_parse_index', _parse_index, names=names_count)
+
+    assert index_rules == loop_rules == [rules[i % 3] for i in range(names_count)]
@@ -0,0 +1,303 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains the naming throughput benchmark suite of tpRigToolkit
+Benchmarks run names manager and tpRigToolkit API functions (solve_name, parse_name, get_mirror_name, get_sides and
+solve_node_name_by_type) against a fake DCC scene and multiple naming files. tpDcc modules are replaced with fakes, so
+configuration lookups and naming caches of the manager are also measured. Core implementations are benchmarked too
+"""
+
+import os
+import sys
+import copy
+import importlib
+
+import pytest
+
+from tpRigToolkit.core import naming, sides, mirror, scene, classifier
+
+from tests.fakes import FakeDcc, FakeProject, FakeConfig, FakeConfigs, FakeDccProxy, create_tpdcc_modules
+from tests.test_naming import NAMING_DATA
+from tests.benchmarks.helpers import scaled
+
+NODES_COUNTS = scaled([1000], [1000, 10000, 100000])
+NAMING_SIDES = {
+    'short': ['l', 'r', 'c'],
+    'upper': ['L', 'R', 'C'],
+    'long': ['left', 'right', 'center']
+}
+AUTO_SUFFIXES = {'group': 'grp', 'controller': 'ctrl', 'joint': 'jnt'}
+SIDES = ['left', 'right', 'center']
+NODE_TYPES = ['joint', 'group', 'controller']
+
+
+@pytest.fixture(scope='module', params=sorted(NAMING_SIDES.keys()))
+def naming_file(request, tmp_path_factory):
+    yaml = pytest.importorskip('yaml')
+
+    naming_data = copy.deepcopy(NAMING_DATA)
+    naming_data['tokens'][0]['values']['value'] = NAMING_SIDES[request.param]
+    naming_file = tmp_path_factory.mktemp('naming') / '{}.yml'.format(request.param)
+    naming_file.write_text(yaml.safe_dump(naming_data))
+
+    return str(naming_file)
+
+
+@pytest.fixture(scope='module')
+def tpdcc_api():
+    """
+    Imports names manager and tpRigToolkit API with fake tpDcc modules
+    Returns names module, api module, DCC proxy and configurations manager
+    """
+
+    dcc_proxy = FakeDccProxy()
+    configs = FakeConfigs()
+    fake_modules = create_tpdcc_modules(dcc_proxy, configs)
+    module_names = ['tpRigToolkit.managers.names', 'tpRigToolkit.core.api']
+    previous_modules = dict((name, sys.modules.get(name)) for name in list(fake_modules) + module_names)
+    sys.modules.update(fake_modules)
+    try:
+        for module_name in module_names:
+            sys.modules.pop(module_name, None)
+        names = importlib.import_module('tpRigToolkit.managers.names')
+        api = importlib.import_module('tpRigToolkit.core.api')
+        yield names, api, dcc_proxy, configs
+    finally:
+        for module_name, module in previous_modules.items():
+            if module is None:
+                sys.modules.pop(module_name, None)
+            else:
+                sys.modules[module_name] = module
+
+
+@pytest.fixture
+def names_api(tpdcc_api, naming_file):
+    names, api, dcc_proxy, configs = tpdcc_api
+    configs.configs['tpRigToolkit-names'] = FakeConfig(path=naming_file)
+    configs.configs['tpRigToolkit-naming'] = FakeConfig(data={'auto_suffixes': AUTO_SUFFIXES})
+    names.clear_cache()
+    sides.clear_side_tables()
+    yield names, api, dcc_proxy
+    names.clear_cache()
+
+
+def _get_records(nodes_count):
+    return [
+        {'description': 'part{}'.format(i), 'side': SIDES[i % 3], 'node_type': NODE_TYPES[i % 3]}
+        for i in range(nodes_count)]
+
+
+def _create_scene(nodes_count):
+    """
+    Creates a fake scene with the given number of nodes. Scene contains groups with joint chains and controls
+    Short names of the nodes are returned, as they are the ones used to solve their new names
+    """
+
+    fake_dcc = FakeDcc()
+    node_names = list()
+    group = None
+    for i in range(nodes_count):
+        if i % 50 == 0:
+            group = fake_dcc.add_node('group{}'.format(i), 'transform')
+            node_names.append('group{}'.format(i))
+        elif i % 5 == 0:
+            control = fake_dcc.add_node('control{}'.format(i), 'transform', parent=group)
+            fake_dcc.add_node('control{}Shape'.format(i), 'nurbsCurve', parent=control)
+            node_names.append('control{}'.format(i))
+        else:
+            fake_dcc.add_node('joint{}'.format(i), 'joint', parent=group)
+            node_names.append('joint{}'.format(i))
+
+    return fake_dcc, node_names
+
+
+@pytest.mark.parametrize('nodes_count', NODES_COUNTS)
+def test_bench_solve_name(bench, naming_file, nodes_count):
+    naming_name = os.path.basename(naming_file)
+    engine = naming.NamingEngine()
+    records = _get_records(nodes_count)
+
+    def _solve_one_by_one():
+        return [engine.solve(naming_file, 'default', **record) for record in records]
+
+    def _solve_batch():
+        return naming.solve_names(engine.get_rule(naming_file, 'default'), records)
+
+    solved_names, _ = bench('solve_name', _solve_one_by_one, names=nodes_count, naming=naming_name)
+    batch_names, _ = bench('solve_names', _solve_batch, names=nodes_count, naming=naming_name)
+
+    assert solved_names == batch_names
+
+
+@pytest.mark.parametrize('nodes_count', NODES_COUNTS)
+def test_bench_parse_name(bench, naming_file, nodes_count):
+    naming_name = os.path.basename(naming_file)
+    engine = naming.NamingEngine()
+    node_names = naming.solve_names(engine.get_rule(naming_file, 'default'), _get_records(nodes_count))
+
+    def _parse_one_by_one():
+        return [engine.parse(naming_file, 'default', node_name) for node_name in node_names]
+
+    def _match_names():
+        parse_index = engine.get_naming(naming_file).get_parse_index()
+        return [parse_index.parse(node_name)[1] for node_name in node_names]
+
+    parsed_names, _ = bench('parse_name', _parse_one_by_one, names=nodes_count, naming=naming_name)
+    matched_names, _ = bench('match_names', _match_names, names=nodes_count, naming=naming_name)
+
+    assert parsed_names == matched_names
+
+
+@pytest.mark.parametrize('nodes_count', NODES_COUNTS)
+def test_bench_get_mirror_name(bench, naming_file, nodes_count):
+    naming_name = os.path.basename(naming_file)
+    engine = naming.NamingEngine()
+    compiled_naming = engine.get_naming(naming_file)
+    node_names = naming.solve_names(compiled_naming.get_rule('default'), _get_records(nodes_count))
+    project = FakeProject()
+
+    def _mirror_one_by_one():
+        # Same calls done by tpRigToolkit.core.api.get_mirror_name for each name
+        return [mirror.MirrorEngine(
+            sides.get_side_table(project), parse_index=engine.get_naming(naming_file).get_parse_index()
+        ).get_mirror_name(node_name) for node_name in node_names]
+
+    def _mirror_batch():
+        return mirror.MirrorEngine(
+            sides.get_side_table(project), parse_index=compiled_naming.get_parse_index()).get_mirror_names(node_names)
+
+    mirror_names, _ = bench('get_mirror_name', _mirror_one_by_one, names=nodes_count, naming=naming_name)
+    (batch_names, unmirrored_names), _ = bench(
+        'get_mirror_names', _mirror_batch, names=nodes_count, naming=naming_name)
+
+    assert [batch_names.get(node_name) for node_name in node_names] == mirror_names
+    assert len(batch_names) + len(unmirrored_names) == nodes_count
+
+
+@pytest.mark.parametrize('nodes_count', NODES_COUNTS)
+def test_bench_get_sides(bench, nodes_count):
+    project = FakeProject(options={'sides': {'left': 'l', 'right': 'r', 'center': 'c'}})
+    sides.clear_side_tables()
+
+    def _get_sides():
+        return [sides.get_side_table(project).get_sides(skip_default=True) for _ in range(nodes_count)]
+
+    all_sides, _ = bench('get_sides', _get_sides, calls=nodes_count)
+
+    assert all_sides[-1] == ['right', 'center']
+
+
+@pytest.mark.parametrize('nodes_count', NODES_COUNTS)
+def test_bench_solve_node_name_by_type(bench, naming_file, nodes_count):
+    naming_name = os.path.basename(naming_file)
+    compiled_naming = naming.NamingEngine().get_naming(naming_file)
+    scenes = list()
+
+    def _setup():
+        scenes.append(_create_scene(nodes_count))
+
+    def _solve_and_rename():
+        fake_dcc, node_names = scenes[-1]
+        node_classifier = classifier.NodeClassifier()
+        snapshot = scene.SceneSnapshot(fake_dcc, node_names, classifier=node_classifier)
+        solved_names = scene.solve_node_names_by_type(
+            snapshot, compiled_naming, AUTO_SUFFIXES, node_classifier=node_classifier, side='left')
+        return snapshot.rename_nodes(solved_names, unique_name=True)
+
+    new_names, _ = bench(
+        'solve_node_name_by_type', _solve_and_rename, setup=_setup, nodes=nodes_count, naming=naming_name)
+
+    fake_dcc = scenes[-1][0]
+    assert len(new_names) == nodes_count
+    assert len(set(fake_dcc.all_scene_nodes(full_path=False))) == len(fake_dcc.nodes)
+
+
+@pytest.mark.parametrize('nodes_count', NODES_COUNTS)
+def test_bench_names_solve_name(bench, names_api, nodes_count):
+    names, _, dcc_proxy = names_api
+    dcc_proxy.current = FakeDcc()
+    records = _get_records(nodes_count)
+
+    def _solve_names():
+        return [names.solve_name(**record) for record in records]
+
+    def _solve_unique_names():
+        return [names.solve_name(unique_name=True, **record) for record in records]
+
+    solved_names, _ = bench('names.solve_name', _solve_names, names=nodes_count, naming=_get_naming_name(names))
+    unique_names, _ = bench(
+        'names.solve_name.unique', _solve_unique_names, names=nodes_count, naming=_get_naming_name(names))
+
+    assert solved_names == unique_names
+    assert solved_names[1].split('_')[-1] == AUTO_SUFFIXES['group']
+
+
+@pytest.mark.parametrize('nodes_count', NODES_COUNTS)
+def test_bench_names_parse_name(bench, names_api, nodes_count):
+    names, _, _ = names_api
+    node_names = [names.solve_name(**record) for record in _get_records(nodes_count)]
+
+    def _parse_names():
+        return [names.parse_name(node_name) for node_name in node_names]
+
+    def _match_names():
+        return names.match_names(node_names)
+
+    parsed_names, _ = bench('names.parse_name', _parse_names, names=nodes_count, naming=_get_naming_name(names))
+    matched_names, _ = bench('names.match_names', _match_names, names=nodes_count, naming=_get_naming_name(names))
+
+    assert [parsed_name for _, parsed_name in matched_names] == parsed_names
+
+
+@pytest.mark.parametrize('nodes_count', NODES_COUNTS)
+def test_bench_api_get_mirror_name(bench, names_api, nodes_count):
+    names, api, _ = names_api
+    project = FakeProject()
+    node_names = [names.solve_name(**record) for record in _get_records(nodes_count)]
+
+    def _mirror_names():
+        return [api.get_mirror_name(project, node_name) for node_name in node_names]
+
+    mirror_names, _ = bench('api.get_mirror_name', _mirror_names, names=nodes_count, naming=_get_naming_name(names))
+    (batch_names, _), _ = bench(
+        'api.get_mirror_names', lambda: api.get_mirror_names(project, node_names), names=nodes_count,
+        naming=_get_naming_name(names))
+
+    assert [batch_names.get(node_name, node_name) for node_name in node_names] == mirror_names
+
+
+@pytest.mark.parametrize('nodes_count', NODES_COUNTS)
+def test_bench_api_get_sides(bench, names_api, nodes_count):
+    _, api, _ = names_api
+    project = FakeProject(options={'sides': {'left': 'l', 'right': 'r', 'center': 'c'}})
+
+    def _get_sides():
+        return [api.get_sides(project, skip_default=True) for _ in range(nodes_count)]
+
+    all_sides, _ = bench('api.get_sides', _get_sides, calls=nodes_count)
+
+    assert all_sides[-1][0] == ['right', 'center']
+
+
+@pytest.mark.parametrize('nodes_count', NODES_COUNTS)
+def test_bench_names_solve_node_name_by_type(bench, names_api, nodes_count):
+    names, _, dcc_proxy = names_api
+    scenes = list()
+
+    def _setup():
+        scenes.append(_create_scene(nodes_count))
+        dcc_proxy.current = scenes[-1][0]
+
+    def _solve_and_rename():
+        return names.solve_node_name_by_type(scenes[-1][1], side='left', unique_name=True)
+
+    new_names, _ = bench(
+        'names.solve_node_name_by_type', _solve_and_rename, setup=_setup, nodes=nodes_count,
+        naming=_get_naming_name(names))
+
+    assert len(new_names) == nodes_count
+
+
+def _get_naming_name(names):
+    return os.path.basename(names.get_naming_file())
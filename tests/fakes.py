@@ -0,0 +1,348 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains a fake DCC scene that implements the tpDcc.dcc functions used by tpRigToolkit
+"""
+
+import os
+import types
+import collections
+
+
+class FakeDcc(object):
+    """
+    In-memory DCC scene. Nodes are indexed by handle, parent and short name (so it can be used to benchmark scenes
+    with thousands of nodes) and each DCC call is counted
+    """
+
+    SHAPE_TYPES = ('nurbsCurve', 'mesh', 'locator')
+
+    def __init__(self):
+        self.nodes = collections.OrderedDict()
+        self.calls = collections.Counter()
+        self._children = collections.defaultdict(collections.OrderedDict)
+        self._short_names = collections.defaultdict(list)
+
+    def add_node(self, name, node_type, parent=None, message_connections=None):
+        parent_handle = self._find(parent) if parent else None
+        handle = 'UUID-{}'.format(len(self.nodes) + 1)
+        self.nodes[handle] = {
+            'name': name, 'parent': parent_handle, 'type': node_type, 'message': list(message_connections or [])}
+        self._children[parent_handle][name] = handle
+        self._short_names[name].append(handle)
+        return self._get_path(handle)
+
+    def node_handle(self, node_name):
+        self.calls['node_handle'] += 1
+        return self._find(node_name)
+
+    def node_type(self, node_name):
+        self.calls['node_type'] += 1
+        return self.nodes[self._find(node_name)]['type']
+
+    def list_shapes(self, node_name, full_path=True):
+        self.calls['list_shapes'] += 1
+        return [
+            self._get_path(handle) for handle in self._children.get(self._find(node_name), dict()).values()
+            if self.nodes[handle]['type'] in self.SHAPE_TYPES]
+
+    def list_connections(self, node_name, attribute_name):
+        self.calls['list_connections'] += 1
+        return list(self.nodes[self._find(node_name)].get(attribute_name, list()))
+
+    def all_scene_nodes(self, full_path=True):
+        self.calls['all_scene_nodes'] += 1
+        if not full_path:
+            return [node['name'] for node in self.nodes.values()]
+        return [self._get_path(handle) for handle in self.nodes]
+
+    def find_node_by_id(self, unique_id, full_path=True):
+        self.calls['find_node_by_id'] += 1
+        return self._get_path(unique_id) if unique_id in self.nodes else None
+
+    def rename_node(self, node_name, new_name, **kwargs):
+        self.calls['rename_node'] += 1
+        handle = self._find(node_name)
+        node = self.nodes[handle]
+        self._children[node['parent']].pop(node['name'])
+        self._children[node['parent']][new_name] = handle
+        self._short_names[node['name']].remove(handle)
+        self._short_names[new_name].append(handle)
+        node['name'] = new_name
+        return self._get_path(handle)
+
+    def find_unique_name(self, node_name):
+        self.calls['find_unique_name'] += 1
+        unique_name = node_name
+        index = 1
+        while self._short_names.get(unique_name):
+            unique_name = '{}{}'.format(node_name, index)
+            index += 1
+        return unique_name
+
+    def get_mirror_name(self, node_name):
+        self.calls['get_mirror_name'] += 1
+        return node_name
+
+    def selected_nodes(self, full_path=True):
+        self.calls['selected_nodes'] += 1
+        return list()
+
+    def _get_path(self, handle):
+        names = list()
+        while handle:
+            node = self.nodes[handle]
+            names.append(node['name'])
+            handle = node['parent']
+        return '|' + '|'.join(reversed(names))
+
+    def is_maya(self):
+        return False
+
+    def _find(self, node_name):
+        if not node_name:
+            return None
+        if '|' not in node_name:
+            handles = self._short_names.get(node_name)
+            return handles[0] if handles else None
+        handle = None
+        for name in node_name.strip('|').split('|'):
+            handle = self._children.get(handle, dict()).get(name)
+            if handle is None:
+                return None
+        return handle
+
+
+class FakeToken(object):
+    """
+    Naming token with the interface of tpDcc-libs-nameit tokens used by tpRigToolkit
+    """
+
+    def __init__(self, items, default=1):
+        self.default = default
+        self._items = collections.OrderedDict(items)
+
+    def get_items(self):
+        return collections.OrderedDict(self._items)
+
+
+class FakeNameLib(object):
+
+    def __init__(self, tokens=None, naming_file=None):
+        self.naming_file = naming_file
+        self.tokens = dict(tokens or dict())
+
+    def get_token(self, name):
+        return self.tokens.get(name)
+
+
+class FakeProject(object):
+    """
+    Project with the options interface of tpDcc projects. Option queries are counted
+    """
+
+    def __init__(self, options=None, naming_lib=None, option_file=None):
+        self.options = dict(options or dict())
+        self.naming_lib = naming_lib or FakeNameLib()
+        self.option_file = option_file
+        self.calls = collections.Counter()
+
+    def get_option_file(self):
+        self.calls['get_option_file'] += 1
+        return self.option_file
+
+    def has_option(self, name, group=None):
+        self.calls['has_option'] += 1
+        return (name if not group else '{}.{}'.format(group, name)) in self.options
+
+    def get_option(self, name, group=None, default=None):
+        self.calls['get_option'] += 1
+        return self.options.get(name if not group else '{}.{}'.format(group, name), default)
+
+
+class FakeConfig(object):
+    """
+    Configuration with the interface of tpDcc configurations
+    """
+
+    def __init__(self, data=None, path=None):
+        self.data = dict(data or dict())
+        self._path = path
+
+    def get_path(self):
+        return self._path
+
+    def get(self, key, default=None):
+        return self.data.get(key, default)
+
+
+class FakeConfigs(object):
+    """
+    Configurations manager with the interface of tpDcc.managers.configs. The same configurations are returned for all
+    environments and queries are counted
+    """
+
+    def __init__(self, configs=None):
+        self.configs = dict(configs or dict())
+        self.calls = collections.Counter()
+
+    def get_config(self, config_name, environment=None):
+        self.calls['get_config'] += 1
+        return self.configs.get(config_name, None)
+
+    def register_package_configs(self, package_name, config_path, config_extension=None):
+        self.calls['register_package_configs'] += 1
+
+    def register_package_path(self, package_name, module_name, config_path, environment=None, config_extension=None):
+        self.calls['register_package_path'] += 1
+
+
+class FakeDccProxy(object):
+    """
+    Object that forwards DCC calls to the current fake scene, so the scene can be replaced after modules are imported
+    """
+
+    def __init__(self, fake_dcc=None):
+        self.current = fake_dcc or FakeDcc()
+
+    def __getattr__(self, name):
+        return getattr(self.current, name)
+
+
+class FakeFileData(object):
+    """
+    Data file with the interface of tpDcc.core.data file data classes
+    """
+
+    def __init__(self, name=None, path=None):
+        self._name = name
+        self._directory = path
+
+    @staticmethod
+    def get_data_extension():
+        return ''
+
+    def set_directory(self, directory):
+        self._directory = directory
+
+    def get_file(self):
+        return os.path.join(self._directory, '{}.{}'.format(self._name, self.get_data_extension()))
+
+
+def create_tpdcc_modules(dcc, configs, name_lib_class=None):
+    """
+    Returns the fake tpDcc modules needed to initialize tpRigToolkit in headless mode and to import tpRigToolkit names
+    manager and API functions without tpDcc
+    :param dcc: object, object used as tpDcc.dcc
+    :param configs: FakeConfigs
+    :param name_lib_class: type or None, class used as tpDcc NameLib. If None, naming libraries cannot be created
+    :return: dict(str, module)
+    """
+
+    def _force_list(value):
+        if value is None:
+            return list()
+        return list(value) if isinstance(value, (list, tuple, set)) else [value]
+
+    class NameLib(object):
+        def __init__(self, *args, **kwargs):
+            raise NotImplementedError('Naming libraries are not available without tpDcc')
+
+    module_attributes = {
+        'tpDcc': {'dcc': dcc},
+        'tpDcc.core': dict(),
+        'tpDcc.core.dcc': {'get_dcc_loader_module': lambda package_name: None},
+        'tpDcc.core.data': {'FileData': FakeFileData, 'CustomData': type('CustomData', (FakeFileData,), dict())},
+        'tpDcc.core.project': dict(),
+        'tpDcc.core.scripts': {
+            'ScriptManifestData': type('ScriptManifestData', (FakeFileData,), dict()),
+            'ScriptPythonData': type('ScriptPythonData', (FakeFileData,), dict())},
+        'tpDcc.managers': {'configs': configs},
+        'tpDcc.managers.libs': dict(),
+        'tpDcc.libs': dict(),
+        'tpDcc.libs.python': dict(),
+        'tpDcc.libs.python.fileio': dict(),
+        'tpDcc.libs.python.folder': dict(),
+        'tpDcc.libs.python.path': {'clean_path': lambda path: os.path.normpath(path).replace('\\', '/')},
+        'tpDcc.libs.python.python': {'force_list': _force_list},
+        'tpDcc.libs.python.version': dict(),
+        'tpDcc.libs.nameit': dict(),
+        'tpDcc.libs.nameit.core': dict(),
+        'tpDcc.libs.nameit.core.namelib': {'NameLib': name_lib_class or NameLib},
+        'tpDcc.libs.qt': dict(),
+        'tpDcc.libs.qt.widgets': dict(),
+        'tpDcc.libs.qt.widgets.project': dict()
+    }
+
+    return _create_modules(module_attributes)
+
+
+class FakeItem(object):
+    """
+    Library item with the interface of tpDcc library items used by tpRigToolkit data items
+    """
+
+    def __init__(self, path=None, *args, **kwargs):
+        self._path = path
+
+    def path(self):
+        return os.path.dirname(self._path)
+
+    def name(self):
+        return os.path.basename(self._path)
+
+    def load_schema(self):
+        return [{'name': 'name', 'value': self.name()}]
+
+    def show_error_dialog(self, title, text):
+        raise RuntimeError('{}: {}'.format(title, text))
+
+
+def create_data_modules(dcc):
+    """
+    Returns the fake tpDcc and Qt modules needed to import tpRigToolkit data items without a DCC or Qt
+    Widget base classes are empty classes, so data items can be used but their widgets cannot be created
+    :param dcc: object, object used as tpDcc.dcc
+    :return: dict(str, module)
+    """
+
+    def _widget_class(name):
+        return type(name, (object,), dict())
+
+    module_attributes = {
+        'Qt': dict(),
+        'Qt.QtCore': {'QSize': _widget_class('QSize')},
+        'tpDcc': {'dcc': dcc},
+        'tpDcc.core': dict(),
+        'tpDcc.core.data': {'FileData': FakeFileData, 'CustomData': type('CustomData', (FakeFileData,), dict())},
+        'tpDcc.libs': dict(),
+        'tpDcc.libs.python': dict(),
+        'tpDcc.libs.python.path': {'clean_path': lambda path: os.path.normpath(path).replace('\\', '/')},
+        'tpDcc.libs.qt': dict(),
+        'tpDcc.libs.qt.core': dict(),
+        'tpDcc.libs.qt.core.qtutils': dict(),
+        'tpDcc.libs.qt.widgets': dict(),
+        'tpDcc.libs.qt.widgets.buttons': dict(),
+        'tpDcc.libs.qt.widgets.library': dict(),
+        'tpDcc.libs.qt.widgets.library.manager': {'LibraryDataFolder': _widget_class('LibraryDataFolder')},
+        'tpDcc.libs.qt.widgets.library.items': {'BaseItem': FakeItem},
+        'tpDcc.libs.qt.widgets.library.loadwidget': {'LoadWidget': _widget_class('LoadWidget')},
+        'tpDcc.libs.qt.widgets.library.savewidget': {'BaseSaveWidget': _widget_class('BaseSaveWidget')}
+    }
+
+    return _create_modules(module_attributes)
+
+
+def _create_modules(module_attributes):
+    modules = dict()
+    for module_name, attributes in module_attributes.items():
+        module = modules[module_name] = types.ModuleType(module_name)
+        module.__path__ = list()
+        module.__dict__.update(attributes)
+    for module_name, module in modules.items():
+        parent_name, _, child_name = module_name.rpartition('.')
+        if parent_name and not hasattr(modules[parent_name], child_name):
+            setattr(modules[parent_name], child_name, module)
+
+    return modules
@@ -0,0 +1,72 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for tpRigToolkit batch runner
+"""
+
+import json
+import threading
+
+import pytest
+
+from tpRigToolkit.core import batch
+
+
+def _create_export_task(name, file_path, threads):
+    def _prepare():
+        threads.append(('prepare', threading.current_thread()))
+        return {'name': name}
+
+    def _process(data):
+        threads.append(('process', threading.current_thread()))
+        with open(file_path, 'w') as fh:
+            json.dump(data, fh)
+        return file_path
+
+    return batch.BatchTask(name, prepare=_prepare, process=_process)
+
+
+@pytest.mark.parametrize('max_workers', [0, 4])
+def test_batch_runner_confines_prepare_and_finish_to_main_thread(tmp_path, max_workers):
+    threads = list()
+    runner = batch.BatchRunner(max_workers=max_workers)
+    for i in range(8):
+        task = _create_export_task('item{}'.format(i), str(tmp_path / 'item{}.json'.format(i)), threads)
+        task.fns['finish'] = lambda file_path: threads.append(('finish', threading.current_thread())) or file_path
+        runner.add_task(task)
+
+    tasks = runner.run()
+
+    main_thread = threading.current_thread()
+    assert all(task.succeeded for task in tasks)
+    assert [task.result for task in tasks] == [str(tmp_path / 'item{}.json'.format(i)) for i in range(8)]
+    assert all(thread is main_thread for step, thread in threads if step != 'process')
+    process_threads = [thread for step, thread in threads if step == 'process']
+    assert all((thread is main_thread) == (max_workers == 0) for thread in process_threads)
+    assert json.loads((tmp_path / 'item3.json').read_text()) == {'name': 'item3'}
+    assert list(tasks[0].timings) == ['prepare', 'process', 'finish']
+
+
+def test_batch_runner_reports_failures_per_item(tmp_path):
+    calls = list()
+
+    def _fail_prepare():
+        raise RuntimeError('scene error')
+
+    def _fail_process(data):
+        raise IOError('disk error')
+
+    runner = batch.BatchRunner(max_workers=2)
+    runner.add_task(batch.BatchTask('prepare_error', prepare=_fail_prepare, process=calls.append))
+    runner.add_task(batch.BatchTask('process_error', prepare=lambda: 'data', process=_fail_process))
+    runner.add_task(batch.BatchTask('valid', prepare=lambda: 'data', process=lambda data: data.upper()))
+    runner.run()
+
+    report = runner.report()
+    assert calls == []
+    assert [task.name for task in runner.failed_tasks()] == ['prepare_error', 'process_error']
+    assert report['prepare_error']['error_step'] == 'prepare'
+    assert report['process_error']['error'] == 'disk error'
+    assert report['valid']['succeeded'] and runner.tasks()[-1].result == 'DATA'
+    assert 'process' not in report['prepare_error']['timings']
@@ -0,0 +1,73 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for tpRigToolkit caches
+"""
+
+import os
+import stat
+import threading
+
+import pytest
+
+from tpRigToolkit.core import cache
+
+
+def test_lru_cache():
+    lru_cache = cache.LRUCache(capacity=2)
+    lru_cache.put('a', 1)
+    lru_cache.put('b', 2)
+
+    assert lru_cache.get('a') == 1
+    lru_cache.put('c', 3)
+    assert 'b' not in lru_cache
+    assert lru_cache.get('b') is None
+    assert lru_cache.get_or_create('d', lambda: 4) == 4
+    assert lru_cache.get_or_create('d', lambda: 5) == 4
+    assert lru_cache.keys() == ['c', 'd']
+    assert lru_cache.stats() == {'hits': 2, 'misses': 2, 'size': 2, 'capacity': 2}
+
+    lru_cache.set_capacity(1)
+    assert lru_cache.keys() == ['d']
+    lru_cache.clear(reset_stats=True)
+    assert lru_cache.stats() == {'hits': 0, 'misses': 0, 'size': 0, 'capacity': 1}
+
+
+def test_lru_cache_creates_items_outside_of_cache_lock():
+    lru_cache = cache.LRUCache(capacity=4)
+    started_event = threading.Event()
+    release_event = threading.Event()
+    created = list()
+
+    def _slow_create():
+        started_event.set()
+        release_event.wait(5)
+        created.append('slow')
+        return 'slow'
+
+    threads = [threading.Thread(target=lru_cache.get_or_create, args=('slow', _slow_create)) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    assert started_event.wait(5)
+
+    # Other keys can be created while a slow item is being created
+    assert lru_cache.get_or_create('fast', lambda: 'fast') == 'fast'
+
+    release_event.set()
+    for thread in threads:
+        thread.join(5)
+    assert created == ['slow']
+    assert lru_cache.get('slow') == 'slow'
+
+
+@pytest.mark.skipif(os.name == 'nt', reason='File permissions are not supported')
+def test_write_atomic_uses_default_file_permissions(tmp_path):
+    file_path = str(tmp_path / 'cache.json')
+
+    assert cache.write_atomic(file_path, u'{}')
+    assert stat.S_IMODE(os.stat(file_path).st_mode) == cache.get_file_mode(str(tmp_path / 'missing.json'))
+
+    os.chmod(file_path, 0o640)
+    assert cache.write_atomic(file_path, u'[]')
+    assert stat.S_IMODE(os.stat(file_path).st_mode) == 0o640
@@ -0,0 +1,45 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for tpRigToolkit node classifier
+"""
+
+from tpRigToolkit.core import scene, classifier
+
+from tests.test_scene import _create_scene
+
+NODE_NAMES = ['|root', '|root|arm', '|root|arm_control', '|root|mesh', '|curve']
+
+
+def test_classifier_rules():
+    fake_dcc = _create_scene()
+    snapshot = scene.SceneSnapshot(fake_dcc, NODE_NAMES)
+    rules = classifier.DEFAULT_TYPE_RULES + [
+        {'type': 'nurbsCurve', 'result': 'controller'},
+        {'type': 'mesh', 'result': 'geometry'}]
+
+    node_types = classifier.NodeClassifier(rules=rules).classify_nodes(snapshot.nodes())
+
+    assert [node_types[node_info.handle] for node_info in snapshot.nodes()] == [
+        'group', 'joint', 'controller', 'geometry', 'controller']
+
+
+def test_classifier_caches_nodes():
+    fake_dcc = _create_scene()
+    node_classifier = classifier.NodeClassifier()
+
+    snapshot = scene.SceneSnapshot(fake_dcc, NODE_NAMES, classifier=node_classifier)
+    node_types = node_classifier.classify_nodes(snapshot.nodes())
+    calls = dict(fake_dcc.calls)
+
+    snapshot = scene.SceneSnapshot(fake_dcc, NODE_NAMES, classifier=node_classifier)
+    assert node_classifier.classify_nodes(snapshot.nodes()) == node_types
+    # Curve types depend on their message connections, so curves are the only nodes queried again
+    assert fake_dcc.calls['list_shapes'] == calls['list_shapes'] + 2
+    assert fake_dcc.calls['list_connections'] == calls['list_connections'] + 2
+    assert node_classifier.stats()['hits'] == len(NODE_NAMES) - 2
+
+    node_classifier.invalidate()
+    scene.SceneSnapshot(fake_dcc, NODE_NAMES, classifier=node_classifier)
+    assert fake_dcc.calls['list_shapes'] == calls['list_shapes'] * 2 + 2
@@ -0,0 +1,86 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for tpRigToolkit chunked container file format
+"""
+
+import os
+import json
+import stat
+from collections import OrderedDict
+
+import pytest
+
+from tpRigToolkit.core import cache, container
+
+
+def _create_skeleton(nodes_count):
+    return [
+        {'index': i, 'parent_index': i - 1, 'name': 'joint{}'.format(i), 'matrix': [float(i)] * 16}
+        for i in range(nodes_count)]
+
+
+def test_container_reads_only_requested_sections(tmp_path):
+    file_path = str(tmp_path / 'rig.sswitch')
+    document = OrderedDict([('spaces', ['world', 'root']), ('weights', _create_skeleton(5000))])
+    container.write_document(file_path, document, metadata={'author': 'rigger'}, chunk_size=500)
+
+    with container.ContainerReader(file_path) as reader:
+        assert reader.get_section_names() == ['spaces', 'weights']
+        assert reader.metadata['author'] == 'rigger'
+        assert reader.get_section_info('weights')['chunks'] == 10
+        assert reader.read_section('spaces') == ['world', 'root']
+        assert reader.bytes_read < 1024
+        assert next(reader.iter_section('weights'))['name'] == 'joint0'
+        assert reader.bytes_read < reader.get_section_info('weights')['size']
+        with pytest.raises(KeyError):
+            reader.read_section('missing')
+
+    assert container.read_document(file_path) == json.loads(json.dumps(document))
+    assert list(container.read_document(file_path, section_names=['spaces'])) == ['spaces']
+
+
+def test_convert_json_file(tmp_path):
+    json_file = tmp_path / 'skeleton.json'
+    skeleton_data = _create_skeleton(100)
+    json_file.write_text(json.dumps(skeleton_data, indent=4))
+
+    assert container.read_document(str(json_file)) == skeleton_data
+    assert not container.is_container(str(json_file))
+
+    container_file = container.convert_json_file(str(json_file), compress_threshold=0)
+
+    assert container_file == str(json_file)
+    assert container.is_container(container_file)
+    assert container.read_document(container_file) == skeleton_data
+    assert len(json_file.read_bytes()) < len(json.dumps(skeleton_data, indent=4))
+
+
+def test_container_writer_keeps_previous_file_on_error(tmp_path):
+    file_path = tmp_path / 'rig.sswitch'
+    container.write_document(str(file_path), {'spaces': ['world']})
+
+    with pytest.raises(TypeError):
+        with container.ContainerWriter(str(file_path)) as writer:
+            writer.add_section('spaces', [object()])
+
+    assert container.read_document(str(file_path)) == {'spaces': ['world']}
+    assert [path.name for path in tmp_path.iterdir()] == ['rig.sswitch']
+
+
+@pytest.mark.skipif(os.name == 'nt', reason='File modes are not supported in Windows')
+def test_container_writer_file_mode(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache, '_UMASK', 0o022)
+    file_path = str(tmp_path / 'rig.sswitch')
+    container.write_document(file_path, {'spaces': ['world']})
+    assert stat.S_IMODE(os.stat(file_path).st_mode) == 0o644
+
+    # Converted and rewritten files keep the mode of the file they replace
+    json_file = str(tmp_path / 'skeleton.json')
+    with open(json_file, 'w') as fh:
+        json.dump(_create_skeleton(10), fh)
+    os.chmod(json_file, 0o664)
+    container.convert_json_file(json_file)
+    container.write_document(json_file, _create_skeleton(20))
+    assert stat.S_IMODE(os.stat(json_file).st_mode) == 0o664
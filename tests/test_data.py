@@ -0,0 +1,141 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for tpRigToolkit data items batch tasks
+tpDcc and Qt modules are replaced with fakes, so data items can be used without a DCC
+"""
+
+import sys
+import threading
+import importlib
+
+import pytest
+
+from tpRigToolkit.core import batch
+
+from tests.fakes import FakeDcc, FakeFileData, create_data_modules
+
+
+class SplitData(FakeFileData):
+    """
+    Data class that splits its export and import between scene and disk functions
+    """
+
+    threads = list()
+
+    @staticmethod
+    def get_data_extension():
+        return 'split'
+
+    def collect_data(self, objects=None):
+        self.threads.append(('collect_data', threading.current_thread()))
+        return list(objects)
+
+    def write_data(self, data, comment='-', create_version=True):
+        self.threads.append(('write_data', threading.current_thread()))
+        with open(self.get_file(), 'w') as fh:
+            fh.write('\n'.join(data))
+        return self.get_file()
+
+    def read_data(self, file_path=''):
+        self.threads.append(('read_data', threading.current_thread()))
+        with open(file_path or self.get_file()) as fh:
+            return fh.read().split('\n')
+
+    def apply_data(self, data, objects=None):
+        self.threads.append(('apply_data', threading.current_thread()))
+        return [node for node in data if node in objects]
+
+
+class MonolithicData(FakeFileData):
+    """
+    Data class that only implements export_data and import_data functions
+    """
+
+    threads = list()
+
+    @staticmethod
+    def get_data_extension():
+        return 'data'
+
+    def export_data(self, comment='-', create_version=True, objects=None):
+        self.threads.append(('export_data', threading.current_thread()))
+        return self.get_file()
+
+    def import_data(self, file_path='', objects=None):
+        self.threads.append(('import_data', threading.current_thread()))
+        return objects
+
+
+@pytest.fixture
+def data_module():
+    """
+    Imports tpRigToolkit core data module with fake tpDcc and Qt modules
+    """
+
+    fake_modules = create_data_modules(FakeDcc())
+    module_name = 'tpRigToolkit.core.data'
+    previous_modules = dict((name, sys.modules.get(name)) for name in list(fake_modules) + [module_name])
+    sys.modules.update(fake_modules)
+    try:
+        sys.modules.pop(module_name, None)
+        yield importlib.import_module(module_name)
+    finally:
+        for name, module in previous_modules.items():
+            if module is None:
+                sys.modules.pop(name, None)
+            else:
+                sys.modules[name] = module
+        # Modules imported with fake modules are not kept as attributes of their packages
+        core_package = sys.modules['tpRigToolkit.core']
+        if previous_modules[module_name] is None and hasattr(core_package, 'data'):
+            delattr(core_package, 'data')
+
+
+def _create_items(data_module, data_class, directory, count):
+    items = list()
+    for i in range(count):
+        item = data_module.DataItem(str(directory / 'item{}.{}'.format(i, data_class.get_data_extension())))
+        item.set_data_class(data_class)
+        items.append(item)
+    del data_class.threads[:]
+
+    return items
+
+
+def test_split_data_classes_use_worker_threads(data_module, tmp_path):
+    items = _create_items(data_module, SplitData, tmp_path, 3)
+    nodes = ['root', 'spine', 'head']
+
+    export_runner = batch.BatchRunner(max_workers=2)
+    for item in items:
+        export_runner.add_task(item.get_export_task(objects=nodes))
+    export_runner.run()
+    import_runner = batch.BatchRunner(max_workers=2)
+    import_runner.add_task(items[0].get_import_task(objects=nodes[1:]))
+    import_runner.run()
+
+    main_thread = threading.current_thread()
+    assert not export_runner.failed_tasks() and not import_runner.failed_tasks()
+    assert import_runner.tasks()[0].result == nodes[1:]
+    for step, thread in SplitData.threads:
+        assert (thread is main_thread) == (step in ('collect_data', 'apply_data'))
+    assert len([step for step, _ in SplitData.threads if step == 'write_data']) == 3
+
+
+def test_other_data_classes_run_serially_in_main_thread(data_module, tmp_path):
+    items = _create_items(data_module, MonolithicData, tmp_path, 3)
+
+    tasks = [item.get_export_task(objects=['root']) for item in items] + [items[0].get_import_task(objects=['root'])]
+    assert all(task.fns['process'] is None for task in tasks)
+
+    runner = batch.BatchRunner(max_workers=2)
+    for task in tasks:
+        runner.add_task(task)
+    runner.run()
+
+    assert not runner.failed_tasks()
+    assert [step for step, _ in MonolithicData.threads] == ['export_data'] * 3 + ['import_data']
+    assert all(thread is threading.current_thread() for _, thread in MonolithicData.threads)
+    assert runner.tasks()[-1].result == ['root']
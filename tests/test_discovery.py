@@ -0,0 +1,101 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for tpRigToolkit cached class discovery
+"""
+
+import os
+import sys
+
+from tpRigToolkit.core import discovery
+
+
+class BaseData(object):
+    pass
+
+
+DATA_MODULE = u'''
+from tests.test_discovery import BaseData
+
+
+class {name}(BaseData):
+    pass
+'''
+
+UTILS_MODULE = u'''
+IMPORTS = []
+
+
+class Helper(object):
+    pass
+'''
+
+
+def _create_data_directory(tmp_path):
+    data_path = tmp_path / 'data_modules'
+    (data_path / 'rigdata').mkdir(parents=True)
+    (data_path / 'skindata.py').write_text(DATA_MODULE.format(name='SkinData'))
+    (data_path / 'helpers.py').write_text(UTILS_MODULE)
+    (data_path / 'rigdata' / '__init__.py').write_text(u'')
+    (data_path / 'rigdata' / 'controlsdata.py').write_text(DATA_MODULE.format(name='ControlsData'))
+    return str(data_path)
+
+
+def test_may_define_subclasses(tmp_path):
+    data_path = _create_data_directory(tmp_path)
+
+    assert discovery.may_define_subclasses(os.path.join(data_path, 'skindata.py'))
+    assert not discovery.may_define_subclasses(os.path.join(data_path, 'helpers.py'))
+    assert [module_info.mod_name for module_info in discovery.iter_modules(data_path)] == [
+        'helpers', 'rigdata', 'rigdata.controlsdata', 'skindata']
+
+
+def test_class_discovery(tmp_path):
+    data_path = _create_data_directory(tmp_path)
+    cache_directory = str(tmp_path / 'cache')
+    try:
+        class_discovery = discovery.ClassDiscovery('test', BaseData, cache_directory=cache_directory)
+        found_classes = class_discovery.load_classes(data_path)
+        assert sorted(found_class.__name__ for found_class in found_classes) == ['ControlsData', 'SkinData']
+        assert (class_discovery.imported, class_discovery.skipped) == (3, 1)
+
+        # Unchanged modules are not imported again
+        assert class_discovery.load_classes(data_path) == found_classes
+        assert class_discovery.imported == 3
+
+        # New sessions only import modules that provide classes
+        new_discovery = discovery.ClassDiscovery('test', BaseData, cache_directory=cache_directory)
+        assert new_discovery.load_classes(data_path) == found_classes
+        assert (new_discovery.imported, new_discovery.skipped) == (3, 1)
+
+        skin_file = os.path.join(data_path, 'skindata.py')
+        with open(skin_file, 'w') as fh:
+            fh.write(DATA_MODULE.format(name='SkinWeightsData'))
+        os.utime(skin_file, (1, 1))
+        found_classes = class_discovery.load_classes(data_path)
+        assert sorted(found_class.__name__ for found_class in found_classes) == ['ControlsData', 'SkinWeightsData']
+        assert class_discovery.imported == 4
+    finally:
+        for mod_name in ('skindata', 'rigdata', 'rigdata.controlsdata'):
+            sys.modules.pop(mod_name, None)
+
+
+def test_class_discovery_imports_packages(tmp_path):
+    data_path = tmp_path / 'package_modules'
+    (data_path / 'spacedata').mkdir(parents=True)
+    (data_path / 'spacedata' / '__init__.py').write_text(u'')
+    (data_path / 'spacedata' / 'helper.py').write_text(UTILS_MODULE)
+    (data_path / 'spacedata' / 'spaces.py').write_text(
+        u'from . import helper\n' + DATA_MODULE.format(name='SpacesData'))
+    try:
+        # Second session uses the package entry stored in the disk cache
+        for _ in range(2):
+            class_discovery = discovery.ClassDiscovery('test', BaseData, cache_directory=str(tmp_path / 'cache'))
+            found_classes = class_discovery.load_classes(str(data_path))
+            assert [found_class.__name__ for found_class in found_classes] == ['SpacesData']
+            for mod_name in ('spacedata', 'spacedata.helper', 'spacedata.spaces'):
+                sys.modules.pop(mod_name, None)
+    finally:
+        for mod_name in ('spacedata', 'spacedata.helper', 'spacedata.spaces'):
+            sys.modules.pop(mod_name, None)
@@ -0,0 +1,127 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains import audit tests for tpRigToolkit headless initialization
+"""
+
+import os
+import ast
+import sys
+import subprocess
+
+import pytest
+
+import tpRigToolkit
+
+PACKAGE_PATH = os.path.dirname(os.path.abspath(tpRigToolkit.__file__))
+
+# Modules imported when tpRigToolkit is initialized in headless mode
+HEADLESS_MODULES = [
+    'loader.py',
+    'core/batch.py',
+    'core/cache.py',
+    'core/classifier.py',
+    'core/container.py',
+    'core/discovery.py',
+    'core/indexer.py',
+    'core/lazytools.py',
+    'core/logs.py',
+    'core/manifest.py',
+    'core/mirror.py',
+    'core/naming.py',
+    'core/objectstore.py',
+    'core/registry.py',
+    'core/scene.py',
+    'core/settingsstore.py',
+    'core/sides.py',
+    'core/snapshots.py',
+    'core/startup.py',
+    'core/utils.py',
+    'managers/names.py',
+    'managers/scripts.py'
+]
+
+# Modules that cannot be imported in headless mode (Qt bindings and Qt dependent tpDcc modules)
+QT_MODULES = [
+    'Qt', 'PySide', 'PySide2', 'PySide6', 'PyQt4', 'PyQt5', 'shiboken', 'shiboken2',
+    'tpDcc.libs.qt', 'tpDcc.loader', 'tpDcc.managers.resources', 'tpDcc.managers.tools', 'tpDcc.managers.menus'
+]
+
+
+def _is_qt_module(module_name):
+    return any(module_name == qt_module or module_name.startswith(qt_module + '.') for qt_module in QT_MODULES)
+
+
+def _get_module_level_imports(file_path):
+    with open(file_path, 'r') as fh:
+        tree = ast.parse(fh.read(), filename=file_path)
+
+    imported = list()
+    nodes = list(tree.body)
+    while nodes:
+        node = nodes.pop()
+        if isinstance(node, (ast.FunctionDef, ast.ClassDef)):
+            continue
+        if isinstance(node, ast.Import):
+            imported.extend(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module:
+            imported.extend([node.module] + ['{}.{}'.format(node.module, alias.name) for alias in node.names])
+        else:
+            nodes.extend(ast.iter_child_nodes(node))
+
+    return imported
+
+
+@pytest.mark.parametrize('module_path', HEADLESS_MODULES)
+def test_headless_modules_do_not_import_qt(module_path):
+    imported = _get_module_level_imports(os.path.join(PACKAGE_PATH, module_path))
+
+    assert [module_name for module_name in imported if _is_qt_module(module_name)] == []
+
+
+def test_headless_init_does_not_import_qt(tmp_path):
+    """
+    Initializes tpRigToolkit in headless mode in a new process, with fake tpDcc modules, and checks that no Qt module
+    is imported, whatever the module that imports it
+    """
+
+    config_path = tmp_path / 'config'
+    config_path.mkdir()
+    (config_path / '__init__.py').write_text(u'')
+    naming_file = tmp_path / 'naming.yml'
+    naming_file.write_text(u'')
+    modules_file = tmp_path / 'modules.txt'
+
+    script = '\n'.join([
+        'import sys',
+        'import types',
+        'from tests import fakes',
+        'naming_file, config_file, modules_file = sys.argv[1:]',
+        'configs = fakes.FakeConfigs({',
+        '    "tpRigToolkit-core": fakes.FakeConfig({"tools": ["renamer"], "libs": []}),',
+        '    "tpRigToolkit-names": fakes.FakeConfig(path=naming_file)})',
+        'modules = fakes.create_tpdcc_modules(fakes.FakeDcc(), configs, name_lib_class=fakes.FakeNameLib)',
+        '# Qt dependent fake modules are not installed, so importing them fails',
+        'for name, module in modules.items():',
+        '    if not name.startswith("tpDcc.libs.qt"):',
+        '        sys.modules[name] = module',
+        'config = sys.modules["tpRigToolkit.config"] = types.ModuleType("tpRigToolkit.config")',
+        'config.__file__ = config_file',
+        'import tpRigToolkit',
+        'tpRigToolkit.config = config',
+        'import tpRigToolkit.loader',
+        'assert tpRigToolkit.loader.init_headless()["tools"] == ["renamer"]',
+        'with open(modules_file, "w") as fh:',
+        '    fh.write("\\n".join(sorted(sys.modules)))'
+    ])
+    env = dict(
+        os.environ, HOME=str(tmp_path), USERPROFILE=str(tmp_path), TPRIGTOOLKIT_CACHE_PATH=str(tmp_path / 'cache'),
+        PYTHONPATH=os.pathsep.join([os.path.dirname(PACKAGE_PATH), os.environ.get('PYTHONPATH', '')]))
+    subprocess.check_call(
+        [sys.executable, '-c', script, str(naming_file), str(config_path / '__init__.py'), str(modules_file)],
+        env=env, cwd=os.path.dirname(PACKAGE_PATH))
+
+    imported = modules_file.read_text().split()
+    assert 'tpRigToolkit.managers.names' in imported
+    assert [module_name for module_name in imported if _is_qt_module(module_name)] == []
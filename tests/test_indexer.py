@@ -0,0 +1,79 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for tpRigToolkit background indexer
+"""
+
+import os
+import threading
+
+from tpRigToolkit.core import indexer
+
+
+def _list_modules(directory):
+    return sorted(file_name for file_name in os.listdir(directory) if file_name.endswith('.py'))
+
+
+def _create_directories(tmp_path):
+    directories = list()
+    for i in range(3):
+        directory = tmp_path / 'data{}'.format(i)
+        directory.mkdir()
+        (directory / 'module{}.py'.format(i)).write_text(u'')
+        directories.append(str(directory))
+    return directories
+
+
+def test_background_indexer_publishes_partial_results(tmp_path):
+    directories = _create_directories(tmp_path)
+    published = list()
+    release_event = threading.Event()
+
+    def _index(directory):
+        if directory == directories[-1]:
+            release_event.wait(5)
+        return _list_modules(directory)
+
+    background_indexer = indexer.BackgroundIndexer(
+        _index, directories=directories, on_indexed=lambda directory, result: published.append(directory),
+        extensions=('.py',), poll_interval=0)
+    background_indexer.start()
+    try:
+        assert not background_indexer.wait(0.2)
+        assert background_indexer.is_indexing()
+        assert published == directories[:2]
+        assert list(background_indexer.results().keys()) == directories[:2]
+
+        release_event.set()
+        assert background_indexer.wait(5)
+        assert list(background_indexer.results().values()) == [['module0.py'], ['module1.py'], ['module2.py']]
+    finally:
+        background_indexer.stop(5)
+    assert not background_indexer.is_running()
+
+
+def test_indexer_updates_modified_directories(tmp_path):
+    directories = _create_directories(tmp_path)
+    indexed = list()
+
+    def _index(directory):
+        indexed.append(directory)
+        return _list_modules(directory)
+
+    directory_indexer = indexer.BackgroundIndexer(_index, directories=directories, extensions=('.py',))
+    directory_indexer.index_pending()
+    assert indexed == directories
+    assert not directory_indexer.check_changes()
+
+    (tmp_path / 'data1' / 'new_module.py').write_text(u'')
+    os.utime(directories[1], (1, 1))
+    assert directory_indexer.check_changes() == [directories[1]]
+    directory_indexer.index_pending()
+    assert indexed == directories + [directories[1]]
+    assert directory_indexer.results()[directories[1]] == ['module1.py', 'new_module.py']
+
+    directory_indexer.add_directories(directories[:1] + [str(tmp_path)])
+    directory_indexer.index_pending()
+    assert indexed[-1] == str(tmp_path)
+    assert not directory_indexer.is_indexing()
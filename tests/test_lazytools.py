@@ -0,0 +1,59 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for tpRigToolkit lazy tools loading
+"""
+
+from tpRigToolkit.core import lazytools
+
+
+class FakeToolsManager(object):
+    def __init__(self):
+        self.launched = list()
+
+    def launch_tool_by_id(self, tool_id, **kwargs):
+        self.launched.append(tool_id)
+        return tool_id
+
+
+def _create_registry(loaded, fail=()):
+    def _load(tool_names):
+        for tool_name in tool_names:
+            if tool_name in fail:
+                raise ImportError('No module named {}'.format(tool_name))
+            loaded.append(tool_name)
+
+    registry = lazytools.LazyToolsRegistry(_load)
+    for tool_name in ('renamer', 'broken'):
+        registry.register_stub(lazytools.ToolStub('tpRigToolkit-tools-{}'.format(tool_name), tool_name))
+
+    return registry
+
+
+def test_launch_loads_tool_once():
+    loaded = list()
+    registry = _create_registry(loaded)
+    tools_manager = FakeToolsManager()
+    registry.install(tools_manager)
+
+    assert tools_manager.launch_tool_by_id('tpRigToolkit-tools-renamer') == 'tpRigToolkit-tools-renamer'
+    assert tools_manager.launch_tool_by_id('renamer') == 'renamer'
+    assert loaded == ['renamer']
+    assert registry.is_loaded('tpRigToolkit-tools-renamer')
+    assert not registry.is_loaded('broken')
+
+
+def test_tools_that_fail_to_load_are_not_launched():
+    loaded = list()
+    registry = _create_registry(loaded, fail=('broken',))
+    tools_manager = FakeToolsManager()
+    registry.install(tools_manager)
+
+    assert tools_manager.launch_tool_by_id('tpRigToolkit-tools-broken') is None
+    assert tools_manager.launched == []
+    assert not registry.is_loaded('broken')
+
+    # Tools without stubs are launched without loading them
+    assert tools_manager.launch_tool_by_id('tpDcc-tools-other') == 'tpDcc-tools-other'
+    assert loaded == []
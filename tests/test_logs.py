@@ -0,0 +1,100 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for tpRigToolkit asynchronous logging
+"""
+
+import gc
+import weakref
+import logging
+import logging.handlers
+
+from tpRigToolkit.core import logs
+
+
+def _create_logger(name, handler):
+    logger = logging.getLogger(name)
+    logger.propagate = False
+    logger.setLevel(logging.DEBUG)
+    logger.addHandler(handler)
+    return logger
+
+
+def test_async_file_handler_writes_all_lines(tmp_path):
+    log_file = tmp_path / 'logs' / 'test.log'
+    handler = logs.AsyncFileHandler(str(log_file), batch_size=16)
+    logger = _create_logger('tpRigToolkit-test-async', handler)
+    try:
+        for i in range(500):
+            logger.info('line %d', i)
+        handler.flush()
+        assert log_file.read_text().splitlines() == ['line {}'.format(i) for i in range(500)]
+    finally:
+        logger.removeHandler(handler)
+        handler.close()
+
+
+def test_async_file_handler_rotates_files(tmp_path):
+    log_file = tmp_path / 'test.log'
+    handler = logs.AsyncFileHandler(str(log_file), mode='w', max_bytes=200, backup_count=2, batch_size=1)
+    logger = _create_logger('tpRigToolkit-test-rotate', handler)
+    try:
+        for i in range(100):
+            logger.info('line %03d', i)
+        handler.close()
+        assert log_file.stat().st_size <= 200
+        assert (tmp_path / 'test.log.1').exists()
+        assert (tmp_path / 'test.log.2').exists()
+        assert not (tmp_path / 'test.log.3').exists()
+        assert log_file.read_text().splitlines()[-1] == 'line 099'
+    finally:
+        logger.removeHandler(handler)
+
+
+def test_async_file_handler_rotates_files_by_encoded_size(tmp_path):
+    log_file = tmp_path / 'test.log'
+    handler = logs.AsyncFileHandler(str(log_file), mode='w', max_bytes=200, backup_count=1, batch_size=1)
+    logger = _create_logger('tpRigToolkit-test-rotate-encoded', handler)
+    try:
+        for _ in range(50):
+            logger.info(u'\u00ed' * 20)
+        handler.close()
+        assert log_file.stat().st_size <= 200
+        assert (tmp_path / 'test.log.1').stat().st_size <= 200
+    finally:
+        logger.removeHandler(handler)
+
+
+def test_closed_async_file_handlers_are_not_kept_alive(tmp_path):
+    handler = logs.AsyncFileHandler(str(tmp_path / 'test.log'))
+    assert handler in logs._HANDLERS
+    handler_ref = weakref.ref(handler)
+    handler.close()
+    del handler
+    gc.collect()
+
+    assert handler_ref() is None
+
+
+def test_make_file_handlers_async(tmp_path):
+    formatter = logging.Formatter('%(levelname)s %(message)s')
+    file_handler = logging.handlers.RotatingFileHandler(str(tmp_path / 'test.log'), 'w', 1000, 3)
+    file_handler.setFormatter(formatter)
+    file_handler.setLevel(logging.WARNING)
+    stream_handler = logging.StreamHandler()
+    logger = _create_logger('tpRigToolkit-test-replace', file_handler)
+    logger.addHandler(stream_handler)
+    try:
+        async_handlers = logs.make_file_handlers_async(logger)
+        assert len(async_handlers) == 1
+        assert stream_handler in logger.handlers and file_handler not in logger.handlers
+        assert async_handlers[0].max_bytes == 1000 and async_handlers[0].backup_count == 3
+        logger.info('ignored')
+        logger.warning('kept')
+        async_handlers[0].flush()
+        assert (tmp_path / 'test.log').read_text().splitlines() == ['WARNING kept']
+    finally:
+        for handler in list(logger.handlers):
+            logger.removeHandler(handler)
+            handler.close()
@@ -0,0 +1,80 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for tpRigToolkit startup manifest
+"""
+
+import os
+import fnmatch
+
+from tpRigToolkit.core import manifest
+
+
+def test_manifest_is_invalidated_when_configs_change(tmp_path):
+    config_path = tmp_path / 'config'
+    (config_path / 'production').mkdir(parents=True)
+    config_file = config_path / 'production' / 'tpRigToolkit-core.yml'
+    config_file.write_text(u'tools: [renamer]')
+
+    startup_manifest = manifest.StartupManifest(cache_directory=str(tmp_path / 'cache'))
+    fingerprint = startup_manifest.get_fingerprint([str(config_path)], versions=['1.0.0'])
+    startup_manifest.save(fingerprint, {'tools': ['renamer']})
+
+    assert startup_manifest.load(fingerprint) == {'tools': ['renamer']}
+    assert startup_manifest.get_fingerprint([str(config_path)], versions=['1.0.1']) != fingerprint
+
+    config_file.write_text(u'tools: [renamer, scripteditor]')
+    os.utime(str(config_file), (0, 0))
+    new_fingerprint = startup_manifest.get_fingerprint([str(config_path)], versions=['1.0.0'])
+    assert new_fingerprint != fingerprint
+    assert startup_manifest.load(new_fingerprint) is None
+
+
+def _get_registered_config_modules(config_path, config_extension='.yml'):
+    """
+    Returns the configuration modules tpDcc register_package_configs function registers for the given path
+    """
+
+    try:
+        from tpDcc.managers import configs
+    except ImportError:
+        configs = None
+
+    registered = dict()
+    if configs is None:
+        # Same algorithm as tpDcc register_package_configs: base names of all the files found recursively
+        for environment in ('development', 'production'):
+            for _, _, file_names in os.walk(config_path):
+                for file_name in fnmatch.filter(file_names, '*{}'.format(config_extension)):
+                    registered.setdefault(environment, list()).append(os.path.splitext(file_name)[0])
+        return registered
+
+    def _register_package_path(package_name, config_path, module_name, environment, config_extension):
+        registered.setdefault(environment, list()).append(module_name)
+
+    register_package_path = configs.register_package_path
+    configs.register_package_path = _register_package_path
+    try:
+        configs.register_package_configs('tpRigToolkit', config_path)
+    finally:
+        configs.register_package_path = register_package_path
+
+    return registered
+
+
+def test_get_config_modules(tmp_path):
+    (tmp_path / 'development' / 'sub').mkdir(parents=True)
+    (tmp_path / 'production').mkdir()
+    (tmp_path / 'development' / 'tpRigToolkit-core.yml').write_text(u'')
+    (tmp_path / 'development' / 'sub' / 'tpRigToolkit-names.yml').write_text(u'')
+    (tmp_path / 'production' / 'tpRigToolkit-core.yml').write_text(u'')
+    (tmp_path / 'development' / 'notes.txt').write_text(u'')
+
+    config_modules = manifest.get_config_modules(str(tmp_path))
+
+    assert config_modules == _get_registered_config_modules(str(tmp_path))
+    assert sorted(config_modules['production']) == sorted(
+        ['tpRigToolkit-core', 'tpRigToolkit-names', 'tpRigToolkit-core'])
+    assert config_modules['development'] == config_modules['production']
+    assert manifest.get_config_modules(str(tmp_path / 'missing')) == dict()
@@ -0,0 +1,54 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for tpRigToolkit mirror name engine
+"""
+
+from tpRigToolkit.core import naming, sides, mirror
+
+from tests.test_naming import NAMING_DATA
+
+
+def _get_engine(rule_name='default'):
+    side_table = sides.SideTable.from_project(None)
+    return mirror.MirrorEngine(side_table, rule=naming.CompiledNaming(NAMING_DATA).get_rule(rule_name))
+
+
+def test_get_mirror_name():
+    engine = _get_engine()
+
+    assert engine.get_mirror_name('l_arm_jnt') == 'r_arm_jnt'
+    assert engine.get_mirror_name('R_arm_jnt') == 'L_arm_jnt'
+    assert engine.get_mirror_name('left_arm_jnt') == 'right_arm_jnt'
+    assert engine.get_mirror_name('Left_armLeft_jnt') == 'Right_armRight_jnt'
+    assert engine.get_mirror_name('c_armLeft_jnt') == 'c_armRight_jnt'
+    assert engine.get_mirror_name('c_arm_jnt') is None
+    assert engine.get_mirror_name('|l_arm_grp|l_arm_jnt') == '|r_arm_grp|r_arm_jnt'
+
+
+def test_get_mirror_name_uses_rule_side_field():
+    engine = _get_engine('node')
+
+    # Rule side field is checked first, so the description is not mirrored even if it matches a side
+    assert engine.get_mirror_name('l_r_jnt') == 'l_l_jnt'
+    assert engine.get_mirror_name('arm_c_l') == 'arm_c_r'
+
+
+def test_get_mirror_names():
+    engine = _get_engine()
+
+    mirror_names, unmirrored_names = engine.get_mirror_names(['l_arm_jnt', 'c_spine_jnt', 'r_leg_jnt', 'l_arm_jnt'])
+
+    assert list(mirror_names.items()) == [('l_arm_jnt', 'r_arm_jnt'), ('r_leg_jnt', 'l_leg_jnt')]
+    assert unmirrored_names == ['c_spine_jnt']
+
+
+def test_get_mirror_names_with_mixed_rules():
+    compiled_naming = naming.CompiledNaming(NAMING_DATA)
+    engine = mirror.MirrorEngine(sides.SideTable.from_project(None), parse_index=compiled_naming.get_parse_index())
+
+    mirror_names, unmirrored_names = engine.get_mirror_names(['l_arm_jnt', 'arm_l_jnt', 'l_arm_001_jnt', 'l_r_jnt'])
+
+    assert list(mirror_names.values()) == ['r_arm_jnt', 'arm_r_jnt', 'r_arm_001_jnt', 'r_r_jnt']
+    assert not unmirrored_names
@@ -0,0 +1,215 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for tpRigToolkit compiled naming rules
+"""
+
+import os
+import json
+import copy
+from concurrent import futures
+
+import yaml
+import pytest
+
+from tpRigToolkit.core import naming
+
+NAMING_DATA = {
+    'rules': [
+        {'name': 'default', 'expression': '{side}_{description}_{node_type}', 'auto_fix': True,
+         'iterator_format': '#'},
+        {'name': 'node', 'expression': '{description}_{side}_{node_type}', 'auto_fix': False,
+         'iterator_format': '#'},
+        {'name': 'joint', 'expression': '{side}_{description}_{index}_{node_type}', 'auto_fix': True,
+         'iterator_format': '###'},
+        {'name': 'invalid', 'expression': '{side}_{unknown}', 'auto_fix': True, 'iterator_format': '#'}
+    ],
+    'tokens': [
+        {'name': 'side', 'default': 3, 'values': {'key': ['left', 'right', 'center'], 'value': ['l', 'r', 'c']}},
+        {'name': 'description', 'default': 0, 'values': {'key': [], 'value': []}},
+        {'name': 'index', 'default': 1, 'values': {'key': ['iterator'], 'value': ['#']}},
+        {'name': 'node_type', 'default': 1, 'values': {
+            'key': ['joint', 'group', 'controller'], 'value': ['jnt', 'grp', 'ctrl']}}
+    ]
+}
+
+
+@pytest.fixture
+def compiled_naming():
+    return naming.CompiledNaming(NAMING_DATA)
+
+
+def _write_naming_file(file_path, sides=('l', 'r', 'c')):
+    naming_data = copy.deepcopy(NAMING_DATA)
+    naming_data['tokens'][0]['values']['value'] = list(sides)
+    file_path.write_text(yaml.safe_dump(naming_data))
+    return str(file_path)
+
+
+def test_solve(compiled_naming):
+    rule = compiled_naming.get_rule('default')
+
+    assert rule.solve('arm') == 'c_arm_jnt'
+    assert rule.solve('arm', side='left', node_type='controller') == 'l_arm_ctrl'
+    assert rule.solve(description='arm', side='r', node_type='grp') == 'r_arm_grp'
+    assert rule.solve(side='left', node_type='group') == 'l_grp'
+    assert compiled_naming.get_rule('node').solve(side='left', node_type='group') == 'None_l_grp'
+    assert compiled_naming.get_rule('joint').solve('arm', side='left', index=2) == 'l_arm_002_jnt'
+    assert compiled_naming.get_rule('invalid').solve('arm') is None
+
+
+def test_parse(compiled_naming):
+    rule = compiled_naming.get_rule('joint')
+
+    assert dict(rule.parse('l_arm_002_jnt')) == {'side': 'l', 'description': 'arm', 'index': '002', 'node_type': 'jnt'}
+    assert dict(rule.parse('l_arm_002_jnt', get_keys=True)) == {
+        'side': 'left', 'description': 'arm', 'index': '#', 'node_type': 'joint'}
+    assert dict(rule.parse('x_arm')) == {'side': None, 'description': 'arm', 'index': None, 'node_type': None}
+    with pytest.raises(ValueError):
+        compiled_naming.get_rule('invalid').parse('l_arm')
+
+
+def test_compiled_naming_matches_name_lib(tmp_path):
+    namelib = pytest.importorskip('tpDcc.libs.nameit.core.namelib')
+
+    naming_file = tmp_path / 'naming.yml'
+    naming_file.write_text(yaml.safe_dump(NAMING_DATA))
+    name_lib = namelib.NameLib(naming_file=str(naming_file))
+    compiled_naming = naming.CompiledNaming.from_name_lib(name_lib)
+
+    calls = [(('arm',), {}), (('arm',), {'side': 'left', 'node_type': 'controller'}), ((), {'side': 'right'}),
+             (('spine',), {'index': 3})]
+    for rule_name in ('default', 'node', 'joint'):
+        name_lib.set_active_rule(rule_name)
+        rule = compiled_naming.get_rule(rule_name)
+        for args, kwargs in calls:
+            solved_name = name_lib.solve(*args, **kwargs)
+            assert rule.solve(*args, **kwargs) == solved_name
+            assert rule.parse(solved_name) == name_lib.parse(solved_name)
+
+
+def test_unique_names():
+    unique_names = naming.UniqueNames(['|root|l_arm_jnt', 'l_arm_jnt1', 'c_spine_jnt', 'c_spine_jnt01'])
+
+    assert unique_names.get_unique_name('r_arm_jnt') == 'r_arm_jnt'
+    assert unique_names.get_unique_name('r_arm_jnt') == 'r_arm_jnt1'
+    assert unique_names.get_unique_name('l_arm_jnt') == 'l_arm_jnt2'
+    assert unique_names.get_unique_name('c_spine_jnt01') == 'c_spine_jnt02'
+    assert unique_names.get_unique_name('l_arm_jnt', add=False) == 'l_arm_jnt3'
+    assert 'l_arm_jnt3' not in unique_names
+
+
+def test_solve_and_parse_names(compiled_naming):
+    rule = compiled_naming.get_rule('default')
+    records = {'description': ['arm', 'arm', None], 'side': 'left', 'node_type': ['joint', 'joint', 'ctrl']}
+
+    solved_names = naming.solve_names(
+        rule, records, auto_suffixes={'ctrl': 'controller'}, unique_names=naming.UniqueNames(), default='node')
+
+    assert solved_names == ['l_arm_jnt', 'l_arm_jnt1', 'l_ctrl']
+    assert naming.solve_names(rule, [{'description': 'leg'}]) == ['c_leg_jnt']
+    assert [dict(parsed) for parsed in naming.parse_names(rule, solved_names[:1])] == [
+        {'side': 'l', 'description': 'arm', 'node_type': 'jnt'}]
+
+
+def test_parse_index(compiled_naming):
+    parse_index = compiled_naming.get_parse_index()
+
+    assert parse_index.match('l_arm_jnt').name == 'default'
+    assert parse_index.match('arm_l_jnt').name == 'node'
+    assert parse_index.match('l_arm_002_jnt').name == 'joint'
+    assert parse_index.match('l_r_jnt').name == 'default'
+    assert parse_index.match('l_arm_x') is None
+    assert parse_index.match('arm') is None
+    assert parse_index.parse('l_arm_x') == (None, None)
+
+    rule, parsed_name = parse_index.parse('r_leg_003_jnt', get_keys=True)
+    assert rule is compiled_naming.get_rule('joint')
+    assert dict(parsed_name) == {'side': 'right', 'description': 'leg', 'index': '#', 'node_type': 'joint'}
+    assert compiled_naming.get_parse_index() is parse_index
+
+
+def test_naming_engine_reloads_modified_files(tmp_path):
+    naming_file = _write_naming_file(tmp_path / 'naming.yml')
+    engine = naming.NamingEngine()
+
+    compiled_naming = engine.get_naming(naming_file)
+    assert engine.get_naming(naming_file) is compiled_naming
+    assert engine.solve(naming_file, 'default', 'arm', side='left') == 'l_arm_jnt'
+
+    _write_naming_file(tmp_path / 'naming.yml', sides=('L', 'R', 'C'))
+    os.utime(naming_file, (0, 0))
+    assert engine.get_naming(naming_file) is not compiled_naming
+    assert engine.solve(naming_file, 'default', 'arm', side='left') == 'L_arm_jnt'
+    assert engine.solve(naming_file, 'missing', 'arm') is None
+    assert engine.stats()['naming'] == {'hits': 4, 'misses': 2, 'size': 1, 'capacity': 8}
+
+
+def test_naming_disk_cache(tmp_path, monkeypatch):
+    naming_file = _write_naming_file(tmp_path / 'naming.yml')
+    cache_directory = str(tmp_path / 'cache')
+
+    assert naming.read_naming_data(naming_file, cache_directory=cache_directory) == NAMING_DATA
+    with open(naming.get_naming_cache_file(naming_file, cache_directory)) as fh:
+        assert json.load(fh)['data'] == NAMING_DATA
+
+    # Cached data is used while naming file contents do not change, even if naming file is touched
+    os.utime(naming_file, (0, 0))
+    monkeypatch.setattr(yaml, 'safe_load', lambda contents: pytest.fail('Naming file parsed again'))
+    engine = naming.NamingEngine(cache_directory=cache_directory)
+    assert engine.solve(naming_file, 'default', 'arm', side='left') == 'l_arm_jnt'
+    monkeypatch.undo()
+
+    _write_naming_file(tmp_path / 'naming.yml', sides=('L', 'R', 'C'))
+    assert naming.read_naming_data(naming_file, cache_directory=cache_directory)['tokens'][0]['values']['value'] == [
+        'L', 'R', 'C']
+
+    (tmp_path / 'cache' / os.path.basename(naming.get_naming_cache_file(naming_file, cache_directory))).write_text(
+        u'invalid')
+    assert naming.read_naming_data(naming_file, cache_directory=cache_directory)['rules'] == NAMING_DATA['rules']
+
+
+def test_naming_data_not_stored_by_json_is_not_cached(tmp_path):
+    naming_file = tmp_path / 'naming.yml'
+    naming_file.write_text(u'rules:\n  1: index\n')
+    cache_directory = str(tmp_path / 'cache')
+
+    assert naming.read_naming_data(str(naming_file), cache_directory=cache_directory) == {'rules': {1: 'index'}}
+    assert not os.path.isfile(naming.get_naming_cache_file(str(naming_file), cache_directory))
+
+
+def test_naming_engine_lru(tmp_path):
+    naming_files = [_write_naming_file(tmp_path / 'naming{}.yml'.format(i)) for i in range(3)]
+    engine = naming.NamingEngine(name_lib_factory=lambda naming_file: object(), capacity=2)
+
+    for naming_file in naming_files + naming_files[-1:]:
+        engine.get_naming(naming_file)
+    name_lib = engine.get_name_lib(naming_files[0])
+    assert engine.get_name_lib(os.path.join(str(tmp_path), '.', 'naming0.yml')) is name_lib
+
+    assert engine.stats() == {
+        'naming': {'hits': 1, 'misses': 3, 'size': 2, 'capacity': 2},
+        'name_libs': {'hits': 1, 'misses': 1, 'size': 1, 'capacity': 2}}
+
+
+def test_naming_engine_is_thread_safe(tmp_path):
+    naming_files = [
+        _write_naming_file(tmp_path / 'lower.yml'), _write_naming_file(tmp_path / 'upper.yml', sides=('L', 'R', 'C'))]
+    calls = list()
+    for i in range(2000):
+        rule_name = ('default', 'node', 'joint')[i % 3]
+        calls.append((naming_files[i % 2], rule_name, 'part{}'.format(i), ('left', 'right', 'center')[i % 3], i))
+
+    def _solve(engine, call):
+        naming_file, rule_name, description, side, index = call
+        solved_name = engine.solve(naming_file, rule_name, description, side=side, index=index)
+        return solved_name, dict(engine.parse(naming_file, rule_name, solved_name))
+
+    serial_engine = naming.NamingEngine()
+    expected = [_solve(serial_engine, call) for call in calls]
+    engine = naming.NamingEngine()
+    with futures.ThreadPoolExecutor(max_workers=16) as executor:
+        results = list(executor.map(lambda call: _solve(engine, call), calls))
+
+    assert results == expected
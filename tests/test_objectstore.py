@@ -0,0 +1,181 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for tpRigToolkit content addressed object store
+"""
+
+import os
+import stat
+import threading
+
+import pytest
+
+from tpRigToolkit.core import cache, objectstore
+
+
+def _create_data_folder(directory, weights=u'weights'):
+    (directory / 'skin').mkdir(parents=True)
+    (directory / 'empty').mkdir()
+    (directory / 'skin' / 'body.skin').write_text(weights * 100)
+    (directory / 'data.json').write_text(u'{"version": 1}')
+    return str(directory)
+
+
+def _count_objects(store):
+    return sum(len(file_names) for _, _, file_names in os.walk(os.path.join(store.root, 'objects')))
+
+
+def test_versions_share_objects(tmp_path):
+    source = _create_data_folder(tmp_path / 'source')
+    store = objectstore.ObjectStore(str(tmp_path / 'store'), chunk_size=256)
+
+    assert store.create_version('skin', source, comment='first') == 1
+    objects_count = _count_objects(store)
+    assert store.create_version('skin', source, comment='second') == 2
+
+    assert _count_objects(store) == objects_count
+    assert store.reused >= store.written
+    assert store.get_version_numbers('skin') == [1, 2]
+    assert store.get_version('skin')['comment'] == 'second'
+    assert sorted(store.get_version('skin', 1)['files']) == ['data.json', 'skin/body.skin']
+
+
+@pytest.mark.parametrize('link', [False, True])
+def test_checkout_restores_version(tmp_path, link):
+    source = _create_data_folder(tmp_path / 'source')
+    store = objectstore.ObjectStore(str(tmp_path / 'store'))
+    store.create_version('data', source)
+    target = tmp_path / 'target'
+    target.mkdir()
+    (target / 'stale.txt').write_text(u'stale')
+
+    store.checkout('data', str(target), link=link)
+
+    assert sorted(os.listdir(str(target))) == ['data.json', 'empty', 'skin']
+    assert (target / 'skin' / 'body.skin').read_text() == u'weights' * 100
+
+    (tmp_path / 'source' / 'data.json').write_text(u'{"version": 2}')
+    store.create_version('data', source)
+    store.checkout('data', str(target), version=1, link=link)
+    assert (target / 'data.json').read_text() == u'{"version": 1}'
+    store.checkout('data', str(target), link=link)
+    assert (target / 'data.json').read_text() == u'{"version": 2}'
+
+    with pytest.raises(ValueError):
+        store.checkout('data', str(target), version=5)
+
+
+def test_checkout_keeps_store_located_inside_target(tmp_path):
+    target = tmp_path / 'target'
+    _create_data_folder(target)
+    store = objectstore.ObjectStore(str(target / 'cache' / '.store'))
+    store.create_version('data', str(target))
+    (target / 'stale.txt').write_text(u'stale')
+    (target / 'cache' / 'stale.txt').write_text(u'stale')
+
+    manifest = store.checkout('data', str(target))
+
+    assert sorted(manifest['files']) == ['data.json', 'skin/body.skin']
+    assert sorted(os.listdir(str(target))) == ['cache', 'data.json', 'empty', 'skin']
+    assert os.listdir(str(target / 'cache')) == ['.store']
+    assert store.get_version_numbers('data') == [1]
+    store.checkout('data', str(tmp_path / 'other'))
+    assert (tmp_path / 'other' / 'skin' / 'body.skin').read_text() == u'weights' * 100
+
+
+def test_collect_garbage_removes_unreferenced_objects(tmp_path):
+    source = tmp_path / 'source.skin'
+    source.write_text(u'first')
+    store = objectstore.get_object_store(str(tmp_path / 'target.skin'))
+    name = objectstore.get_version_name(store, str(tmp_path / 'target.skin'))
+    store.create_version(name, str(source))
+    source.write_text(u'second')
+    store.create_version(name, str(source))
+
+    assert name == 'target.skin'
+    assert store.root == str(tmp_path / objectstore.OBJECT_STORE_FOLDER)
+    assert store.collect_garbage() == (0, 0)
+    assert store.collect_garbage(grace_period=0) == (0, 0)
+
+    store.remove_version(name, 1)
+
+    assert store.collect_garbage(grace_period=0) == (1, len(u'first'))
+    store.checkout(name, str(tmp_path / 'target.skin'))
+    assert (tmp_path / 'target.skin').read_text() == u'second'
+
+
+def test_collect_garbage_waits_for_versions_being_created(tmp_path):
+    source = tmp_path / 'source.skin'
+    source.write_text(u'weights')
+    store = objectstore.ObjectStore(str(tmp_path / 'store'))
+    # Other process is simulated with other store, that locks its own handle of the lock file
+    other_store = objectstore.ObjectStore(str(tmp_path / 'store'))
+    stored, resume = threading.Event(), threading.Event()
+    put_tree = store.put_tree
+
+    def _put_tree(source_path):
+        manifest = put_tree(source_path)
+        stored.set()
+        resume.wait(5)
+        return manifest
+
+    store.put_tree = _put_tree
+    version_thread = threading.Thread(target=store.create_version, args=('skin', str(source)))
+    version_thread.start()
+    assert stored.wait(5)
+    collected = list()
+    collect_thread = threading.Thread(target=lambda: collected.append(other_store.collect_garbage(grace_period=0)))
+    collect_thread.start()
+    collect_thread.join(0.2)
+
+    assert collect_thread.is_alive()
+
+    resume.set()
+    version_thread.join(5)
+    collect_thread.join(5)
+
+    assert collected == [(0, 0)]
+    store.checkout('skin', str(tmp_path / 'target.skin'))
+    assert (tmp_path / 'target.skin').read_text() == u'weights'
+
+
+def test_reused_objects_are_protected_by_grace_period(tmp_path):
+    source = tmp_path / 'source.skin'
+    source.write_text(u'weights')
+    store = objectstore.ObjectStore(str(tmp_path / 'store'))
+    store.create_version('skin', str(source))
+    digest = store.get_version('skin')['files']['']['chunks'][0]
+    store.remove_version('skin', 1)
+    os.utime(store.get_object_path(digest), (0, 0))
+
+    assert store.put_file(str(source))['chunks'] == [digest]
+    assert store.collect_garbage(grace_period=60) == (0, 0)
+    assert store.has_object(digest)
+
+
+@pytest.mark.skipif(os.name == 'nt', reason='File modes are not supported in Windows')
+def test_checkout_file_mode(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache, '_UMASK', 0o022)
+    source = _create_data_folder(tmp_path / 'source')
+    store = objectstore.ObjectStore(str(tmp_path / 'store'))
+    store.create_version('data', source)
+    target = tmp_path / 'target'
+    target.mkdir()
+    (target / 'data.json').write_text(u'{}')
+    os.chmod(str(target / 'data.json'), 0o664)
+
+    store.checkout('data', str(target))
+
+    assert stat.S_IMODE(os.stat(str(target / 'data.json')).st_mode) == 0o664
+    assert stat.S_IMODE(os.stat(str(target / 'skin' / 'body.skin')).st_mode) == 0o644
+
+
+@pytest.mark.skipif(os.name == 'nt', reason='File modes are not supported in Windows')
+def test_version_manifests_use_default_file_mode(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache, '_UMASK', 0o022)
+    store = objectstore.ObjectStore(str(tmp_path / 'store'))
+    store.create_version('data', _create_data_folder(tmp_path / 'source'))
+
+    manifest_path = store._get_manifest_path('data', 1)
+    assert stat.S_IMODE(os.stat(manifest_path).st_mode) == 0o644
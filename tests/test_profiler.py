@@ -0,0 +1,122 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for tpRigToolkit startup profiler
+"""
+
+import sys
+import json
+import types
+import importlib
+
+import pytest
+
+import tpRigToolkit
+from tpRigToolkit.core import profiler
+
+from tests import fakes
+
+
+@pytest.fixture
+def loader(monkeypatch, tmp_path):
+    """
+    Imports tpRigToolkit loader with fake tpDcc modules
+    Returns loader module and the list of tools loaded by the fake tools manager
+    """
+
+    loaded_tools = list()
+
+    class ToolsManager(object):
+        def register_package_tools(self, package_name, tools_to_register=None, dev=False):
+            loaded_tools.extend(tools_to_register)
+
+        def load_registered_tools(self, package_name):
+            pass
+
+    modules = fakes.create_tpdcc_modules(fakes.FakeDcc(), fakes.FakeConfigs())
+    modules['tpDcc.managers.tools'] = modules['tpDcc.managers'].tools = types.ModuleType('tpDcc.managers.tools')
+    modules['tpDcc.managers.tools'].ToolsManager = ToolsManager
+    modules['tpRigToolkit.config'] = types.ModuleType('tpRigToolkit.config')
+    modules['tpRigToolkit.config'].__file__ = str(tmp_path / '__init__.py')
+    for module_name, module in modules.items():
+        monkeypatch.setitem(sys.modules, module_name, module)
+    previous_loader = sys.modules.pop('tpRigToolkit.loader', None)
+    try:
+        yield importlib.import_module('tpRigToolkit.loader'), loaded_tools
+    finally:
+        sys.modules.pop('tpRigToolkit.loader', None)
+        if previous_loader is not None:
+            sys.modules['tpRigToolkit.loader'] = previous_loader
+        for module_name in ('loader', 'config'):
+            if hasattr(tpRigToolkit, module_name):
+                delattr(tpRigToolkit, module_name)
+        if previous_loader is not None:
+            tpRigToolkit.loader = previous_loader
+
+
+def test_profiler_records_nested_imports(tmp_path):
+    package_path = tmp_path / 'profiledpkg'
+    package_path.mkdir()
+    (package_path / '__init__.py').write_text(u'from . import child\n')
+    (package_path / 'child.py').write_text(u'import time\ntime.sleep(0.01)\n')
+    sys.path.insert(0, str(tmp_path))
+
+    import_profiler = profiler.ImportProfiler()
+    import_profiler.start()
+    try:
+        with import_profiler.section('config', 'tpRigToolkit-core'):
+            __import__('profiledpkg')
+    finally:
+        import_profiler.stop()
+        sys.path.remove(str(tmp_path))
+        for module_name in ('profiledpkg', 'profiledpkg.child'):
+            sys.modules.pop(module_name, None)
+
+    records = {record.name: record for record in import_profiler.records()}
+    assert records['profiledpkg.child'].stack == ['config:tpRigToolkit-core', 'profiledpkg', 'profiledpkg.child']
+    assert records['profiledpkg'].duration >= records['profiledpkg.child'].duration >= 0.01
+    assert records['tpRigToolkit-core'].self_duration < records['tpRigToolkit-core'].duration
+
+    report_path, stacks_path = import_profiler.write_report(str(tmp_path / 'logs'))
+    with open(report_path) as fh:
+        report = json.load(fh)
+    assert report['records'][0]['name'] == 'tpRigToolkit-core'
+    with open(stacks_path) as fh:
+        assert 'config:tpRigToolkit-core;profiledpkg;profiledpkg.child ' in fh.read()
+
+
+def test_profiler_records_import_module_calls(tmp_path):
+    package_path = tmp_path / 'profiledimportpkg'
+    package_path.mkdir()
+    (package_path / '__init__.py').write_text(u'')
+    (package_path / 'child.py').write_text(u'import json\n')
+    sys.path.insert(0, str(tmp_path))
+
+    import_profiler = profiler.ImportProfiler()
+    import_profiler.start()
+    try:
+        importlib.import_module('.child', package='profiledimportpkg')
+    finally:
+        import_profiler.stop()
+        sys.path.remove(str(tmp_path))
+        for module_name in ('profiledimportpkg', 'profiledimportpkg.child'):
+            sys.modules.pop(module_name, None)
+
+    records = {record.name: record for record in import_profiler.records()}
+    assert records['profiledimportpkg.child'].stack == ['profiledimportpkg.child']
+    assert importlib.import_module.__name__ == 'import_module'
+
+
+def test_profiler_records_each_tool(loader):
+    loader_module, loaded_tools = loader
+    import_profiler = profiler.get_profiler()
+    import_profiler.start()
+    try:
+        loader_module._load_tools(['renamer', 'controlrig'])
+    finally:
+        import_profiler.stop()
+
+    assert loaded_tools == ['renamer', 'controlrig']
+    tool_records = [record.name for record in import_profiler.records() if record.category == 'tool']
+    assert tool_records[-2:] == ['renamer', 'controlrig']
@@ -0,0 +1,70 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for tpRigToolkit data registry
+"""
+
+from tpRigToolkit.core import registry
+
+
+class SkinFileData(object):
+
+    @staticmethod
+    def get_data_type():
+        return 'dcc.skin'
+
+    @staticmethod
+    def get_data_extension():
+        return 'skin.json'
+
+
+class ControlsFileData(object):
+
+    @staticmethod
+    def get_data_type():
+        return 'dcc.controls'
+
+    @staticmethod
+    def get_data_extension():
+        return 'controls'
+
+    @classmethod
+    def is_type_match(cls, data_type):
+        return data_type in ('dcc.controls', 'controls')
+
+
+class SkinItem(object):
+    Extension = '.skin.json'
+    MenuName = 'Skin'
+    DataType = 'dcc.skin'
+
+
+class ControlsItem(object):
+    Extensions = ['.controls', '.CTRLS']
+    MenuName = 'Controls'
+    DataType = 'dcc.controls'
+
+
+def test_data_registry():
+    data_registry = registry.DataRegistry(
+        data_classes=[SkinFileData, ControlsFileData, SkinFileData], data_items=[SkinItem, ControlsItem])
+
+    assert data_registry.get_data_classes() == [SkinFileData, ControlsFileData]
+    assert data_registry.get_data_types() == ['dcc.skin', 'dcc.controls']
+    assert data_registry.get_data_class('dcc.skin') is SkinFileData
+    assert data_registry.get_data_class('controls') is ControlsFileData
+    assert data_registry.get_data_class('dcc.anim') is None
+    assert data_registry.get_data_class_for_extension('SKIN.JSON') is SkinFileData
+    assert data_registry.get_data_class_for_path('/data/body.skin.json') is SkinFileData
+    assert data_registry.get_data_class_for_path('/data/body.json') is None
+
+    assert data_registry.get_data_item('dcc.controls') is ControlsItem
+    assert data_registry.get_data_item_for_extension('ctrls') is ControlsItem
+    assert data_registry.get_data_item_for_path('C:\\data\\arm.v001.controls') is ControlsItem
+    assert data_registry.get_data_item_for_path('/data/.controls/') is None
+    assert data_registry.get_data_item_by_menu_name('Skin') is SkinItem
+
+    data_registry.update(data_items=[ControlsItem])
+    assert data_registry.get_data_item('dcc.skin') is None
+    assert data_registry.get_data_classes() == []
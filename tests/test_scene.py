@@ -0,0 +1,61 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for tpRigToolkit scene snapshots
+"""
+
+from tpRigToolkit.core import naming, scene, classifier
+
+from tests.fakes import FakeDcc
+from tests.test_naming import NAMING_DATA
+
+AUTO_SUFFIXES = {'group': 'grp', 'controller': 'ctrl', 'joint': 'jnt'}
+
+
+def _create_scene():
+    fake_dcc = FakeDcc()
+    group = fake_dcc.add_node('root', 'transform')
+    fake_dcc.add_node('arm', 'joint', parent=group)
+    control = fake_dcc.add_node('arm_control', 'transform', parent=group)
+    fake_dcc.add_node('arm_controlShape', 'nurbsCurve', parent=control)
+    fake_dcc.add_node('mesh', 'transform', parent=group)
+    fake_dcc.add_node('meshShape', 'mesh', parent='|root|mesh')
+    fake_dcc.add_node('tag', 'controller')
+    fake_dcc.add_node('curve', 'nurbsCurve', message_connections=['tag'])
+    fake_dcc.add_node('node_arm_jnt', 'transform')
+    return fake_dcc
+
+
+def test_scene_snapshot_classifies_nodes():
+    fake_dcc = _create_scene()
+    node_names = ['|root', '|root|arm', '|root|arm_control', '|root|mesh', '|curve', '|root']
+    snapshot = scene.SceneSnapshot(fake_dcc, node_names)
+
+    assert len(snapshot) == 5
+    node_types = classifier.NodeClassifier().classify_nodes(snapshot.nodes())
+    assert [node_types[node_info.handle] for node_info in snapshot.nodes()] == [
+        'group', 'joint', 'nurbsCurve', 'mesh', 'controller']
+    assert fake_dcc.calls['all_scene_nodes'] == 1
+
+
+def test_solve_node_names_by_type():
+    fake_dcc = _create_scene()
+    compiled_naming = naming.CompiledNaming({
+        'rules': NAMING_DATA['rules'] + [
+            {'name': 'grp', 'expression': '{rule_name}_{description}', 'auto_fix': True, 'iterator_format': '#'}],
+        'tokens': NAMING_DATA['tokens'] + [{'name': 'rule_name', 'default': 0, 'values': {'key': [], 'value': []}}]})
+    node_names = ['|root', '|root|arm', '|root|mesh']
+    snapshot = scene.SceneSnapshot(fake_dcc, node_names)
+
+    solved_names = scene.solve_node_names_by_type(snapshot, compiled_naming, AUTO_SUFFIXES)
+    assert list(solved_names.values()) == ['grp_|root', '|root|arm_c_jnt', '|root|mesh_c_None']
+
+    solved_names = dict((handle, name.replace('|', '')) for handle, name in solved_names.items())
+    solved_names[snapshot.nodes()[1].handle] = 'node_arm_jnt'
+    calls = dict(fake_dcc.calls)
+    new_names = snapshot.rename_nodes(solved_names, unique_name=True)
+
+    assert new_names == ['|grp_root', '|grp_root|node_arm_jnt1', '|grp_root|rootmesh_c_None']
+    assert fake_dcc.calls['node_type'] == calls['node_type']
+    assert fake_dcc.calls['all_scene_nodes'] == 1
@@ -0,0 +1,94 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for tpRigToolkit settings store
+"""
+
+import os
+import json
+import stat
+
+import pytest
+
+from tpRigToolkit.core import settingsstore
+
+
+def test_get_settings_store_returns_shared_store(tmp_path):
+    file_path = str(tmp_path / 'library.json')
+
+    store = settingsstore.get_settings_store(file_path)
+
+    assert settingsstore.get_settings_store(os.path.join(str(tmp_path), '.', 'library.json')) is store
+
+
+def test_settings_are_read_once(tmp_path):
+    file_path = tmp_path / 'library.json'
+    file_path.write_text(u'[["viewMode", "icon"]]')
+    store = settingsstore.SettingsStore(str(file_path))
+
+    for _ in range(100):
+        assert store.get('viewMode') == 'icon'
+        assert store.get('missing', 'default') == 'default'
+
+    assert store.reads == 1
+
+
+def test_settings_writes_are_coalesced(tmp_path):
+    file_path = tmp_path / 'library.json'
+    store = settingsstore.SettingsStore(str(file_path), flush_delay=60)
+
+    for i in range(10):
+        store.set('setting{}'.format(i), i)
+    assert store.writes == 0
+    assert not file_path.exists()
+
+    assert store.flush()
+    assert store.writes == 1
+    assert json.loads(file_path.read_text()) == [['setting{}'.format(i), i] for i in range(10)]
+
+    assert store.flush()
+    assert store.writes == 1
+
+
+def test_settings_are_reloaded_when_file_changes(tmp_path):
+    file_path = tmp_path / 'library.json'
+    file_path.write_text(u'[["viewMode", "icon"]]')
+    store = settingsstore.SettingsStore(str(file_path), flush_delay=60, check_interval=0)
+    store.set('sortBy', 'name')
+
+    file_path.write_text(u'[["viewMode", "list"], ["sortBy", "date"]]')
+    mtime = os.path.getmtime(str(file_path)) + 10
+    os.utime(str(file_path), (mtime, mtime))
+
+    assert store.get('viewMode') == 'list'
+    assert store.get('sortBy') == 'name'
+    assert store.reads == 2
+
+    store.flush()
+    assert json.loads(file_path.read_text()) == [['viewMode', 'list'], ['sortBy', 'name']]
+
+
+def test_settings_data_is_a_copy(tmp_path):
+    file_path = tmp_path / 'library.json'
+    file_path.write_text(u'[["paths", {"root": "a"}]]')
+    store = settingsstore.SettingsStore(str(file_path), flush_delay=60)
+
+    store.data()['paths']['root'] = 'b'
+    store.settings_dict['viewMode'] = 'list'
+
+    assert store.get('paths') == {'root': 'a'}
+    assert not store.has_setting('viewMode')
+
+
+@pytest.mark.skipif(os.name == 'nt', reason='File permissions are not supported')
+def test_settings_flush_keeps_file_permissions(tmp_path):
+    file_path = tmp_path / 'library.json'
+    file_path.write_text(u'[]')
+    os.chmod(str(file_path), 0o644)
+    store = settingsstore.SettingsStore(str(file_path), flush_delay=60)
+
+    store.set('viewMode', 'icon')
+    store.flush()
+
+    assert stat.S_IMODE(os.stat(str(file_path)).st_mode) == 0o644
@@ -0,0 +1,94 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for tpRigToolkit side tables
+"""
+
+import os
+
+from tpRigToolkit.core import sides
+
+from tests.fakes import FakeToken, FakeNameLib, FakeProject
+
+SIDE_TOKEN = FakeToken([('center', 'C'), ('left', 'L'), ('right', 'R'), ('middle', 'M')])
+
+
+def test_side_table_from_naming_token():
+    project = FakeProject(
+        options={'Controls.left': [1, 0, 0], 'SubControls.Right': [0, 0, 1]},
+        naming_lib=FakeNameLib({'side': SIDE_TOKEN, 'mirror side': FakeToken([('left', 'L'), ('right', 'R')], 2)}))
+    side_table = sides.SideTable.from_project(project)
+
+    assert side_table.get_sides() == ['center', 'left', 'right', 'middle']
+    assert side_table.get_sides(skip_default=True) == ['left', 'right', 'middle']
+    assert side_table.default_side == 'center'
+    assert side_table.mirror_side == 'right'
+    assert side_table.get_long_name('l') == 'left'
+    assert side_table.get_long_name('x') == 'x'
+    assert side_table.get_short_name('Right') == 'R'
+    assert side_table.get_mirror('L') == 'R'
+    assert side_table.get_mirror('Left') == 'Right'
+    assert side_table.get_mirror('C') is None
+    assert side_table.get_color('L') == [1, 0, 0]
+    assert side_table.get_color('R', sub_color=True) == [0, 0, 1]
+    assert side_table.get_color('C') is None
+
+    calls = project.calls['has_option']
+    side_table.get_color('L')
+    assert project.calls['has_option'] == calls
+
+
+def test_side_table_from_options_and_defaults():
+    project = FakeProject(options={'sides': {'Left': 'lf', 'Right': 'rt'}, 'mirror side': 'Right'})
+    side_table = sides.SideTable.from_project(project)
+
+    assert side_table.get_sides() == ['Left', 'Right']
+    assert side_table.get_long_name('LF') == 'Left'
+    assert side_table.get_mirror('lf') == 'rt'
+    assert side_table.mirror_side == 'Right'
+
+    default_table = sides.SideTable.from_project(None)
+    assert default_table.default_side == 'center'
+    assert default_table.get_long_name('r') == 'right'
+
+
+def test_side_tables_are_cached(tmp_path, monkeypatch):
+    monkeypatch.setattr(sides, 'SIDE_TABLE_CHECK_INTERVAL', 0.0)
+    option_file = tmp_path / 'options.json'
+    option_file.write_text(u'{}')
+    project = FakeProject(naming_lib=FakeNameLib({'side': SIDE_TOKEN}), option_file=str(option_file))
+    sides.clear_side_tables()
+
+    side_table = sides.get_side_table(project)
+    assert sides.get_side_table(project) is side_table
+    assert sides.get_side_table(project, default_side='left') is not side_table
+
+    os.utime(str(option_file), (0, 0))
+    assert sides.get_side_table(project) is not side_table
+
+
+def test_side_table_files_are_checked_once_per_interval(tmp_path, monkeypatch):
+    option_file = tmp_path / 'options.json'
+    option_file.write_text(u'{}')
+    project = FakeProject(naming_lib=FakeNameLib({'side': SIDE_TOKEN}), option_file=str(option_file))
+    sides.clear_side_tables()
+    monkeypatch.setattr(sides, 'SIDE_TABLE_CHECK_INTERVAL', 60.0)
+
+    side_table = sides.get_side_table(project)
+    calls = project.calls['get_option_file']
+    os.utime(str(option_file), (0, 0))
+    assert sides.get_side_table(project) is side_table
+    assert project.calls['get_option_file'] == calls
+
+    # Generation changes are checked in each query
+    assert sides.get_side_table(project, generation=1) is not side_table
+
+
+def test_side_tables_cache_is_bounded():
+    sides.clear_side_tables()
+    projects = [FakeProject(naming_lib=FakeNameLib({'side': SIDE_TOKEN})) for _ in range(64)]
+    for project in projects:
+        sides.get_side_table(project)
+
+    assert len(sides._SIDE_TABLES) == sides._SIDE_TABLES.capacity
@@ -0,0 +1,49 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for tpRigToolkit configuration snapshots
+"""
+
+import os
+import copy
+
+import yaml
+import pytest
+
+from tpRigToolkit.core import snapshots
+
+
+def test_config_snapshot(tmp_path):
+    config_file = tmp_path / 'tpRigToolkit-naming.yml'
+    config_file.write_text(u'auto_suffixes: {joint: jnt}\ntype_rules: [{type: mesh, result: geometry}]\n')
+    loads = list()
+
+    def _load(config_name, environment):
+        loads.append((config_name, environment))
+        file_path = str(tmp_path / '{}.yml'.format(config_name))
+        with open(file_path) as fh:
+            return yaml.safe_load(fh), file_path
+
+    config_snapshot = snapshots.ConfigSnapshot(_load, check_interval=0)
+    config = config_snapshot.get('tpRigToolkit-naming', 'development')
+    generation = config_snapshot.generation
+
+    assert config_snapshot.get_value('tpRigToolkit-naming', 'auto_suffixes', environment='development') == {
+        'joint': 'jnt'}
+    assert config_snapshot.get_value('tpRigToolkit-naming', 'missing', default=1, environment='development') == 1
+    assert config['type_rules'][0]['result'] == 'geometry'
+    assert loads == [('tpRigToolkit-naming', 'development')]
+    with pytest.raises(TypeError):
+        config['auto_suffixes']['group'] = 'grp'
+    assert copy.deepcopy(config) == config
+
+    os.utime(str(config_file), (0, 0))
+    assert config_snapshot.get('tpRigToolkit-naming', 'development') == config
+    assert config_snapshot.generation == generation
+
+    config_file.write_text(u'auto_suffixes: {joint: JNT}\n')
+    os.utime(str(config_file), (1, 1))
+    assert config_snapshot.get('tpRigToolkit-naming', 'development')['auto_suffixes'] == {'joint': 'JNT'}
+    assert config_snapshot.generation == generation + 1
+    assert len(loads) == 3
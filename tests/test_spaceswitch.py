@@ -0,0 +1,60 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for tpRigToolkit space switch data
+tpDcc and Qt modules are replaced with fakes, so space switch data items can be used without a DCC or Qt
+"""
+
+import sys
+import json
+import importlib
+
+import pytest
+
+from tpRigToolkit.core import container
+
+from tests.fakes import FakeDcc, create_data_modules
+
+
+@pytest.fixture
+def spaceswitch():
+    """
+    Imports space switch data module with fake tpDcc and Qt modules
+    """
+
+    fake_modules = create_data_modules(FakeDcc())
+    module_names = ['tpRigToolkit.core.data', 'tpRigToolkit.data.spaceswitch']
+    previous_modules = dict((name, sys.modules.get(name)) for name in list(fake_modules) + module_names)
+    sys.modules.update(fake_modules)
+    try:
+        for module_name in module_names:
+            sys.modules.pop(module_name, None)
+        yield importlib.import_module('tpRigToolkit.data.spaceswitch')
+    finally:
+        for module_name, module in previous_modules.items():
+            if module is None:
+                sys.modules.pop(module_name, None)
+            else:
+                sys.modules[module_name] = module
+        # Modules imported with fake modules are not kept as attributes of their packages
+        for module_name in module_names:
+            parent_name, _, child_name = module_name.rpartition('.')
+            if previous_modules[module_name] is None and hasattr(sys.modules[parent_name], child_name):
+                delattr(sys.modules[parent_name], child_name)
+
+
+def test_converted_space_switch_files_can_be_previewed(spaceswitch, tmp_path, monkeypatch):
+    item = spaceswitch.SpaceSwitch(str(tmp_path / 'rig.sswitch'))
+    file_data = item.data_object()
+    with open(file_data.get_file(), 'w') as fh:
+        json.dump({'nodes': ['arm_ctrl'], 'spaces': [{'node': 'arm_ctrl'}]}, fh)
+    assert item.load_schema()[-1]['value'] == 'nodes, spaces'
+
+    file_data.convert_to_container()
+    monkeypatch.setattr(container.ContainerReader, 'read_section', lambda *args: pytest.fail('Section read'))
+
+    assert container.is_container(file_data.get_file())
+    assert item.load_schema()[-1]['value'] == 'nodes, spaces'
+    monkeypatch.undo()
+    assert file_data.read_sections(['spaces']) == {'spaces': [{'node': 'arm_ctrl'}]}
@@ -0,0 +1,66 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for tpRigToolkit startup pipeline
+"""
+
+import time
+import threading
+
+import pytest
+
+from tpRigToolkit.core import startup
+
+
+def test_pipeline_respects_dependencies_and_main_thread():
+    main_thread = threading.current_thread()
+    executed = list()
+    lock = threading.Lock()
+
+    def _task(name, check_main=False):
+        def _fn():
+            if check_main:
+                assert threading.current_thread() is main_thread
+            time.sleep(0.01)
+            with lock:
+                executed.append(name)
+            return name
+        return _fn
+
+    pipeline = startup.StartupPipeline()
+    pipeline.add_task('libs.import.a', _task('a'))
+    pipeline.add_task('libs.import.b', _task('b'))
+    pipeline.add_task('libs.load', _task('load', True), depends=['libs.import.a', 'libs.import.b'], main_thread=True)
+    pipeline.add_task('menus.create', _task('menus', True), depends=['libs.load'], main_thread=True)
+    results = pipeline.run()
+
+    assert results['menus.create'] == 'menus'
+    assert executed.index('load') > max(executed.index('a'), executed.index('b'))
+    assert executed[-1] == 'menus'
+    assert [task.name for task in pipeline.critical_path()][-2:] == ['libs.load', 'menus.create']
+    assert set(pipeline.report()) == {'libs', 'menus'}
+
+
+def test_pipeline_skips_dependents_of_failed_tasks():
+
+    def _fail():
+        raise RuntimeError('boom')
+
+    pipeline = startup.StartupPipeline(max_workers=0)
+    pipeline.add_task('tools.import.a', _fail)
+    pipeline.add_task('tools.load', lambda: True, depends=['tools.import.a'], main_thread=True)
+    pipeline.run()
+
+    assert pipeline.get_task('tools.import.a').error
+    assert pipeline.get_task('tools.load').skipped
+    assert pipeline.report()['tools']['failed'] == ['tools.import.a', 'tools.load']
+
+
+def test_pipeline_detects_cycles():
+    pipeline = startup.StartupPipeline()
+    pipeline.add_task('a', lambda: None, depends=['b'])
+    pipeline.add_task('b', lambda: None, depends=['a'])
+
+    with pytest.raises(ValueError):
+        pipeline.run()
@@ -0,0 +1,61 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for tpRigToolkit utils functions
+tpDcc modules are replaced with fakes, so utils module can be imported without a DCC
+"""
+
+import sys
+import json
+import importlib
+
+import pytest
+
+from tests.fakes import FakeDcc, create_data_modules
+
+
+@pytest.fixture
+def utils(tmp_path, monkeypatch):
+    """
+    Imports tpRigToolkit utils module with fake tpDcc modules
+    """
+
+    monkeypatch.setenv('TPRIGTOOLKIT_OBJECT_STORE_PATH', str(tmp_path / 'store'))
+    fake_modules = create_data_modules(FakeDcc())
+    module_name = 'tpRigToolkit.core.utils'
+    previous_modules = dict((name, sys.modules.get(name)) for name in list(fake_modules) + [module_name])
+    sys.modules.update(fake_modules)
+    try:
+        sys.modules.pop(module_name, None)
+        yield importlib.import_module(module_name)
+    finally:
+        for name, module in previous_modules.items():
+            if module is None:
+                sys.modules.pop(name, None)
+            else:
+                sys.modules[name] = module
+        # Modules imported with fake modules are not kept as attributes of their packages
+        core_package = sys.modules['tpRigToolkit.core']
+        if previous_modules[module_name] is None and hasattr(core_package, 'utils'):
+            delattr(core_package, 'utils')
+
+
+def test_versions_include_legacy_version_file_history(utils, tmp_path):
+    data_file = tmp_path / 'data' / 'rig.skin'
+    (tmp_path / 'data' / '__version__').mkdir(parents=True)
+    (tmp_path / 'data' / '__version__' / 'comments.json').write_text(json.dumps([
+        {'version': '2', 'comment': 'second', 'user': 'rigger'},
+        {'version': '1', 'comment': 'first', 'user': 'rigger'}]))
+    data_file.write_text(u'weights')
+
+    assert utils.create_version(str(data_file), comment='store') == 1
+    versions = utils.get_versions(str(data_file))
+
+    assert [(version['version'], version['comment'], version['legacy']) for version in versions] == [
+        (1, 'first', True), (2, 'second', True), (1, 'store', False)]
+    assert versions[1]['path'] == str(tmp_path / 'data' / '__version__' / '.2')
+
+    data_file.write_text(u'modified')
+    utils.restore_version(str(data_file))
+    assert data_file.read_text() == u'weights'
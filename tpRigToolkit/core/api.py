@@ -11,7 +11,7 @@ from tpDcc import dcc
 from tpDcc.core import project
 from tpDcc.libs.qt.widgets import project
 
-from tpRigToolkit.core import consts
+from tpRigToolkit.core import sides, mirror
 from tpRigToolkit.managers import names
 
 
@@ -63,6 +63,66 @@ def parse_name(node_name, rule_name=None):
     return names.parse_name(node_name=node_name, rule_name=rule_name)
 
 
+def solve_names(records, rule_name=None, **kwargs):
+    """
+    Resolves a name for each one of the given records with the given rule
+    :param records: list(dict) or dict(str, list), token values of each name or column oriented dictionary
+    :param rule_name: str
+    :param kwargs: dict
+    :return: list(str)
+    """
+
+    kwargs['unique_name'] = kwargs.get('unique_name', True)
+
+    return names.solve_names(records, rule_name=rule_name, **kwargs)
+
+
+def parse_names(node_names, rule_name=None):
+    """
+    Parses all given names with the given rule
+    :param node_names: list(str)
+    :param rule_name: str
+    :return: list(dict(str))
+    """
+
+    return names.parse_names(node_names=node_names, rule_name=rule_name)
+
+
+def match_name(node_name):
+    """
+    Finds the rule used to solve the given name and parses the name with it
+    :param node_name: str
+    :return: tuple(str, dict(str)), name of the matched rule and parsed fields. (None, None) if no rule matches
+    """
+
+    return names.match_name(node_name=node_name)
+
+
+def match_names(node_names):
+    """
+    Finds the rule used to solve each one of the given names and parses the names with them
+    :param node_names: list(str)
+    :return: list(tuple(str, dict(str)))
+    """
+
+    return names.match_names(node_names=node_names)
+
+
+def get_side_table(current_project, default_sides=None, default_side=None, default_mirror_side=None):
+    """
+    Returns side table of the given project. Side tables are cached until project options or naming file change
+    :param current_project: Project or None
+    :param default_sides: list(str) or None
+    :param default_side: str or None
+    :param default_mirror_side: str or None
+    :return: SideTable
+    """
+
+    return sides.get_side_table(
+        current_project, default_sides=default_sides, default_side=default_side,
+        default_mirror_side=default_mirror_side)
+
+
 def get_sides(current_project, skip_default=False, default_sides=None, default_side=None):
     """
     Returns sides being used
@@ -74,29 +134,9 @@ def get_sides(current_project, skip_default=False, default_sides=None, default_s
     :rtype: list(str), str
     """
 
-    if current_project:
-        # Check project options
-        if current_project.has_option('sides'):
-            sides = current_project.get_option('sides')
-            if sides:
-                default_side = sides[0]
-                if skip_default:
-                    sides.remove(default_side)
-                return sides, default_side
-        # Check project nomenclature
-        name_lib = current_project.naming_lib
-        side_token = name_lib.get_token('side')
-        if side_token:
-            token_items = side_token.get_items().keys()
-            token_default = side_token.default or 1
-            token_default_value = token_items[token_default - 1] if token_items else ''
-            if skip_default:
-                if token_default_value in token_items:
-                    token_items.remove(token_default_value)
-            return token_items, token_default_value
-    else:
-        # Default fallback
-        return default_sides or consts.DEFAULT_SIDES.keys(), default_side or consts.DEFAULT_SIDE
+    side_table = get_side_table(current_project, default_sides=default_sides, default_side=default_side)
+
+    return side_table.get_sides(skip_default=skip_default), side_table.default_side
 
 
 def get_side_long_name(short_side, current_project=None):
@@ -107,28 +147,7 @@ def get_side_long_name(short_side, current_project=None):
     :return: str
     """
 
-    if current_project:
-        # Check project options
-        if current_project.has_option('sides'):
-            sides = current_project.get_option('sides')
-            if sides:
-                for side_name, side_short in sides.items():
-                    if side_short.lower() == short_side.lower():
-                        return side_name
-
-        # Check project nomenclature
-        name_lib = current_project.naming_lib
-        side_token = name_lib.get_token('side')
-        for side_key, side_value in side_token.get_items().items():
-            if side_value.lower() == short_side.lower():
-                return side_key
-    else:
-        # Default fallback
-        for side_name, side_short in consts.DEFAULT_SIDE.items():
-            if side_short.lower() == short_side.lower():
-                return side_name
-
-    return short_side
+    return get_side_table(current_project).get_long_name(short_side)
 
 
 def get_mirror_side(current_project, default_mirror_side=None):
@@ -137,24 +156,7 @@ def get_mirror_side(current_project, default_mirror_side=None):
     :return: str
     """
 
-    if current_project:
-        # Check project options
-        if current_project.has_option('mirror side'):
-            return current_project.get_option('mirror side')
-
-        # Check project nomenclature
-        name_lib = current_project.naming_lib
-        mirror_side_token = name_lib.get_token('mirror side')
-        if mirror_side_token:
-            token_items = mirror_side_token.get_items().keys()
-            token_default = mirror_side_token.default or 1
-            token_default_value = token_items[token_default - 1] if token_items else ''
-            return token_default_value
-        else:
-            return default_mirror_side or consts.DEFAULT_MIRROR_SIDE
-    else:
-        # Default fallback
-        return default_mirror_side or consts.DEFAULT_MIRROR_SIDE
+    return get_side_table(current_project, default_mirror_side=default_mirror_side).mirror_side
 
 
 def get_default_side(current_project):
@@ -163,9 +165,7 @@ def get_default_side(current_project):
     :return: str
     """
 
-    sides, default_side = get_sides(current_project=current_project)
-
-    return default_side
+    return get_side_table(current_project).default_side
 
 
 def get_color_of_side(current_project, side, sub_color=False):
@@ -180,20 +180,7 @@ def get_color_of_side(current_project, side, sub_color=False):
     :return:
     """
 
-    side_color = None
-    if current_project:
-        groups = ['Controls', 'controls'] if not sub_color else ['SubControls', 'subcontrols']
-        for group in groups:
-            if current_project.has_option(side, group=group):
-                side_color = current_project.get_option(side, group=group)
-            else:
-                side_long = get_side_long_name(side, current_project=current_project)
-                if current_project.has_option(side_long, group=group):
-                    side_color = current_project.get_option(side_long, group=group)
-                if current_project.has_option(side_long.title(), group=group):
-                    side_color = current_project.get_option(side_long.title(), group=group)
-            if side_color:
-                break
+    side_color = get_side_table(current_project).get_color(side, sub_color=sub_color)
 
     return side_color if side_color else dcc.get_color_of_side(side=side, sub_color=sub_color)
 
@@ -208,7 +195,8 @@ def get_side_colors(current_project, sides=None, sub_color=False):
     """
 
     side_colors = dict()
-    sides, default_side = sides or get_sides(current_project=current_project)
+    if not sides:
+        sides, _ = get_sides(current_project=current_project)
     for side in sides:
         side_color_data = get_color_of_side(current_project, side=side, sub_color=sub_color)
         if side_color_data:
@@ -217,30 +205,48 @@ def get_side_colors(current_project, sides=None, sub_color=False):
     return side_colors
 
 
-def get_mirror_name(current_project, node_name):
+def get_mirror_engine(current_project, rule_name=None, dev=False):
+    """
+    Returns a mirror engine that mirrors names using the sides of the given project
+    :param current_project: Project or None
+    :param rule_name: str or None, rule used to find the side field of the names. If not given, the rule of each name
+        is found using the parse index of the naming file
+    :param dev: bool
+    :return: MirrorEngine
+    """
+
+    compiled_naming = names.get_compiled_naming(dev=dev)
+    if rule_name:
+        return mirror.MirrorEngine(get_side_table(current_project), rule=compiled_naming.get_rule(rule_name))
+
+    return mirror.MirrorEngine(get_side_table(current_project), parse_index=compiled_naming.get_parse_index())
+
+
+def get_mirror_name(current_project, node_name, dev=False):
     """
     Returns the mirrored name of the given node
     :param current_project: str
     :param node_name: str
+    :param dev: bool
     :return: str
     """
 
-    all_sides, default_side = get_sides(current_project=current_project, skip_default=True)
-    parsed_name = parse_name(node_name)
-    if 'side' not in parsed_name or not parsed_name['side'] or parsed_name['side'] not in all_sides:
-        mirror_name = dcc.get_mirror_name(node_name)
-    else:
-        mirror_side = parsed_name['side']
-        for side in all_sides:
-            if side != parsed_name['side']:
-                mirror_side = side
-                break
-        parsed_name['side'] = mirror_side
-        mirror_name = solve_name(parse_name)
-
-    if 'Left' in node_name:
-        mirror_name = mirror_name.replace('Left', 'Right')
-    elif 'Right' in node_name:
-        mirror_name = mirror_name.replace('Right', 'Left')
-
-    return mirror_name
+    mirror_name = get_mirror_engine(current_project, dev=dev).get_mirror_name(node_name)
+
+    return mirror_name if mirror_name is not None else dcc.get_mirror_name(node_name)
+
+
+def get_mirror_names(current_project, node_names, rule_name=None, dev=False):
+    """
+    Returns the mirrored names of all the given nodes
+    Side patterns are compiled once, so this function should be used when mirroring multiple nodes (hierarchies, etc)
+    :param current_project: Project or None
+    :param node_names: list(str)
+    :param rule_name: str or None, rule used to find the side field of the names. If not given, the rule of each name
+        is found using the parse index of the naming file
+    :param dev: bool
+    :return: tuple(OrderedDict(str, str), list(str)), mirrored name of each node and names that have no side that
+        can be mirrored
+    """
+
+    return get_mirror_engine(current_project, rule_name=rule_name, dev=dev).get_mirror_names(node_names)
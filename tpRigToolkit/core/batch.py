@@ -0,0 +1,238 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains implementation for tpRigToolkit batch data operations
+Each item of a batch is processed in three steps:
+    - prepare: executed in the main thread. Scene access (gathering the data to export, selection, etc)
+    - process: executed in a thread pool. Disk access (serialization, writing and reading of files)
+    - finish: executed in the main thread. Scene access (applying imported data, etc)
+Items are pipelined: while the pool processes some items, the main thread prepares the next ones
+"""
+
+from __future__ import print_function, division, absolute_import
+
+import logging
+import traceback
+import timeit
+from collections import OrderedDict
+from multiprocessing.pool import ThreadPool
+
+try:
+    import queue
+except ImportError:
+    import Queue as queue
+
+LOGGER = logging.getLogger('tpRigToolkit-core')
+
+BATCH_STEPS = ('prepare', 'process', 'finish')
+
+
+class BatchTask(object):
+    """
+    Class that defines the work done by a batch operation for a single item
+    """
+
+    def __init__(self, name, process=None, prepare=None, finish=None):
+        """
+        :param name: str, name of the item
+        :param process: callable or None, function executed in a worker thread. Receives the result of prepare
+            function (if prepare function is given)
+        :param prepare: callable or None, function executed in the main thread with no arguments
+        :param finish: callable or None, function executed in the main thread. Receives the result of process
+            function (or the result of prepare function if no process function is given)
+        """
+
+        super(BatchTask, self).__init__()
+
+        self.name = name
+        self.fns = dict(prepare=prepare, process=process, finish=finish)
+        self.timings = OrderedDict()
+        self.result = None
+        self.error = None
+        self.error_step = None
+        self.traceback = None
+
+    def __repr__(self):
+        return '<{}: {}>'.format(self.__class__.__name__, self.name)
+
+    @property
+    def duration(self):
+        """
+        Returns the time (in seconds) spent executing all the steps of this task
+        :return: float
+        """
+
+        return sum(self.timings.values())
+
+    @property
+    def succeeded(self):
+        """
+        Returns whether or not all the steps of the task were executed without errors
+        :return: bool
+        """
+
+        return self.error is None and len(self.timings) == len([fn for fn in self.fns.values() if fn])
+
+    def execute(self, step):
+        """
+        Executes the given step of the task storing its result and timing
+        Steps are not executed if a previous step failed
+        :param step: str, one of BATCH_STEPS
+        :return: BatchTask
+        """
+
+        fn = self.fns.get(step, None)
+        if not fn or self.error is not None:
+            return self
+
+        start = timeit.default_timer()
+        try:
+            if step == 'prepare':
+                self.result = fn()
+            elif any(self.fns[previous_step] for previous_step in BATCH_STEPS[:BATCH_STEPS.index(step)]):
+                self.result = fn(self.result)
+            else:
+                self.result = fn()
+        except Exception as exc:
+            self.error = exc
+            self.error_step = step
+            self.traceback = traceback.format_exc()
+            LOGGER.error('Batch task "{}" failed while executing {} step: {}'.format(self.name, step, exc))
+            LOGGER.debug(self.traceback)
+        finally:
+            self.timings[step] = timeit.default_timer() - start
+
+        return self
+
+
+class BatchRunner(object):
+    """
+    Class that executes batch tasks. Prepare and finish steps are executed in the thread that calls run function
+    while process steps are executed in a thread pool
+    """
+
+    def __init__(self, max_workers=None):
+        """
+        :param max_workers: int or None, number of worker threads. If None, pool default is used. If 0, all steps
+            are executed serially in the main thread
+        """
+
+        super(BatchRunner, self).__init__()
+
+        self._max_workers = max_workers
+        self._tasks = list()
+        self._start = None
+        self._end = None
+
+    @property
+    def duration(self):
+        """
+        Returns the time (in seconds) the whole batch took to execute
+        :return: float
+        """
+
+        if self._start is None or self._end is None:
+            return 0.0
+
+        return self._end - self._start
+
+    def tasks(self):
+        """
+        Returns all tasks added to the batch
+        :return: list(BatchTask)
+        """
+
+        return list(self._tasks)
+
+    def failed_tasks(self):
+        """
+        Returns all the tasks of the batch that failed
+        :return: list(BatchTask)
+        """
+
+        return [task for task in self._tasks if task.error is not None]
+
+    def add_task(self, task):
+        """
+        Adds a new task into the batch
+        :param task: BatchTask
+        :return: BatchTask
+        """
+
+        self._tasks.append(task)
+
+        return task
+
+    def run(self):
+        """
+        Executes all the tasks of the batch. A failure in a task does not stop the execution of the other tasks
+        :return: list(BatchTask)
+        """
+
+        use_pool = self._max_workers != 0 and any(task.fns['process'] for task in self._tasks)
+        pool = ThreadPool(self._max_workers) if use_pool else None
+        processed_queue = queue.Queue()
+        running = 0
+
+        self._start = timeit.default_timer()
+        try:
+            for task in self._tasks:
+                while True:
+                    try:
+                        processed_queue.get_nowait().execute('finish')
+                        running -= 1
+                    except queue.Empty:
+                        break
+                task.execute('prepare')
+                if pool and task.fns['process'] and task.error is None:
+                    running += 1
+                    pool.apply_async(task.execute, args=('process',), callback=processed_queue.put)
+                else:
+                    task.execute('process').execute('finish')
+            while running:
+                processed_queue.get().execute('finish')
+                running -= 1
+        finally:
+            if pool:
+                pool.close()
+                pool.join()
+            self._end = timeit.default_timer()
+
+        return self.tasks()
+
+    def report(self):
+        """
+        Returns a dictionary with the timings and the errors of each one of the tasks of the batch
+        :return: OrderedDict(str, dict)
+        """
+
+        report = OrderedDict()
+        for task in self._tasks:
+            report[task.name] = {
+                'succeeded': task.succeeded,
+                'duration': task.duration,
+                'timings': dict(task.timings),
+                'error': str(task.error) if task.error is not None else None,
+                'error_step': task.error_step
+            }
+
+        return report
+
+    def log_report(self, logger=None, name='Batch'):
+        """
+        Logs batch report
+        :param logger: Logger or None
+        :param name: str, name of the batch operation
+        """
+
+        logger = logger or LOGGER
+
+        failed = self.failed_tasks()
+        logger.info('{} finished in {:.3f} seconds: {} item/s, {} failed'.format(
+            name, self.duration, len(self._tasks), len(failed)))
+        for task in self._tasks:
+            timings = ' | '.join('{}: {:.3f}s'.format(step, duration) for step, duration in task.timings.items())
+            logger.info('\t{}: {}'.format(task.name, timings))
+        for task in failed:
+            logger.warning('\t{}: failed in {} step: {}'.format(task.name, task.error_step, task.error))
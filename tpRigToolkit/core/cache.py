@@ -0,0 +1,311 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains utils functions to handle tpRigToolkit caches
+"""
+
+from __future__ import print_function, division, absolute_import
+
+import os
+import json
+import stat
+import hashlib
+import logging
+import tempfile
+import threading
+from collections import OrderedDict
+
+LOGGER = logging.getLogger('tpRigToolkit-core')
+
+CACHE_PATH_ENV = 'TPRIGTOOLKIT_CACHE_PATH'
+
+
+def _get_umask():
+    umask = os.umask(0)
+    os.umask(umask)
+
+    return umask
+
+
+# Umask is read once, because it can only be read by changing it and files are written from worker threads
+_UMASK = _get_umask()
+
+
+class LRUCache(object):
+    """
+    Thread safe least recently used cache that keeps track of its hits and misses
+    """
+
+    def __init__(self, capacity=8):
+        """
+        :param capacity: int, maximum number of stored items. If 0 or less, items are never evicted
+        """
+
+        super(LRUCache, self).__init__()
+
+        self._capacity = capacity
+        self._items = OrderedDict()
+        self._lock = threading.RLock()
+        self._key_locks = dict()
+        self._hits = 0
+        self._misses = 0
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, key):
+        return key in self._items
+
+    @property
+    def capacity(self):
+        return self._capacity
+
+    @property
+    def hits(self):
+        return self._hits
+
+    @property
+    def misses(self):
+        return self._misses
+
+    def set_capacity(self, capacity):
+        """
+        Sets the maximum number of stored items evicting the least recently used ones if necessary
+        :param capacity: int
+        """
+
+        with self._lock:
+            self._capacity = capacity
+            self._evict()
+
+    def get(self, key, default=None):
+        """
+        Returns the item stored with the given key
+        :param key: object
+        :param default: object, value returned if the key is not stored
+        :return: object
+        """
+
+        with self._lock:
+            if key not in self._items:
+                self._misses += 1
+                return default
+            self._hits += 1
+            value = self._items.pop(key)
+            self._items[key] = value
+            return value
+
+    def put(self, key, value):
+        """
+        Stores given item
+        :param key: object
+        :param value: object
+        """
+
+        with self._lock:
+            self._items.pop(key, None)
+            self._items[key] = value
+            self._evict()
+
+    def get_or_create(self, key, create_fn):
+        """
+        Returns the item stored with the given key. If it is not stored, it is created with the given function
+        Items are created outside of the cache lock, so a slow creation does not block the access to other items.
+        Creations of the same key are serialized, so an item is never created twice
+        :param key: object
+        :param create_fn: callable
+        :return: object
+        """
+
+        with self._lock:
+            if key in self._items:
+                return self.get(key)
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            with self._lock:
+                if key in self._items:
+                    return self.get(key)
+                self._misses += 1
+            try:
+                value = create_fn()
+                self.put(key, value)
+            finally:
+                with self._lock:
+                    if self._key_locks.get(key, None) is key_lock:
+                        self._key_locks.pop(key)
+
+        return value
+
+    def pop(self, key, default=None):
+        """
+        Removes the item stored with the given key
+        :param key: object
+        :param default: object
+        :return: object
+        """
+
+        with self._lock:
+            return self._items.pop(key, default)
+
+    def keys(self):
+        with self._lock:
+            return list(self._items.keys())
+
+    def clear(self, reset_stats=False):
+        """
+        Removes all stored items
+        :param reset_stats: bool, whether hits and misses counters are reset
+        """
+
+        with self._lock:
+            self._items.clear()
+            if reset_stats:
+                self._hits = self._misses = 0
+
+    def stats(self):
+        """
+        Returns usage statistics of the cache
+        :return: dict
+        """
+
+        with self._lock:
+            return {'hits': self._hits, 'misses': self._misses, 'size': len(self._items), 'capacity': self._capacity}
+
+    def _evict(self):
+        while 0 < self._capacity < len(self._items):
+            self._items.popitem(last=False)
+
+
+def get_cache_directory(*paths):
+    """
+    Returns directory where tpRigToolkit caches are stored
+    By default ~/tpRigToolkit/cache is used. It can be overridden with TPRIGTOOLKIT_CACHE_PATH environment variable
+    :param paths: list(str), extra paths to join to the cache directory
+    :return: str
+    """
+
+    cache_path = os.environ.get(CACHE_PATH_ENV, '') or os.path.join(os.path.expanduser('~'), 'tpRigToolkit', 'cache')
+
+    return os.path.normpath(os.path.join(cache_path, *paths))
+
+
+def read_json(file_path, default=None):
+    """
+    Returns the contents of the given JSON file
+    :param file_path: str
+    :param default: object, value returned if the file does not exist or is not valid
+    :return: object
+    """
+
+    if not file_path or not os.path.isfile(file_path):
+        return default
+
+    try:
+        with open(file_path, 'r') as fh:
+            return json.load(fh)
+    except Exception as exc:
+        LOGGER.warning('Impossible to read cache file "{}": {}'.format(file_path, exc))
+        return default
+
+
+def write_atomic(file_path, data, mode='w'):
+    """
+    Writes given data into a file making sure that readers never find a partially written file
+    Existing files keep their permissions and new files are created with the default permissions
+    :param file_path: str
+    :param data: str or bytes
+    :param mode: str
+    :return: bool
+    """
+
+    directory = os.path.dirname(file_path)
+    try:
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+        file_mode = get_file_mode(file_path)
+        fd, temp_path = tempfile.mkstemp(prefix='.tmp', dir=directory)
+        with os.fdopen(fd, mode) as fh:
+            fh.write(data)
+        os.chmod(temp_path, file_mode)
+        if os.name == 'nt' and os.path.isfile(file_path):
+            os.remove(file_path)
+        os.rename(temp_path, file_path)
+    except Exception as exc:
+        LOGGER.warning('Impossible to write cache file "{}": {}'.format(file_path, exc))
+        return False
+
+    return True
+
+
+def write_json(file_path, data):
+    """
+    Writes given data into a JSON file atomically
+    :param file_path: str
+    :param data: object
+    :return: bool
+    """
+
+    return write_atomic(file_path, json.dumps(data, indent=4, sort_keys=True))
+
+
+def get_file_mode(file_path):
+    """
+    Returns the permissions of the given file or, if it does not exist, the default permissions of new files
+    Temporary files are only accessible by their owner, so files written through them use this mode
+    :param file_path: str
+    :return: int
+    """
+
+    try:
+        return stat.S_IMODE(os.stat(file_path).st_mode)
+    except (OSError, TypeError):
+        return 0o666 & ~_UMASK
+
+
+def get_file_mtime(file_path):
+    """
+    Returns modification time of the given file
+    :param file_path: str
+    :return: float or None, None if the file does not exist
+    """
+
+    try:
+        return os.path.getmtime(file_path)
+    except (OSError, TypeError):
+        return None
+
+
+def get_paths_fingerprint(paths, extensions=None, extra=None):
+    """
+    Returns a hash that changes when any of the directories of the given paths, or any of their files with the
+    given extensions, is modified
+    :param paths: list(str), root paths to check
+    :param extensions: list(str) or None, extensions of the files whose modification times are also checked
+    :param extra: list(str) or None, extra values that invalidate the fingerprint when changed (versions, etc)
+    :return: str
+    """
+
+    extensions = tuple(extensions or tuple())
+    hasher = hashlib.sha1()
+    for value in extra or list():
+        hasher.update(str(value).encode('utf-8'))
+
+    for root_path in paths:
+        if not root_path or not os.path.exists(root_path):
+            hasher.update('{}:missing'.format(root_path).encode('utf-8'))
+            continue
+        for dir_path, dir_names, file_names in os.walk(root_path):
+            dir_names.sort()
+            hasher.update('{}:{}'.format(dir_path, os.stat(dir_path).st_mtime).encode('utf-8'))
+            if not extensions:
+                continue
+            for file_name in sorted(file_names):
+                if not file_name.endswith(extensions):
+                    continue
+                file_path = os.path.join(dir_path, file_name)
+                file_stat = os.stat(file_path)
+                hasher.update('{}:{}:{}'.format(file_path, file_stat.st_mtime, file_stat.st_size).encode('utf-8'))
+
+    return hasher.hexdigest()
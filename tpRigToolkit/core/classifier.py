@@ -0,0 +1,189 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains the node classifier used by tpRigToolkit to retrieve the type used to name nodes
+Classification rules are declared as a list of dictionaries (that can be defined in tpRigToolkit-naming configuration
+file under the type_rules key). Rules are evaluated in order and each matching rule changes the type of the node, so
+later rules can refine the result of previous ones. Supported rule keys:
+    - type: str, type the node must have to match the rule
+    - shapes: bool, whether the node must have (or not) shapes
+    - shape_type: str, type of the first shape of the node
+    - message_type: str, type of one of the nodes connected to the message attribute of the node
+    - result: str, new type of the node. {shape_type} is replaced with the type of the first shape of the node
+"""
+
+from __future__ import print_function, division, absolute_import
+
+import threading
+
+from tpRigToolkit.core import cache
+
+DEFAULT_TYPE_RULES = [
+    {'type': 'transform', 'shapes': False, 'result': 'group'},
+    {'type': 'transform', 'shapes': True, 'result': '{shape_type}'},
+    {'type': 'joint', 'shape_type': 'nurbsCurve', 'result': 'controller'},
+    {'type': 'nurbsCurve', 'message_type': 'controller', 'result': 'controller'}
+]
+
+
+class TypeRule(object):
+    """
+    Class that defines a classification rule
+    """
+
+    __slots__ = ('node_type', 'shapes', 'shape_type', 'message_type', 'result')
+
+    def __init__(self, result, node_type=None, shapes=None, shape_type=None, message_type=None):
+        super(TypeRule, self).__init__()
+
+        self.result = result
+        self.node_type = node_type
+        self.shapes = shapes
+        self.shape_type = shape_type
+        self.message_type = message_type
+
+    @classmethod
+    def from_dict(cls, rule_dict):
+        """
+        Creates a new rule from the given dictionary
+        :param rule_dict: dict
+        :return: TypeRule
+        """
+
+        return cls(
+            rule_dict['result'], node_type=rule_dict.get('type', None), shapes=rule_dict.get('shapes', None),
+            shape_type=rule_dict.get('shape_type', None), message_type=rule_dict.get('message_type', None))
+
+    def apply(self, node_type, node_info):
+        """
+        Returns the type of the node after applying the rule
+        :param node_type: str, current type of the node
+        :param node_info: NodeInfo
+        :return: str
+        """
+
+        if not self.matches_node(node_type, node_info):
+            return node_type
+        if self.message_type is not None and self.message_type not in node_info.message_types:
+            return node_type
+
+        shape_types = node_info.shape_types
+
+        return self.result.format(shape_type=shape_types[0] if shape_types else '')
+
+    def matches_node(self, node_type, node_info):
+        """
+        Returns whether the type and the shapes of the given node match the rule. Connections are not checked
+        :param node_type: str, current type of the node
+        :param node_info: NodeInfo
+        :return: bool
+        """
+
+        shape_types = node_info.shape_types
+        if self.node_type is not None and node_type != self.node_type:
+            return False
+        if self.shapes is not None and bool(shape_types) != self.shapes:
+            return False
+        if self.shape_type is not None and (not shape_types or shape_types[0] != self.shape_type):
+            return False
+
+        return True
+
+
+class NodeClassifier(object):
+    """
+    Class that classifies nodes and caches the result for each node handle and scene generation
+    """
+
+    def __init__(self, rules=None, capacity=100000):
+        """
+        :param rules: list(dict) or None, classification rules. If not given, default ones are used
+        :param capacity: int, maximum number of classified nodes kept in memory
+        """
+
+        super(NodeClassifier, self).__init__()
+
+        self._rules = [TypeRule.from_dict(rule) for rule in (DEFAULT_TYPE_RULES if rules is None else rules)]
+        self._cache = cache.LRUCache(capacity)
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    @property
+    def generation(self):
+        return self._generation
+
+    def invalidate(self):
+        """
+        Increases scene generation, so all the cached classifications are discarded
+        Must be called when nodes are added or removed or when a scene is opened
+        """
+
+        with self._lock:
+            self._generation += 1
+        self._cache.clear()
+
+    def stats(self):
+        """
+        Returns hits and misses of the classifier cache
+        :return: dict
+        """
+
+        return self._cache.stats()
+
+    def get_cached(self, handle):
+        """
+        Returns the cached type of the node with the given handle in the current scene generation
+        :param handle: str
+        :return: str or None
+        """
+
+        return self._cache.get((handle, self._generation), None)
+
+    def classify(self, node_info):
+        """
+        Returns the type used to name the given node
+        :param node_info: NodeInfo
+        :return: str
+        """
+
+        return self._classify(node_info)[0]
+
+    def classify_nodes(self, node_infos):
+        """
+        Returns the type of all the given nodes and caches them
+        Nodes already classified in the current scene generation (the ones with a classified_type) are not
+        classified again
+        :param node_infos: list(NodeInfo)
+        :return: dict(str, str), type of each node handle
+        """
+
+        generation = self._generation
+        node_types = dict()
+        for node_info in node_infos:
+            node_type = node_info.classified_type
+            if node_type is None:
+                node_type, uses_connections = self._classify(node_info)
+                node_info.classified_type = node_type
+                # DCCs do not notify connection changes, so types that depend on connections are never cached
+                if not uses_connections:
+                    self._cache.put((node_info.handle, generation), node_type)
+            node_types[node_info.handle] = node_type
+
+        return node_types
+
+    def _classify(self, node_info):
+        """
+        Internal function that returns the type used to name the given node
+        :param node_info: NodeInfo
+        :return: tuple(str, bool), type of the node and whether the type depends on the connections of the node
+        """
+
+        node_type = node_info.node_type
+        uses_connections = False
+        for rule in self._rules:
+            if rule.message_type is not None and rule.matches_node(node_type, node_info):
+                uses_connections = True
+            node_type = rule.apply(node_type, node_info)
+
+        return node_type, uses_connections
@@ -0,0 +1,400 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains the chunked container file format used to store large tpRigToolkit data files
+A container stores a document as named sections. Each section is encoded as JSON and split in chunks that are
+compressed independently, so sections (and list sections chunk by chunk) can be read without loading the whole file:
+    - header: magic, format version and offset of the index
+    - chunks: section payloads
+    - index: metadata of the document and location, size and compression of each chunk
+"""
+
+from __future__ import print_function, division, absolute_import
+
+import os
+import json
+import zlib
+import struct
+import logging
+import tempfile
+from collections import OrderedDict
+
+from tpRigToolkit.core import cache
+
+LOGGER = logging.getLogger('tpRigToolkit-core')
+
+CONTAINER_MAGIC = b'TPRKC\x00'
+CONTAINER_VERSION = 1
+DOCUMENT_SECTION = 'data'
+COMPRESSIONS = (None, 'zlib')
+
+_HEADER = struct.Struct('>6sHQ')
+
+
+class ContainerWriter(object):
+    """
+    Class that writes a container file section by section
+    Chunks are written into disk as soon as they are added and the file only replaces the given file path once the
+    writer is closed
+    """
+
+    def __init__(self, file_path, metadata=None, compression='zlib', chunk_size=1000, compress_threshold=1024):
+        """
+        :param file_path: str
+        :param metadata: dict or None, extra data stored in the index of the container
+        :param compression: str or None, compression used by default in all sections. One of COMPRESSIONS
+        :param chunk_size: int, maximum number of items of a list stored in a single chunk
+        :param compress_threshold: int, chunks smaller than this size (in bytes) are not compressed
+        """
+
+        super(ContainerWriter, self).__init__()
+
+        if compression not in COMPRESSIONS:
+            raise ValueError('Not supported container compression: {}'.format(compression))
+
+        self._file_path = file_path
+        self._metadata = dict(metadata or dict())
+        self._compression = compression
+        self._chunk_size = max(1, chunk_size)
+        self._compress_threshold = compress_threshold
+        self._sections = OrderedDict()
+
+        directory = os.path.dirname(os.path.abspath(file_path))
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+        fd, self._temp_path = tempfile.mkstemp(prefix='.tmp', dir=directory)
+        self._fh = os.fdopen(fd, 'wb')
+        self._fh.write(_HEADER.pack(CONTAINER_MAGIC, CONTAINER_VERSION, 0))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    @property
+    def file_path(self):
+        return self._file_path
+
+    def add_section(self, name, value, compression=-1):
+        """
+        Adds a new section into the container. List values are split in chunks
+        :param name: str, unique name of the section
+        :param value: object, JSON serializable value
+        :param compression: str or None, compression of the section. If not given, writer compression is used
+        """
+
+        if self._fh is None:
+            raise ValueError('Container "{}" is already closed!'.format(self._file_path))
+        if name in self._sections:
+            raise ValueError('Container section "{}" already exists!'.format(name))
+        compression = self._compression if compression == -1 else compression
+        if compression not in COMPRESSIONS:
+            raise ValueError('Not supported container compression: {}'.format(compression))
+
+        is_list = isinstance(value, (list, tuple))
+        if is_list:
+            values = [list(value[i:i + self._chunk_size]) for i in range(0, len(value), self._chunk_size)]
+        else:
+            values = [value]
+
+        chunks = list()
+        for chunk_value in values:
+            chunks.append(self._write_chunk(chunk_value, compression))
+
+        self._sections[name] = {
+            'type': 'list' if is_list else 'value',
+            'count': len(value) if is_list else 1,
+            'chunks': chunks
+        }
+
+    def close(self):
+        """
+        Writes the index of the container and moves the file to its final path
+        """
+
+        if self._fh is None:
+            return
+
+        try:
+            index_offset = self._fh.tell()
+            index = {'metadata': self._metadata, 'sections': self._sections}
+            self._fh.write(_encode(index))
+            self._fh.seek(0)
+            self._fh.write(_HEADER.pack(CONTAINER_MAGIC, CONTAINER_VERSION, index_offset))
+            self._fh.close()
+            self._fh = None
+            os.chmod(self._temp_path, cache.get_file_mode(self._file_path))
+            if os.name == 'nt' and os.path.isfile(self._file_path):
+                os.remove(self._file_path)
+            os.rename(self._temp_path, self._file_path)
+        except Exception:
+            self.abort()
+            raise
+
+    def abort(self):
+        """
+        Discards the container. Given file path is not modified
+        """
+
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+        if os.path.isfile(self._temp_path):
+            os.remove(self._temp_path)
+
+    def _write_chunk(self, value, compression):
+        """
+        Internal function that encodes and writes the given value
+        :param value: object
+        :param compression: str or None
+        :return: list(int, int, str or None, int), offset, size, compression and number of items of the chunk
+        """
+
+        data = _encode(value)
+        if compression == 'zlib' and len(data) >= self._compress_threshold:
+            data = zlib.compress(data)
+        else:
+            compression = None
+        offset = self._fh.tell()
+        self._fh.write(data)
+
+        return [offset, len(data), compression, len(value) if isinstance(value, list) else 1]
+
+
+class ContainerReader(object):
+    """
+    Class that reads the sections of a container file. Only the header and the index are read when opened
+    """
+
+    def __init__(self, file_path):
+        """
+        :param file_path: str
+        """
+
+        super(ContainerReader, self).__init__()
+
+        self._file_path = file_path
+        self._fh = open(file_path, 'rb')
+        self.bytes_read = 0
+        try:
+            header = self._read(0, _HEADER.size)
+            if len(header) != _HEADER.size:
+                raise ValueError('File "{}" is not a valid container'.format(file_path))
+            magic, version, index_offset = _HEADER.unpack(header)
+            if magic != CONTAINER_MAGIC:
+                raise ValueError('File "{}" is not a valid container'.format(file_path))
+            if version > CONTAINER_VERSION:
+                raise ValueError('Container "{}" version {} is not supported'.format(file_path, version))
+            index = _decode(self._read(index_offset))
+        except Exception:
+            self.close()
+            raise
+
+        self._metadata = index.get('metadata', dict())
+        self._sections = index.get('sections', OrderedDict())
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    @property
+    def file_path(self):
+        return self._file_path
+
+    @property
+    def metadata(self):
+        return self._metadata
+
+    def close(self):
+        """
+        Closes container file
+        """
+
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+
+    def get_section_names(self):
+        """
+        Returns the names of all the sections of the container in the order they were written
+        :return: list(str)
+        """
+
+        return list(self._sections)
+
+    def has_section(self, name):
+        """
+        Returns whether the container has the given section
+        :param name: str
+        :return: bool
+        """
+
+        return name in self._sections
+
+    def get_section_info(self, name):
+        """
+        Returns the type, number of items and stored size of the given section
+        :param name: str
+        :return: dict
+        """
+
+        section = self._get_section(name)
+
+        return {
+            'type': section['type'],
+            'count': section['count'],
+            'chunks': len(section['chunks']),
+            'size': sum(chunk[1] for chunk in section['chunks'])
+        }
+
+    def read_section(self, name):
+        """
+        Returns the value of the given section
+        :param name: str
+        :return: object
+        """
+
+        section = self._get_section(name)
+        if section['type'] != 'list':
+            return self._read_chunk(section['chunks'][0])
+
+        return list(self.iter_section(name))
+
+    def iter_section(self, name):
+        """
+        Returns a generator that reads the items of the given list section chunk by chunk
+        :param name: str
+        :return: generator(object)
+        """
+
+        section = self._get_section(name)
+        if section['type'] != 'list':
+            yield self._read_chunk(section['chunks'][0])
+            return
+
+        for chunk in section['chunks']:
+            for item in self._read_chunk(chunk):
+                yield item
+
+    def _get_section(self, name):
+        section = self._sections.get(name, None)
+        if section is None:
+            raise KeyError('Container "{}" has no section "{}"'.format(self._file_path, name))
+
+        return section
+
+    def _read_chunk(self, chunk):
+        offset, size, compression, _ = chunk
+        data = self._read(offset, size)
+        if compression == 'zlib':
+            data = zlib.decompress(data)
+
+        return _decode(data)
+
+    def _read(self, offset, size=-1):
+        if self._fh is None:
+            raise ValueError('Container "{}" is already closed!'.format(self._file_path))
+        self._fh.seek(offset)
+        data = self._fh.read(size)
+        self.bytes_read += len(data)
+
+        return data
+
+
+def is_container(file_path):
+    """
+    Returns whether the given file is a container file
+    :param file_path: str
+    :return: bool
+    """
+
+    try:
+        with open(file_path, 'rb') as fh:
+            return fh.read(len(CONTAINER_MAGIC)) == CONTAINER_MAGIC
+    except (IOError, OSError, TypeError):
+        return False
+
+
+def write_document(file_path, document, metadata=None, **kwargs):
+    """
+    Writes given document into a container file
+    Each key of a dictionary document is stored as a section. Other documents are stored in a single section
+    :param file_path: str
+    :param document: object, JSON serializable document
+    :param metadata: dict or None
+    :param kwargs: dict, extra ContainerWriter arguments
+    """
+
+    metadata = dict(metadata or dict())
+    metadata['document'] = 'sections' if isinstance(document, dict) else 'value'
+    with ContainerWriter(file_path, metadata=metadata, **kwargs) as writer:
+        if isinstance(document, dict):
+            for name, value in document.items():
+                writer.add_section(name, value)
+        else:
+            writer.add_section(DOCUMENT_SECTION, document)
+
+
+def read_document(file_path, section_names=None):
+    """
+    Returns the document stored in the given file. Both container files and JSON files are supported
+    If section names are given, only those sections are read from container files
+    :param file_path: str
+    :param section_names: list(str) or None, sections to read. Ignored if the document is not split in sections
+    :return: object
+    """
+
+    if not is_container(file_path):
+        with open(file_path, 'r') as fh:
+            document = json.load(fh, object_pairs_hook=OrderedDict)
+        if section_names is not None and isinstance(document, dict):
+            document = OrderedDict((name, document[name]) for name in section_names if name in document)
+        return document
+
+    with ContainerReader(file_path) as reader:
+        if reader.metadata.get('document', 'sections') != 'sections':
+            return reader.read_section(DOCUMENT_SECTION)
+        if section_names is None:
+            section_names = reader.get_section_names()
+        return OrderedDict(
+            (name, reader.read_section(name)) for name in section_names if reader.has_section(name))
+
+
+def convert_json_file(json_file, container_file=None, **kwargs):
+    """
+    Converts given JSON file into a container file
+    :param json_file: str
+    :param container_file: str or None, path of the new container. If not given, JSON file is replaced
+    :param kwargs: dict, extra ContainerWriter arguments
+    :return: str, path of the container file
+    """
+
+    container_file = container_file or json_file
+    if is_container(json_file):
+        LOGGER.info('File "{}" is already a container file'.format(json_file))
+        return json_file
+
+    with open(json_file, 'r') as fh:
+        document = json.load(fh, object_pairs_hook=OrderedDict)
+    write_document(container_file, document, **kwargs)
+
+    return container_file
+
+
+def _encode(value):
+    data = json.dumps(value, separators=(',', ':'))
+    if not isinstance(data, bytes):
+        data = data.encode('utf-8')
+
+    return data
+
+
+def _decode(data):
+    return json.loads(data.decode('utf-8'), object_pairs_hook=OrderedDict)
@@ -13,11 +13,13 @@ import logging
 from Qt.QtCore import QSize
 
 from tpDcc import dcc
-from tpDcc.libs.python import settings, path as path_utils
+from tpDcc.libs.python import path as path_utils
 from tpDcc.libs.qt.core import qtutils
 from tpDcc.libs.qt.widgets import buttons
 from tpDcc.libs.qt.widgets.library import manager, items, loadwidget
 
+from tpRigToolkit.core import batch, settingsstore
+
 # from tpRigToolkit.managers import data
 
 LOGGER = logging.getLogger('tpRigToolkit-core')
@@ -126,15 +128,11 @@ class DataItem(items.BaseItem, object):
     def settings(self):
         """
         Returns tpRigToolkit library settings file
-        :return: JSONSettings
+        Settings are shared by all items, so settings file is only read again when it is modified
+        :return: SettingsStore
         """
 
-        library_settings_root_path = os.getenv('APPDATA') or os.getenv('HOME')
-        library_settings_path = os.path.join(library_settings_root_path, 'tpRigToolkit', 'library.json')
-        library_settings = settings.JSONSettings(
-            directory=os.path.dirname(library_settings_path), filename=os.path.basename(library_settings_path))
-
-        return library_settings
+        return settingsstore.get_library_settings()
 
     def write(self, path, objects, icon_path='', sequence_path='', **options):
         """
@@ -244,6 +242,71 @@ class DataItem(items.BaseItem, object):
 
         return self.data_object().reference_data(stored_path)
 
+    def get_export_task(self, comment='', objects=None, create_version=False):
+        """
+        Returns the batch task used to export the data of this item
+        Only data classes that split their export in collect_data (scene access) and write_data (disk access)
+        functions write their data in a worker thread. Any other data class (none of the current data classes
+        implements the split) is exported serially in the main thread with its export_data function
+        :param comment: str
+        :param objects: list(str) or None
+        :param create_version: bool
+        :return: BatchTask
+        """
+
+        if not self._has_data_functions('collect_data', 'write_data'):
+            def _export():
+                self._check_data_path()
+                return self.data_object().export_data(
+                    comment=comment, objects=objects, create_version=create_version)
+            return batch.BatchTask(self.name(), prepare=_export)
+
+        def _prepare():
+            self._check_data_path()
+            data_object = self.data_object()
+            return data_object, data_object.collect_data(objects=objects)
+
+        def _process(prepared):
+            data_object, data = prepared
+            return data_object.write_data(data, comment=comment, create_version=create_version)
+
+        return batch.BatchTask(self.name(), prepare=_prepare, process=_process)
+
+    def get_import_task(self, objects=None):
+        """
+        Returns the batch task used to import the data of this item into current scene
+        Only data classes that split their import in read_data (disk access) and apply_data (scene access) functions
+        read their data in a worker thread. Any other data class (none of the current data classes implements the
+        split) is imported serially in the main thread with its import_data function
+        :param objects: list(str) or None, objects data is imported into. If None, selected nodes are used
+        :return: BatchTask
+        """
+
+        if not self._has_data_functions('read_data', 'apply_data'):
+            def _import():
+                stored_path = self._check_data_path()
+                import_objects = dcc.selected_nodes() if objects is None else objects
+                try:
+                    return self.data_object().import_data(stored_path, objects=import_objects)
+                except TypeError:
+                    return self.data_object().import_data(stored_path)
+            return batch.BatchTask(self.name(), prepare=_import)
+
+        def _prepare():
+            stored_path = self._check_data_path()
+            import_objects = dcc.selected_nodes() if objects is None else objects
+            return self.data_object(), stored_path, import_objects
+
+        def _process(prepared):
+            data_object, stored_path, import_objects = prepared
+            return data_object, data_object.read_data(stored_path), import_objects
+
+        def _finish(processed):
+            data_object, data, import_objects = processed
+            return data_object.apply_data(data, objects=import_objects)
+
+        return batch.BatchTask(self.name(), prepare=_prepare, process=_process, finish=_finish)
+
     def data_class(self):
         """
         Returns the data class for this item
@@ -282,3 +345,27 @@ class DataItem(items.BaseItem, object):
             self._data_object.set_directory(path)
 
         return self._data_object
+
+    def _check_data_path(self):
+        """
+        Internal function that checks that the path of the item and the file of its data object are the same
+        :return: str, stored path
+        """
+
+        stored_path = path_utils.clean_path(os.path.join(self.path(), self.name()))
+        data_object_path = path_utils.clean_path(self.data_object().get_file())
+        if stored_path != data_object_path:
+            raise ValueError('Stored Path and Data Path are different: {}\n{}'.format(stored_path, data_object_path))
+
+        return stored_path
+
+    def _has_data_functions(self, *function_names):
+        """
+        Internal function that returns whether the data class of this item implements all the given functions
+        :param function_names: list(str)
+        :return: bool
+        """
+
+        data_class = self.data_class()
+
+        return all(callable(getattr(data_class, function_name, None)) for function_name in function_names)
@@ -0,0 +1,254 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains cached discovery of data classes for tpRigToolkit
+Discovery records the classes each module file provides, keyed by module path and modification time:
+    - In memory, so unchanged modules are never imported or inspected again in the same session.
+    - On disk, so new sessions only import the modules that provide classes.
+Before importing a module for the first time, its source is statically scanned and modules that do not define any
+class that inherits from other class are skipped. Packages are always imported, so their submodules can be imported
+"""
+
+from __future__ import print_function, division, absolute_import
+
+import os
+import ast
+import sys
+import inspect
+import logging
+import pkgutil
+import threading
+import traceback
+
+from tpRigToolkit.core import cache
+
+LOGGER = logging.getLogger('tpRigToolkit-core')
+
+DISCOVERY_VERSION = 1
+
+
+class ModuleInfo(object):
+    """
+    Class that stores the name and location of a module that has not been imported yet
+    """
+
+    __slots__ = ('mod_name', 'file_path', 'finder', 'is_package')
+
+    def __init__(self, mod_name, file_path, finder, is_package=False):
+        super(ModuleInfo, self).__init__()
+
+        self.mod_name = mod_name
+        self.file_path = file_path
+        self.finder = finder
+        self.is_package = is_package
+
+
+class ClassDiscovery(object):
+    """
+    Class that finds the subclasses of a base class defined in the modules of a directory
+    """
+
+    def __init__(self, name, base_class, cache_directory=None):
+        """
+        :param name: str, name of the discovery. Used to name the discovery cache file
+        :param base_class: type, only subclasses of this class are discovered
+        :param cache_directory: str or None, directory where discovered class names are stored
+        """
+
+        super(ClassDiscovery, self).__init__()
+
+        self._base_class = base_class
+        self._file_path = os.path.join(
+            cache_directory or cache.get_cache_directory(), '{}_discovery.json'.format(name))
+        self._classes = dict()
+        self._entries = None
+        self._dirty = False
+        self._lock = threading.RLock()
+        self.imported = 0
+        self.skipped = 0
+
+    @property
+    def file_path(self):
+        return self._file_path
+
+    def load_classes(self, directory, force=False):
+        """
+        Returns all the subclasses of the base class found in the modules of the given directory
+        :param directory: str
+        :param force: bool, whether modules are imported again even if they were not modified
+        :return: list(type)
+        """
+
+        if directory is None or not os.path.isdir(directory):
+            LOGGER.warning('Data Path {} does not exists!'.format(directory))
+            return list()
+
+        with self._lock:
+            found_classes = list()
+            for module_info in iter_modules(directory):
+                found_classes.extend(self._get_module_classes(module_info, force=force))
+            self._save()
+
+        return found_classes
+
+    def clear(self):
+        """
+        Removes all discovered classes, both from memory and from disk
+        """
+
+        with self._lock:
+            self._classes.clear()
+            self._entries = dict()
+            self._dirty = False
+            if os.path.isfile(self._file_path):
+                os.remove(self._file_path)
+
+    def _get_module_classes(self, module_info, force=False):
+        file_path = module_info.file_path
+        file_stat = _get_file_stat(file_path)
+        loaded_stat, loaded_classes = self._classes.get(file_path, (None, None))
+        if not force and file_stat and loaded_stat == file_stat:
+            return loaded_classes
+        # Modules modified after being imported in this session are imported again
+        force = force or loaded_stat is not None
+
+        # Class names stored in disk cache are only valid if the module was not modified
+        entry = self._get_entries().get(file_path, None)
+        class_names = None
+        if entry and file_stat and entry.get('stat') == list(file_stat):
+            class_names = entry.get('classes', list())
+        elif file_stat and not may_define_subclasses(file_path):
+            class_names = list()
+        if class_names is not None and not class_names:
+            self._set_entry(file_path, file_stat, class_names)
+            self._classes[file_path] = (file_stat, list())
+            if module_info.is_package:
+                # Packages are always imported, so the submodules found after them can import their package
+                load_module(module_info, force=force)
+                self.imported += 1
+            else:
+                self.skipped += 1
+            return list()
+
+        module = load_module(module_info, force=force)
+        self.imported += 1
+        if module is None:
+            return list()
+        if class_names is not None:
+            members = [(class_name, getattr(module, class_name, None)) for class_name in class_names]
+        else:
+            members = inspect.getmembers(module, inspect.isclass)
+        found_classes = [
+            (class_name, obj) for class_name, obj in members
+            if inspect.isclass(obj) and obj is not self._base_class and issubclass(obj, self._base_class)]
+
+        if file_stat:
+            self._set_entry(file_path, file_stat, [class_name for class_name, _ in found_classes])
+            self._classes[file_path] = (file_stat, [obj for _, obj in found_classes])
+
+        return [obj for _, obj in found_classes]
+
+    def _get_entries(self):
+        if self._entries is None:
+            cache_data = cache.read_json(self._file_path) or dict()
+            if cache_data.get('version') != DISCOVERY_VERSION:
+                cache_data = dict()
+            self._entries = cache_data.get('modules', None) or dict()
+
+        return self._entries
+
+    def _set_entry(self, file_path, file_stat, class_names):
+        entries = self._get_entries()
+        entry = {'stat': list(file_stat), 'classes': class_names}
+        if entries.get(file_path, None) != entry:
+            entries[file_path] = entry
+            self._dirty = True
+
+    def _save(self):
+        if not self._dirty:
+            return
+        cache.write_json(self._file_path, {'version': DISCOVERY_VERSION, 'modules': self._entries})
+        self._dirty = False
+
+
+def iter_modules(directory, prefix=''):
+    """
+    Returns all the modules and packages found in the given directory without importing them
+    :param directory: str
+    :param prefix: str, prefix added to module names
+    :return: generator(ModuleInfo)
+    """
+
+    for finder, mod_name, is_package in pkgutil.iter_modules([directory]):
+        if is_package:
+            package_path = os.path.join(directory, mod_name)
+            yield ModuleInfo(prefix + mod_name, os.path.join(package_path, '__init__.py'), finder, is_package=True)
+            for module_info in iter_modules(package_path, prefix='{}{}.'.format(prefix, mod_name)):
+                yield module_info
+        else:
+            yield ModuleInfo(prefix + mod_name, os.path.join(directory, '{}.py'.format(mod_name)), finder)
+
+
+def may_define_subclasses(file_path):
+    """
+    Returns whether the given Python file defines any class that inherits from other class (other than object)
+    This is a conservative check: files that cannot be read or parsed are considered to define subclasses
+    :param file_path: str
+    :return: bool
+    """
+
+    try:
+        with open(file_path, 'rb') as fh:
+            tree = ast.parse(fh.read(), filename=file_path)
+    except Exception:
+        return True
+
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.ClassDef):
+            continue
+        for base in node.bases:
+            if not isinstance(base, ast.Name) or base.id != 'object':
+                return True
+
+    return False
+
+
+def load_module(module_info, force=False):
+    """
+    Imports the given module
+    :param module_info: ModuleInfo
+    :param force: bool, whether the module is imported again if it was already imported
+    :return: module or None
+    """
+
+    mod_name = module_info.mod_name
+    if not force and mod_name in sys.modules and getattr(sys.modules[mod_name], '__file__', None) and \
+            os.path.normcase(os.path.abspath(sys.modules[mod_name].__file__)) == os.path.normcase(
+            os.path.abspath(module_info.file_path)):
+        return sys.modules[mod_name]
+
+    try:
+        finder = module_info.finder
+        if hasattr(finder, 'find_spec'):
+            import importlib.util
+            spec = finder.find_spec(mod_name)
+            module = importlib.util.module_from_spec(spec)
+            sys.modules[mod_name] = module
+            spec.loader.exec_module(module)
+            return module
+        return finder.find_module(mod_name).load_module(mod_name)
+    except Exception as exc:
+        sys.modules.pop(mod_name, None)
+        LOGGER.warning('Aborting loading Data Class {} : {}'.format(mod_name, str(exc)))
+        LOGGER.debug(traceback.format_exc())
+        return None
+
+
+def _get_file_stat(file_path):
+    try:
+        file_stat = os.stat(file_path)
+    except (OSError, TypeError):
+        return None
+
+    return file_stat.st_mtime, file_stat.st_size
@@ -0,0 +1,214 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains the background directory indexer used by tpRigToolkit data manager
+Directories are indexed one by one in a background thread and each result is published as soon as its directory
+finishes. After the initial pass, directories are watched and only the directories that change are indexed again
+"""
+
+from __future__ import print_function, division, absolute_import
+
+import logging
+import threading
+import traceback
+from collections import OrderedDict
+
+from tpRigToolkit.core import cache
+
+LOGGER = logging.getLogger('tpRigToolkit-core')
+
+
+class BackgroundIndexer(object):
+    """
+    Class that indexes directories in a background thread
+    """
+
+    def __init__(self, index_fn, directories=None, on_indexed=None, extensions=None, poll_interval=2.0,
+                 name='tpRigToolkit-indexer'):
+        """
+        :param index_fn: callable, function that receives a directory and returns its index result
+        :param directories: list(str) or None, directories to index
+        :param on_indexed: callable or None, function called from the indexer thread with a directory and its result
+            each time a directory is indexed
+        :param extensions: list(str) or None, extensions of the files whose modifications trigger a new index of
+            their directory
+        :param poll_interval: float, time (in seconds) between two checks of directory changes. If 0 or less,
+            directories are not watched after the initial pass
+        :param name: str, name of the indexer thread
+        """
+
+        super(BackgroundIndexer, self).__init__()
+
+        self._index_fn = index_fn
+        self._on_indexed = on_indexed
+        self._extensions = tuple(extensions or tuple())
+        self._poll_interval = poll_interval
+        self._name = name
+        self._directories = list()
+        self._pending = list()
+        self._results = OrderedDict()
+        self._fingerprints = dict()
+        self._lock = threading.RLock()
+        self._wake_event = threading.Event()
+        self._idle_event = threading.Event()
+        self._stop_event = threading.Event()
+        self._thread = None
+
+        self.add_directories(directories or list())
+
+    @property
+    def directories(self):
+        return list(self._directories)
+
+    def is_running(self):
+        """
+        Returns whether the indexer thread is running
+        :return: bool
+        """
+
+        return self._thread is not None and self._thread.is_alive()
+
+    def is_indexing(self):
+        """
+        Returns whether there are directories waiting to be indexed
+        :return: bool
+        """
+
+        return not self._idle_event.is_set()
+
+    def start(self):
+        """
+        Starts indexer thread
+        """
+
+        with self._lock:
+            if self.is_running():
+                return
+            self._stop_event.clear()
+            self._thread = threading.Thread(target=self._run, name=self._name)
+            self._thread.daemon = True
+            self._thread.start()
+
+    def stop(self, timeout=None):
+        """
+        Stops indexer thread
+        :param timeout: float or None
+        """
+
+        self._stop_event.set()
+        self._wake_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+        self._thread = None
+
+    def wait(self, timeout=None):
+        """
+        Waits until all pending directories are indexed
+        :param timeout: float or None
+        :return: bool, True if all pending directories were indexed
+        """
+
+        return self._idle_event.wait(timeout)
+
+    def add_directories(self, directories):
+        """
+        Adds new directories to index. Directories already added are ignored
+        :param directories: list(str)
+        """
+
+        with self._lock:
+            for directory in directories:
+                if directory in self._directories:
+                    continue
+                self._directories.append(directory)
+                self._pending.append(directory)
+            if self._pending:
+                self._idle_event.clear()
+                self._wake_event.set()
+
+    def refresh(self, directory=None):
+        """
+        Forces a new index of the given directory (or of all the directories)
+        :param directory: str or None
+        """
+
+        with self._lock:
+            for indexed_directory in ([directory] if directory else self._directories):
+                if indexed_directory in self._directories and indexed_directory not in self._pending:
+                    self._pending.append(indexed_directory)
+            if self._pending:
+                self._idle_event.clear()
+                self._wake_event.set()
+
+    def results(self):
+        """
+        Returns the results of all the directories indexed until now
+        :return: OrderedDict(str, object)
+        """
+
+        with self._lock:
+            return OrderedDict(
+                (directory, self._results[directory]) for directory in self._directories if directory in self._results)
+
+    def index_pending(self):
+        """
+        Indexes all pending directories in the calling thread
+        """
+
+        while True:
+            with self._lock:
+                if not self._pending:
+                    self._idle_event.set()
+                    return
+                directory = self._pending.pop(0)
+            self._index_directory(directory)
+
+    def check_changes(self):
+        """
+        Adds to pending directories all the directories modified since they were indexed
+        :return: list(str), modified directories
+        """
+
+        modified = list()
+        for directory in self.directories:
+            fingerprint = self._fingerprints.get(directory, None)
+            if fingerprint is not None and fingerprint != self._get_fingerprint(directory):
+                modified.append(directory)
+        for directory in modified:
+            self.refresh(directory)
+
+        return modified
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            self.index_pending()
+            self._wake_event.wait(self._poll_interval if self._poll_interval > 0 else None)
+            self._wake_event.clear()
+            if self._stop_event.is_set():
+                break
+            if self._poll_interval > 0:
+                self.check_changes()
+
+    def _index_directory(self, directory):
+        # Fingerprint is computed before indexing, so changes done while indexing are detected in next check
+        fingerprint = self._get_fingerprint(directory)
+        try:
+            result = self._index_fn(directory)
+        except Exception as exc:
+            LOGGER.warning('Impossible to index directory "{}": {}'.format(directory, exc))
+            LOGGER.debug(traceback.format_exc())
+            return
+
+        with self._lock:
+            self._results[directory] = result
+            self._fingerprints[directory] = fingerprint
+        if self._on_indexed:
+            try:
+                self._on_indexed(directory, result)
+            except Exception as exc:
+                LOGGER.warning('Error while publishing index of directory "{}": {}'.format(directory, exc))
+                LOGGER.debug(traceback.format_exc())
+
+    def _get_fingerprint(self, directory):
+        return cache.get_paths_fingerprint([directory], extensions=self._extensions)
@@ -0,0 +1,184 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains implementation for lazy loading of tpRigToolkit tools
+Only lightweight tool stubs (id, label, icon and menu entry) are registered during startup. The real tool module is
+imported and registered the first time the tool is launched
+"""
+
+from __future__ import print_function, division, absolute_import
+
+import os
+import logging
+import threading
+from collections import OrderedDict
+
+LOGGER = logging.getLogger('tpRigToolkit-core')
+
+
+class ToolStub(object):
+    """
+    Class that holds the minimum information needed to show a tool in the menus without importing it
+    """
+
+    def __init__(self, tool_id, name, label=None, icon=None, menu=None):
+        super(ToolStub, self).__init__()
+
+        self.id = tool_id
+        self.name = name
+        self.label = label or name.replace('_', ' ').title()
+        self.icon = icon or 'tpDcc'
+        self.menu = menu
+        self.loaded = False
+
+    def __repr__(self):
+        return '<{}: {} ({})>'.format(self.__class__.__name__, self.id, 'loaded' if self.loaded else 'stub')
+
+
+class LazyToolsRegistry(object):
+    """
+    Class that stores tool stubs and loads the real tools on demand
+    """
+
+    def __init__(self, load_fn):
+        """
+        :param load_fn: callable, function called with the list of tool names that need to be loaded
+        """
+
+        super(LazyToolsRegistry, self).__init__()
+
+        self._load_fn = load_fn
+        self._stubs = OrderedDict()
+        self._names = dict()
+        self._lock = threading.RLock()
+
+    def stubs(self):
+        """
+        Returns all registered stubs
+        :return: list(ToolStub)
+        """
+
+        return list(self._stubs.values())
+
+    def register_stub(self, stub):
+        """
+        Registers given tool stub
+        :param stub: ToolStub
+        """
+
+        self._stubs[stub.id] = stub
+        self._names[stub.name] = stub.id
+
+    def get_stub(self, tool_id):
+        """
+        Returns stub with given tool ID or tool name
+        :param tool_id: str
+        :return: ToolStub or None
+        """
+
+        return self._stubs.get(self._names.get(tool_id, tool_id), None)
+
+    def is_loaded(self, tool_id):
+        """
+        Returns whether the tool with given ID is already loaded or not
+        Tools without stubs are considered loaded
+        :param tool_id: str
+        :return: bool
+        """
+
+        stub = self.get_stub(tool_id)
+
+        return stub.loaded if stub else True
+
+    def ensure_loaded(self, tool_id):
+        """
+        Loads the real tool of the given stub if it is not loaded yet
+        :param tool_id: str
+        :return: bool, True if the tool is loaded; False otherwise
+        """
+
+        stub = self.get_stub(tool_id)
+        if not stub or stub.loaded:
+            return True
+
+        with self._lock:
+            if stub.loaded:
+                return True
+            LOGGER.info('Loading tool on first use: {}'.format(stub.id))
+            try:
+                self._load_fn([stub.name])
+            except Exception as exc:
+                LOGGER.error('Impossible to load tool "{}": {}'.format(stub.id, exc))
+                return False
+            stub.loaded = True
+
+        return True
+
+    def wrap_launcher(self, launch_fn):
+        """
+        Returns a version of the given launch function that loads the real tool before launching it
+        Tools that cannot be loaded are not launched
+        :param launch_fn: callable, function whose first argument is a tool ID
+        :return: callable
+        """
+
+        def _launch(tool_id, *args, **kwargs):
+            if not self.ensure_loaded(tool_id):
+                LOGGER.warning('Tool "{}" is not launched because it could not be loaded'.format(tool_id))
+                return None
+            return launch_fn(tool_id, *args, **kwargs)
+
+        _launch.__wrapped__ = launch_fn
+
+        return _launch
+
+    def install(self, tools_manager, method_name='launch_tool_by_id'):
+        """
+        Installs the registry in the given tools manager instance so launching a tool loads it first
+        :param tools_manager: object
+        :param method_name: str
+        """
+
+        launch_fn = getattr(tools_manager, method_name)
+        if getattr(launch_fn, '__wrapped__', None) is not None:
+            launch_fn = launch_fn.__wrapped__
+
+        setattr(tools_manager, method_name, self.wrap_launcher(launch_fn))
+
+
+def get_toolsets_menus(toolsets_path):
+    """
+    Returns the menu path of all tools defined in the toolset files located in the given path
+    :param toolsets_path: str
+    :return: dict(str, list(str)), maps tool IDs with the labels of the menus they belong to
+    """
+
+    import yaml
+
+    tool_menus = dict()
+
+    def _walk(items, parents):
+        for item in items or list():
+            if not isinstance(item, dict):
+                continue
+            if item.get('type', 'tool') in ('tool', 'toolset') and item.get('id'):
+                tool_menus.setdefault(item['id'], parents)
+            if item.get('type') == 'menu':
+                _walk(item.get('children'), parents + [item.get('label', '')])
+
+    if not toolsets_path or not os.path.isdir(toolsets_path):
+        return tool_menus
+
+    for file_name in sorted(os.listdir(toolsets_path)):
+        if not file_name.endswith('.toolset'):
+            continue
+        try:
+            with open(os.path.join(toolsets_path, file_name), 'r') as fh:
+                toolset_data = yaml.safe_load(fh) or dict()
+        except Exception as exc:
+            LOGGER.warning('Impossible to read toolset file "{}": {}'.format(file_name, exc))
+            continue
+        _walk(toolset_data.get('menu'), list())
+
+    return tool_menus
@@ -0,0 +1,244 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains logging utilities for tpRigToolkit
+"""
+
+from __future__ import print_function, division, absolute_import
+
+import os
+import io
+import atexit
+import weakref
+import logging
+import threading
+
+try:
+    import queue
+except ImportError:
+    import Queue as queue
+
+ASYNC_LOGGING_ENV = 'TPRIGTOOLKIT_ASYNC_LOGGING'
+
+_STOP = object()
+_HANDLERS = weakref.WeakSet()
+
+
+class AsyncFileHandler(logging.Handler, object):
+    """
+    Logging handler that formats records in the calling thread and writes them into a file from a background thread
+    Lines are written in batches and the file is rotated when it reaches the given size
+    """
+
+    def __init__(
+            self, filename, mode='a', max_bytes=0, backup_count=0, encoding=None, flush_interval=0.5, batch_size=1024):
+        """
+        :param filename: str, path of the log file
+        :param mode: str, mode used to open the file the first time
+        :param max_bytes: int, size (in bytes) the file can reach before being rotated. If 0, file is never rotated
+        :param backup_count: int, number of rotated files to keep
+        :param encoding: str or None
+        :param flush_interval: float, maximum time (in seconds) a line can wait before being written
+        :param batch_size: int, maximum number of lines written in a single write call
+        """
+
+        super(AsyncFileHandler, self).__init__()
+
+        self.baseFilename = os.path.abspath(filename)
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.encoding = encoding or 'utf-8'
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+
+        self._mode = mode
+        self._stream = None
+        self._queue = queue.Queue()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name='tpRigToolkit-logging')
+        self._thread.daemon = True
+        self._thread.start()
+
+        _HANDLERS.add(self)
+
+    def emit(self, record):
+        """
+        Overrides base logging.Handler emit function
+        Only formats the record, writing is done in the background thread
+        :param record: LogRecord
+        """
+
+        if self._closed:
+            return
+
+        try:
+            self._queue.put(self.format(record))
+        except Exception:
+            self.handleError(record)
+
+    def flush(self):
+        """
+        Overrides base logging.Handler flush function
+        Blocks until all queued lines are written into disk
+        """
+
+        if self._closed or not self._thread.is_alive():
+            return
+
+        flushed = threading.Event()
+        self._queue.put(flushed)
+        flushed.wait()
+
+    def close(self):
+        """
+        Overrides base logging.Handler close function
+        Writes all pending lines and stops background thread
+        """
+
+        if self._closed:
+            return
+
+        self._closed = True
+        if self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join()
+        super(AsyncFileHandler, self).close()
+
+    def _open(self):
+        directory = os.path.dirname(self.baseFilename)
+        if directory and not os.path.isdir(directory):
+            os.makedirs(directory)
+
+        return io.open(self.baseFilename, self._mode, encoding=self.encoding)
+
+    def _run(self):
+        """
+        Internal function executed by the background thread that writes queued lines
+        """
+
+        running = True
+        while running:
+            try:
+                item = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                continue
+
+            lines = list()
+            events = list()
+            while True:
+                if item is _STOP:
+                    running = False
+                elif isinstance(item, threading.Event):
+                    events.append(item)
+                else:
+                    lines.append(item)
+                if not running or len(lines) >= self.batch_size:
+                    break
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+
+            if lines:
+                self._write(lines)
+            for event in events:
+                event.set()
+
+        if self._stream:
+            self._stream.close()
+            self._stream = None
+
+    def _write(self, lines):
+        """
+        Internal function that writes given lines into disk rotating the file if necessary
+        :param lines: list(str)
+        """
+
+        try:
+            if self._stream is None:
+                self._stream = self._open()
+                self._mode = 'a'
+            data = u'\n'.join(lines) + u'\n'
+            # Rotation size is measured in bytes, so non ASCII characters are counted with their encoded length
+            size = len(data.encode(self.encoding))
+            if self.max_bytes > 0 and self._stream.tell() + size > self.max_bytes and self._stream.tell() > 0:
+                self._rollover()
+            self._stream.write(data)
+            self._stream.flush()
+        except Exception as exc:
+            logging.getLogger('tpRigToolkit-core').debug('Impossible to write log lines: {}'.format(exc))
+
+    def _rollover(self):
+        """
+        Internal function that rotates log files
+        """
+
+        if self._stream:
+            self._stream.close()
+            self._stream = None
+
+        if self.backup_count > 0:
+            for i in range(self.backup_count - 1, 0, -1):
+                source = '{}.{}'.format(self.baseFilename, i)
+                target = '{}.{}'.format(self.baseFilename, i + 1)
+                if os.path.exists(source):
+                    if os.path.exists(target):
+                        os.remove(target)
+                    os.rename(source, target)
+            target = '{}.1'.format(self.baseFilename)
+            if os.path.exists(target):
+                os.remove(target)
+            if os.path.exists(self.baseFilename):
+                os.rename(self.baseFilename, target)
+
+        self._mode = 'w'
+        self._stream = self._open()
+        self._mode = 'a'
+
+
+@atexit.register
+def _close_handlers():
+    """
+    Internal function that writes pending lines of all asynchronous file handlers when the interpreter exits
+    Handlers are stored in a weak set so closed handlers are not kept alive until exit
+    """
+
+    for handler in list(_HANDLERS):
+        handler.close()
+
+
+def is_async_logging_enabled():
+    """
+    Returns whether asynchronous logging is enabled through TPRIGTOOLKIT_ASYNC_LOGGING environment variable
+    :return: bool
+    """
+
+    return os.environ.get(ASYNC_LOGGING_ENV, '').lower() in ('1', 'true', 'yes')
+
+
+def make_file_handlers_async(logger, **kwargs):
+    """
+    Replaces all the file handlers of the given logger with asynchronous file handlers writing into the same files
+    :param logger: Logger
+    :param kwargs: dict, extra arguments passed to AsyncFileHandler
+    :return: list(AsyncFileHandler), new handlers
+    """
+
+    async_handlers = list()
+    for handler in list(logger.handlers):
+        if isinstance(handler, AsyncFileHandler) or not isinstance(handler, logging.FileHandler):
+            continue
+        async_handler = AsyncFileHandler(
+            handler.baseFilename, mode=getattr(handler, 'mode', 'a'), max_bytes=getattr(handler, 'maxBytes', 0),
+            backup_count=getattr(handler, 'backupCount', 0), encoding=getattr(handler, 'encoding', None), **kwargs)
+        async_handler.setLevel(handler.level)
+        async_handler.setFormatter(handler.formatter)
+        for log_filter in handler.filters:
+            async_handler.addFilter(log_filter)
+        logger.removeHandler(handler)
+        handler.close()
+        logger.addHandler(async_handler)
+        async_handlers.append(async_handler)
+
+    return async_handlers
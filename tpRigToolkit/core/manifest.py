@@ -0,0 +1,113 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains implementation for tpRigToolkit startup manifest
+The manifest stores all the information tpRigToolkit discovers from disk during startup (configuration files, tools,
+toolsets, menus and resources) so warm launches do not need to scan the file system again
+"""
+
+from __future__ import print_function, division, absolute_import
+
+import os
+import sys
+import fnmatch
+import logging
+
+from tpRigToolkit.core import cache
+
+LOGGER = logging.getLogger('tpRigToolkit-core')
+
+MANIFEST_VERSION = 1
+WATCHED_EXTENSIONS = ('.yml', '.yaml', '.toolset', '.json')
+
+
+class StartupManifest(object):
+    """
+    Class that handles the startup manifest cache file
+    """
+
+    def __init__(self, name='startup', cache_directory=None):
+        super(StartupManifest, self).__init__()
+
+        self._file_path = os.path.join(cache_directory or cache.get_cache_directory(), '{}_manifest.json'.format(name))
+
+    @property
+    def file_path(self):
+        return self._file_path
+
+    @staticmethod
+    def get_fingerprint(paths, versions=None):
+        """
+        Returns the fingerprint used to validate the manifest
+        :param paths: list(str), package directories whose modification times validate the manifest
+        :param versions: list(str), package versions that validate the manifest
+        :return: str
+        """
+
+        extra = [MANIFEST_VERSION, sys.version_info[:2]] + list(versions or list())
+
+        return cache.get_paths_fingerprint(paths, extensions=WATCHED_EXTENSIONS, extra=extra)
+
+    def load(self, fingerprint):
+        """
+        Returns manifest data if the manifest exists and it is still valid
+        :param fingerprint: str
+        :return: dict or None
+        """
+
+        manifest_data = cache.read_json(self._file_path)
+        if not manifest_data or manifest_data.get('fingerprint') != fingerprint:
+            return None
+
+        LOGGER.debug('Loaded startup manifest: {}'.format(self._file_path))
+
+        return manifest_data.get('data', None)
+
+    def save(self, fingerprint, data):
+        """
+        Stores given manifest data
+        :param fingerprint: str
+        :param data: dict
+        :return: bool
+        """
+
+        return cache.write_json(self._file_path, {'fingerprint': fingerprint, 'data': data})
+
+    def clear(self):
+        """
+        Removes manifest file from disk
+        """
+
+        if os.path.isfile(self._file_path):
+            os.remove(self._file_path)
+
+
+def get_config_modules(config_path, environments=('development', 'production'), config_extension='.yml'):
+    """
+    Returns the module names of the configuration files that tpDcc register_package_configs function registers for the
+    given path, so warm launches register the same configurations as cold ones
+    As tpDcc does, all the configuration files found recursively in the given path are registered for all the
+    environments using their base name as module name
+    :param config_path: str
+    :param environments: tuple(str)
+    :param config_extension: str
+    :return: dict(str, list(str)), maps environment names with their configuration module names
+    """
+
+    if not config_extension.startswith('.'):
+        config_extension = '.{}'.format(config_extension)
+
+    config_modules = dict()
+    if not config_path or not os.path.isdir(config_path):
+        return config_modules
+
+    for environment in environments:
+        config_files = list()
+        for _, _, file_names in os.walk(config_path):
+            config_files.extend(fnmatch.filter(file_names, '*{}'.format(config_extension)))
+        if not config_files:
+            continue
+        config_modules[environment] = [os.path.splitext(file_name)[0] for file_name in config_files]
+
+    return config_modules
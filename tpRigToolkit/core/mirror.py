@@ -0,0 +1,109 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains the mirror name engine used by tpRigToolkit
+Side patterns are compiled once per engine, so whole hierarchies can be mirrored in a single pass. Names are mirrored
+by path component and each component is only mirrored once (parent components are shared by all their children)
+"""
+
+from __future__ import print_function, division, absolute_import
+
+import re
+from collections import OrderedDict
+
+_LEFT_RIGHT_REGEX = re.compile(r'Left|Right')
+
+
+class MirrorEngine(object):
+    """
+    Class that mirrors node names using the sides of a side table
+    """
+
+    def __init__(self, side_table, rule=None, parse_index=None):
+        """
+        :param side_table: SideTable
+        :param rule: CompiledRule or None, rule used to find the side field of the names. If not given or if the rule
+            has no side field, the first side found in the name is mirrored
+        :param parse_index: NameParseIndex or None, If given and no rule is given, the rule of each name is found
+            with it, so names solved with different rules can be mirrored together
+        """
+
+        super(MirrorEngine, self).__init__()
+
+        self._side_table = side_table
+        self._side_index = _get_side_index(rule)
+        self._parse_index = parse_index if rule is None else None
+        self._mirrors = dict()
+
+    def get_mirror_name(self, node_name):
+        """
+        Returns the mirrored name of the given node
+        :param node_name: str
+        :return: str or None, None if the name has no side that can be mirrored
+        """
+
+        mirror_name = '|'.join(self._get_component_mirror(component) for component in node_name.split('|'))
+
+        return mirror_name if mirror_name != node_name else None
+
+    def get_mirror_names(self, node_names):
+        """
+        Returns the mirrored names of all the given nodes
+        :param node_names: list(str)
+        :return: tuple(OrderedDict(str, str), list(str)), mirrored name of each node and names with no side that can
+            be mirrored. Names that cannot be mirrored are not included in the returned dictionary
+        """
+
+        mirror_names = OrderedDict()
+        unmirrored_names = list()
+        for node_name in node_names:
+            if node_name in mirror_names:
+                continue
+            mirror_name = self.get_mirror_name(node_name)
+            if mirror_name is None:
+                unmirrored_names.append(node_name)
+            else:
+                mirror_names[node_name] = mirror_name
+
+        return mirror_names, unmirrored_names
+
+    def _get_component_mirror(self, component):
+        mirror = self._mirrors.get(component, None)
+        if mirror is not None:
+            return mirror
+
+        split_name = component.split('_')
+        side_index = self._find_side(split_name)
+        for i, value in enumerate(split_name):
+            if i == side_index:
+                split_name[i] = self._side_table.get_mirror(value)
+            elif 'Left' in value or 'Right' in value:
+                split_name[i] = _LEFT_RIGHT_REGEX.sub(_swap_left_right, value)
+        mirror = self._mirrors[component] = '_'.join(split_name)
+
+        return mirror
+
+    def _find_side(self, split_name):
+        side_index = self._side_index
+        if self._parse_index is not None:
+            side_index = _get_side_index(self._parse_index.match_fields(split_name))
+        if side_index is not None and side_index < len(split_name):
+            if self._side_table.get_mirror(split_name[side_index]):
+                return side_index
+        for i, value in enumerate(split_name):
+            if self._side_table.get_mirror(value):
+                return i
+
+        return None
+
+
+def _get_side_index(rule):
+    if rule is None or 'side' not in rule.fields:
+        return None
+
+    return rule.fields.index('side')
+
+
+def _swap_left_right(match):
+    return 'Right' if match.group(0) == 'Left' else 'Left'
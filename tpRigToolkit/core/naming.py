@@ -0,0 +1,744 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains compiled naming rules for tpRigToolkit
+Rules and tokens of a tpDcc-libs-nameit naming file are compiled once into lookup tables. This way, names can be
+solved and parsed without walking rules/tokens lists and without modifying the active rule of the naming library
+"""
+
+from __future__ import print_function, division, absolute_import
+
+import os
+import re
+import json
+import hashlib
+import logging
+from collections import OrderedDict
+
+from tpRigToolkit.core import cache
+
+LOGGER = logging.getLogger('tpRigToolkit-core')
+
+NAMING_CACHE_VERSION = 2
+
+try:
+    _STRING_TYPES = (basestring,)
+except NameError:
+    _STRING_TYPES = (str,)
+
+_FIELDS_REGEX = re.compile(r'\{([^}]+)\}')
+
+
+class CompiledToken(object):
+    """
+    Class that contains the precomputed data of a naming token
+    """
+
+    __slots__ = ('name', 'items', 'default', 'required', 'has_iterator', 'default_is_iterator', '_values', '_keys',
+                 '_iterator_index')
+
+    def __init__(self, name, default=0, values=None):
+        super(CompiledToken, self).__init__()
+
+        values = values or dict()
+        self.name = name
+        self.items = OrderedDict(zip(values.get('key', list()), values.get('value', list())))
+        self.default = self._get_default(default)
+        self.required = self.default is None or self.default == -1
+        self.has_iterator = 'iterator' in self.items
+        self.default_is_iterator = isinstance(self.default, _STRING_TYPES) and (
+            '#' in self.default or '@' in self.default)
+
+        # Reverse lookup used to parse values. First item with a value wins, as it happens when items are iterated
+        self._values = set(self.items.values())
+        self._keys = dict()
+        self._iterator_index = None
+        for i, (key, value) in enumerate(self.items.items()):
+            self._keys.setdefault(value, (i, key))
+            if key == 'iterator' and value == '#' and self._iterator_index is None:
+                self._iterator_index = i
+
+    def solve(self, rule, name=None):
+        """
+        Solves the token value
+        :param rule: CompiledRule
+        :param name: str or int or None, item key (or value) to solve. If None, default value is used
+        :return: str or None
+        """
+
+        if self.name == 'rule_name':
+            return rule.name
+
+        if name is None:
+            if self.default_is_iterator:
+                return rule.get_iterator_value(0)
+            return self.default
+
+        if self.has_iterator:
+            return name if name in self.items else rule.get_iterator_value(name)
+
+        solved_token = self.items.get(name)
+        if not solved_token and name in self._values:
+            return name
+
+        return solved_token
+
+    def parse(self, value, get_keys=True):
+        """
+        Parses given value taking into account the items of the token
+        :param value: str
+        :param get_keys: bool, whether to return the item key or the value
+        :return: str or None
+        """
+
+        found = self._keys.get(value)
+        if self._iterator_index is not None and (found is None or self._iterator_index <= found[0]):
+            if str(value).isdigit():
+                return '#' if get_keys else value
+        if found is None:
+            return None
+
+        return found[1] if get_keys else value
+
+    def _get_default(self, default):
+        if not self.items:
+            return None
+
+        if isinstance(default, (int, float)) and not isinstance(default, bool) and default >= 0:
+            return list(self.items.values())[int(default) - 1]
+
+        return default
+
+
+class CompiledRule(object):
+    """
+    Class that contains a naming rule with its fields already resolved into compiled tokens
+    """
+
+    def __init__(self, name, expression, tokens, auto_fix=False, iterator_format='@'):
+        """
+        :param name: str
+        :param expression: str, rule expression (e.g: {side}_{description}_{node_type})
+        :param tokens: dict(str, CompiledToken)
+        :param auto_fix: bool, whether fields with None values are removed from solved names
+        :param iterator_format: str
+        """
+
+        super(CompiledRule, self).__init__()
+
+        self.name = name
+        self.expression = expression
+        self.auto_fix = auto_fix
+        self.iterator_format = iterator_format or ''
+        self.fields = tuple(_FIELDS_REGEX.findall(expression)) if expression else tuple()
+        self.unique_fields = tuple(OrderedDict.fromkeys(self.fields))
+        self.tokens = tuple(tokens.get(field) for field in self.fields)
+        self.missing_tokens = tuple(field for field, token in zip(self.fields, self.tokens) if token is None)
+
+    def solve(self, *args, **kwargs):
+        """
+        Solves a name with this rule
+        Required tokens are retrieved from keyword arguments or, if not given, from positional arguments
+        :return: str or None
+        """
+
+        if self.missing_tokens:
+            LOGGER.warning('Expression not valid: token {} not found in tokens list'.format(self.missing_tokens[0]))
+            return None
+        if not self.fields:
+            return None
+
+        i = 0
+        values = dict()
+        for field, token in zip(self.fields, self.tokens):
+            value = kwargs.get(field)
+            if token.required:
+                if value is None:
+                    value = args[i] if i < len(args) else None
+                    i += 1
+                values[field] = value
+            else:
+                values[field] = token.solve(self, value)
+
+        return self.format(values)
+
+    def format(self, values):
+        """
+        Joins the given field values following rule expression
+        :param values: dict(str, object)
+        :return: str
+        """
+
+        solved = list()
+        for field in self.unique_fields:
+            if field not in values:
+                continue
+            value = values[field]
+            if value is None:
+                if self.auto_fix:
+                    continue
+                LOGGER.warning(
+                    'Missing field: "{}" when generating new name (None will be used instead)!'.format(field))
+            solved.append('{}'.format(value))
+
+        return '_'.join(solved)
+
+    def parse(self, name, get_keys=False):
+        """
+        Parses given name and returns the value of each one of the rule fields
+        :param name: str
+        :param get_keys: bool
+        :return: OrderedDict
+        """
+
+        parsed = OrderedDict()
+        split_name = name.split('_')
+        for i, (field, token) in enumerate(zip(self.fields, self.tokens)):
+            if i > len(split_name) - 1:
+                parsed[field] = None
+                continue
+            if not token:
+                raise ValueError('Not token found with name: {} in name: "{}"'.format(field, name))
+            value = split_name[i]
+            parsed[field] = value if token.required else token.parse(value, get_keys=get_keys)
+
+        return parsed
+
+    def get_iterator_value(self, value):
+        """
+        Returns the given iterator index formatted with the iterator format of the rule
+        :param value: int
+        :return: str
+        """
+
+        if '@' in self.iterator_format:
+            from tpDcc.libs.python import strings
+            return strings.get_alpha(value, capital=('^' in self.iterator_format))
+        elif '#' in self.iterator_format:
+            return str(value).zfill(len(self.iterator_format))
+
+        return value
+
+
+class CompiledNaming(object):
+    """
+    Class that contains all the compiled rules and tokens of a naming file
+    """
+
+    def __init__(self, naming_data, naming_file=None):
+        """
+        :param naming_data: dict, naming data as stored in nameit naming files ('rules' and 'tokens' keys)
+        :param naming_file: str or None
+        """
+
+        super(CompiledNaming, self).__init__()
+
+        self.naming_file = naming_file
+        self.tokens = OrderedDict()
+        self.rules = OrderedDict()
+        self._parse_index = None
+
+        for token_data in naming_data.get('tokens', None) or list():
+            token = CompiledToken(token_data.get('name'), token_data.get('default', 0), token_data.get('values'))
+            self.tokens.setdefault(token.name, token)
+        for rule_data in naming_data.get('rules', None) or list():
+            rule = CompiledRule(
+                rule_data.get('name'), rule_data.get('expression'), self.tokens,
+                auto_fix=rule_data.get('auto_fix', False), iterator_format=rule_data.get('iterator_format', '@'))
+            self.rules.setdefault(rule.name, rule)
+
+    @classmethod
+    def from_name_lib(cls, name_lib):
+        """
+        Compiles the rules and tokens of the given naming library
+        :param name_lib: NameLib
+        :return: CompiledNaming
+        """
+
+        return cls(get_naming_data(name_lib), naming_file=getattr(name_lib, 'naming_file', None))
+
+    def has_rule(self, rule_name):
+        return rule_name in self.rules
+
+    def get_rule(self, rule_name):
+        return self.rules.get(rule_name, None)
+
+    def get_token(self, token_name):
+        return self.tokens.get(token_name, None)
+
+    def get_parse_index(self):
+        """
+        Returns the index used to parse names solved with any of the rules
+        :return: NameParseIndex
+        """
+
+        if self._parse_index is None:
+            self._parse_index = NameParseIndex(self.rules.values())
+
+        return self._parse_index
+
+
+class NameParseIndex(object):
+    """
+    Class that finds the rule used to solve a name without trying to parse the name with every rule
+    Rules are grouped by their number of fields. For each field position, the index stores which rules accept each
+    token value (as a bit mask), so the rules that can match a name are found with a single pass over its fields.
+    If multiple rules match, the one with more fields restricted by token values wins (rules order breaks ties)
+    """
+
+    def __init__(self, rules):
+        """
+        :param rules: list(CompiledRule)
+        """
+
+        super(NameParseIndex, self).__init__()
+
+        self._rules = dict()
+        self._any_masks = dict()
+        self._digit_masks = dict()
+        self._value_masks = dict()
+
+        rules_by_size = OrderedDict()
+        for i, rule in enumerate(rules):
+            if not rule.fields or rule.missing_tokens:
+                continue
+            specificity = len([token for token in rule.tokens if not token.required])
+            rules_by_size.setdefault(len(rule.fields), list()).append((-specificity, i, rule))
+
+        for size, size_rules in rules_by_size.items():
+            size_rules = [rule for _, _, rule in sorted(size_rules, key=lambda item: item[:2])]
+            any_masks = [0] * size
+            digit_masks = [0] * size
+            value_masks = [dict() for _ in range(size)]
+            for bit, rule in enumerate(size_rules):
+                rule_mask = 1 << bit
+                for position, token in enumerate(rule.tokens):
+                    if token.required:
+                        any_masks[position] |= rule_mask
+                        continue
+                    if token._iterator_index is not None:
+                        digit_masks[position] |= rule_mask
+                    for value in token.items.values():
+                        value = str(value)
+                        value_masks[position][value] = value_masks[position].get(value, 0) | rule_mask
+            self._rules[size] = size_rules
+            self._any_masks[size] = any_masks
+            self._digit_masks[size] = digit_masks
+            self._value_masks[size] = value_masks
+
+    def match(self, name):
+        """
+        Returns the rule that matches the given name
+        :param name: str
+        :return: CompiledRule or None
+        """
+
+        return self.match_fields(name.split('_'))
+
+    def match_fields(self, split_name):
+        """
+        Returns the rule that matches the given name fields
+        :param split_name: list(str), name split by its separator
+        :return: CompiledRule or None
+        """
+
+        size = len(split_name)
+        size_rules = self._rules.get(size, None)
+        if not size_rules:
+            return None
+
+        any_masks = self._any_masks[size]
+        digit_masks = self._digit_masks[size]
+        value_masks = self._value_masks[size]
+        mask = (1 << len(size_rules)) - 1
+        for position, value in enumerate(split_name):
+            position_mask = any_masks[position] | value_masks[position].get(value, 0)
+            if value.isdigit():
+                position_mask |= digit_masks[position]
+            mask &= position_mask
+            if not mask:
+                return None
+
+        return size_rules[(mask & -mask).bit_length() - 1]
+
+    def parse(self, name, get_keys=False):
+        """
+        Parses given name with the rule that matches it
+        :param name: str
+        :param get_keys: bool
+        :return: tuple(CompiledRule, OrderedDict) or tuple(None, None), matched rule and value of each of its fields
+        """
+
+        rule = self.match(name)
+        if not rule:
+            return None, None
+
+        return rule, rule.parse(name, get_keys=get_keys)
+
+
+class NamingEngine(object):
+    """
+    Class that solves and parses names of multiple naming files and that can be used from multiple threads
+    Compiled naming and naming libraries are stored in LRU caches keyed by naming file path and modification time, so
+    each naming file is only loaded again when it is modified. Rules are selected in each call, so no state is shared
+    between calls
+    """
+
+    def __init__(self, name_lib_factory=None, capacity=8, cache_directory=None):
+        """
+        :param name_lib_factory: callable or None, function that receives a naming_file keyword argument and returns
+            a naming library (NameLib) for it. Only used when naming libraries are requested.
+        :param capacity: int, maximum number of naming files kept in memory
+        :param cache_directory: str or None, directory where parsed naming files are stored between processes
+        """
+
+        super(NamingEngine, self).__init__()
+
+        self._name_lib_factory = name_lib_factory
+        self._cache_directory = cache_directory
+        self._compiled = cache.LRUCache(capacity)
+        self._name_libs = cache.LRUCache(capacity)
+
+    @property
+    def cache_directory(self):
+        return self._cache_directory
+
+    def get_naming(self, naming_file):
+        """
+        Returns compiled naming of the given naming file
+        :param naming_file: str
+        :return: CompiledNaming
+        """
+
+        def _compile():
+            _discard_naming_file(self._compiled, naming_file)
+            naming_data = read_naming_data(naming_file, cache_directory=self._cache_directory)
+            return CompiledNaming(naming_data, naming_file=naming_file)
+
+        naming_file = _resolve_path(naming_file)
+
+        return self._compiled.get_or_create((naming_file, cache.get_file_mtime(naming_file)), _compile)
+
+    def get_name_lib(self, naming_file):
+        """
+        Returns naming library of the given naming file
+        Naming libraries are shared between callers, so it is not safe to modify them from multiple threads
+        :param naming_file: str
+        :return: NameLib
+        """
+
+        def _create():
+            _discard_naming_file(self._name_libs, naming_file)
+            return self._name_lib_factory(naming_file=naming_file)
+
+        naming_file = _resolve_path(naming_file)
+
+        return self._name_libs.get_or_create((naming_file, cache.get_file_mtime(naming_file)), _create)
+
+    def get_rule(self, naming_file, rule_name):
+        """
+        Returns compiled rule with given name of the given naming file
+        :param naming_file: str
+        :param rule_name: str
+        :return: CompiledRule or None
+        """
+
+        return self.get_naming(naming_file).get_rule(rule_name)
+
+    def solve(self, naming_file, rule_name, *args, **kwargs):
+        """
+        Solves a name with the given rule of the given naming file
+        :param naming_file: str
+        :param rule_name: str
+        :return: str or None
+        """
+
+        rule = self.get_rule(naming_file, rule_name)
+        if not rule:
+            LOGGER.warning('Impossible to retrieve name because rule name "{}" is not defined!'.format(rule_name))
+            return None
+
+        return rule.solve(*args, **kwargs)
+
+    def parse(self, naming_file, rule_name, node_name):
+        """
+        Parses given name with the given rule of the given naming file
+        :param naming_file: str
+        :param rule_name: str
+        :param node_name: str
+        :return: OrderedDict or None
+        """
+
+        rule = self.get_rule(naming_file, rule_name)
+        if not rule:
+            LOGGER.warning('Impossible to retrieve name because rule name "{}" is not defined!'.format(rule_name))
+            return None
+
+        return rule.parse(node_name)
+
+    def set_capacity(self, capacity):
+        """
+        Sets the maximum number of naming files kept in memory
+        :param capacity: int
+        """
+
+        self._compiled.set_capacity(capacity)
+        self._name_libs.set_capacity(capacity)
+
+    def stats(self):
+        """
+        Returns hits and misses of the naming caches
+        :return: dict
+        """
+
+        return {'naming': self._compiled.stats(), 'name_libs': self._name_libs.stats()}
+
+    def clear(self):
+        """
+        Removes all cached naming files
+        """
+
+        self._compiled.clear()
+        self._name_libs.clear()
+
+
+def read_naming_data(naming_file, cache_directory=None):
+    """
+    Returns rules and tokens data stored in the given naming file
+    If a cache directory is given, parsed data is stored in it and it is reused while the contents of the naming file
+    do not change, so naming files are not parsed again by each new process
+    :param naming_file: str
+    :param cache_directory: str or None, directory where parsed naming files are stored
+    :return: dict
+    """
+
+    import yaml
+
+    if not naming_file or not os.path.isfile(naming_file):
+        LOGGER.warning('Impossible to read naming file because naming file: "{}" does not exists!'.format(naming_file))
+        return dict()
+
+    try:
+        with open(naming_file, 'rb') as fh:
+            contents = fh.read()
+    except Exception as exc:
+        LOGGER.error('Impossible to read naming file "{}": {}'.format(naming_file, exc))
+        return dict()
+
+    cache_file = content_hash = None
+    if cache_directory:
+        content_hash = hashlib.sha1(contents).hexdigest()
+        cache_file = get_naming_cache_file(naming_file, cache_directory)
+        cached_data = _read_naming_cache(cache_file)
+        if cached_data and cached_data.get('hash') == content_hash:
+            return cached_data.get('data') or dict()
+
+    try:
+        naming_data = yaml.safe_load(contents) or dict()
+    except Exception as exc:
+        LOGGER.error('Impossible to read naming file "{}": {}'.format(naming_file, exc))
+        return dict()
+
+    # Cache files are stored as JSON (never unpickled) because cache directory can be shared between users. Data that
+    # JSON cannot store as it is (non string keys, dates, etc) is not cached
+    if cache_file:
+        try:
+            cache_contents = json.dumps({'version': NAMING_CACHE_VERSION, 'hash': content_hash, 'data': naming_data})
+            if json.loads(cache_contents)['data'] == naming_data:
+                cache.write_atomic(cache_file, cache_contents)
+        except (TypeError, ValueError) as exc:
+            LOGGER.debug('Naming file "{}" data is not cached: {}'.format(naming_file, exc))
+
+    return naming_data
+
+
+def get_naming_cache_file(naming_file, cache_directory):
+    """
+    Returns path of the file where parsed data of the given naming file is cached
+    :param naming_file: str
+    :param cache_directory: str
+    :return: str
+    """
+
+    path_hash = hashlib.sha1(_resolve_path(naming_file).encode('utf-8')).hexdigest()
+
+    return os.path.join(cache_directory, '{}.json'.format(path_hash))
+
+
+def get_naming_data(name_lib):
+    """
+    Returns rules and tokens data of the given naming library
+    :param name_lib: NameLib
+    :return: dict
+    """
+
+    rules = list()
+    tokens = list()
+    for rule in name_lib.rules:
+        rules.append({
+            'name': rule.name, 'expression': rule.expression, 'auto_fix': rule.auto_fix,
+            'iterator_format': rule.iterator_format})
+    for token in name_lib.tokens:
+        tokens.append({
+            'name': token.name, 'default': token.default,
+            'values': {'key': list(token.values['key']), 'value': list(token.values['value'])}})
+
+    return {'rules': rules, 'tokens': tokens}
+
+
+class UniqueNames(object):
+    """
+    Class that resolves unique names against an in-memory snapshot of existing names
+    Names are made unique as DCCs do: trailing number of the name is incremented until a free name is found
+    """
+
+    _NUMBER_REGEX = re.compile(r'^(.*?)(\d*)$')
+
+    def __init__(self, names=None):
+        """
+        :param names: list(str) or None, existing names. Full path names are stored by their short name
+        """
+
+        super(UniqueNames, self).__init__()
+
+        self._names = set(name.rsplit('|', 1)[-1] for name in names or list())
+        self._counters = dict()
+
+    def __contains__(self, name):
+        return name in self._names
+
+    def __len__(self):
+        return len(self._names)
+
+    def add(self, name):
+        """
+        Adds given name into the snapshot of existing names
+        :param name: str
+        """
+
+        self._names.add(name)
+
+    def discard(self, name):
+        """
+        Removes given name from the snapshot of existing names
+        :param name: str
+        """
+
+        self._names.discard(name)
+
+    def get_unique_name(self, name, add=True):
+        """
+        Returns a unique version of the given name
+        :param name: str
+        :param add: bool, whether the returned name is added to the existing names
+        :return: str
+        """
+
+        if name not in self._names:
+            if add:
+                self._names.add(name)
+            return name
+
+        base, digits = self._NUMBER_REGEX.match(name).groups()
+        key = (base, len(digits))
+        number = max(int(digits) if digits else 0, self._counters.get(key, 0))
+        while True:
+            number += 1
+            unique_name = '{}{}'.format(base, str(number).zfill(len(digits)))
+            if unique_name not in self._names:
+                break
+        if add:
+            self._counters[key] = number
+            self._names.add(unique_name)
+
+        return unique_name
+
+
+def iterate_records(records):
+    """
+    Generator that yields the token values of each one of the given records
+    :param records: list(dict) or dict(str, list), list of token values or column oriented dictionary. Column values
+        that are not lists or tuples are used for all records
+    :return: generator(dict)
+    """
+
+    if not isinstance(records, dict):
+        for record in records:
+            yield record
+        return
+
+    columns = [(key, value) for key, value in records.items() if isinstance(value, (list, tuple))]
+    constants = dict((key, value) for key, value in records.items() if not isinstance(value, (list, tuple)))
+    size = max([len(value) for _, value in columns]) if columns else (1 if constants else 0)
+    for i in range(size):
+        record = dict(constants)
+        for key, value in columns:
+            record[key] = value[i] if i < len(value) else None
+        yield record
+
+
+def solve_names(rule, records, auto_suffixes=None, unique_names=None, default=None):
+    """
+    Solves a name for each one of the given records
+    :param rule: CompiledRule
+    :param records: list(dict) or dict(str, list), token values of each name (see iterate_records)
+    :param auto_suffixes: dict or None, If given, node_type values found in this dictionary are replaced
+    :param unique_names: UniqueNames or None, If given, solved names are made unique against it
+    :param default: str or None, name used when a record cannot be solved
+    :return: list(str)
+    """
+
+    solved_names = list()
+    for record in iterate_records(records):
+        node_type = record.get('node_type', None)
+        if auto_suffixes and node_type in auto_suffixes:
+            record = dict(record, node_type=auto_suffixes[node_type])
+        solved_name = rule.solve(**record) or record.get('default', default)
+        if solved_name and unique_names is not None:
+            solved_name = unique_names.get_unique_name(solved_name)
+        solved_names.append(solved_name)
+
+    return solved_names
+
+
+def parse_names(rule, node_names, get_keys=False):
+    """
+    Parses all given names with the given rule
+    :param rule: CompiledRule
+    :param node_names: list(str)
+    :param get_keys: bool
+    :return: list(OrderedDict)
+    """
+
+    return [rule.parse(node_name, get_keys=get_keys) for node_name in node_names]
+
+
+def _discard_naming_file(lru_cache, naming_file):
+    """
+    Internal function that removes all the cached versions of the given naming file
+    :param lru_cache: LRUCache
+    :param naming_file: str
+    """
+
+    for key in lru_cache.keys():
+        if key[0] == naming_file:
+            lru_cache.pop(key)
+
+
+def _read_naming_cache(cache_file):
+    """
+    Internal function that returns the contents of the given naming cache file
+    :param cache_file: str
+    :return: dict or None, None if the file does not exist or was written by other cache version
+    """
+
+    cached_data = cache.read_json(cache_file)
+    if not isinstance(cached_data, dict) or cached_data.get('version') != NAMING_CACHE_VERSION:
+        return None
+
+    return cached_data
+
+
+def _resolve_path(file_path):
+    return os.path.normpath(os.path.abspath(file_path)) if file_path else file_path
@@ -0,0 +1,547 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains the content addressed object store used to version tpRigToolkit data folders
+Files are split in chunks that are stored once, named by the hash of their contents. A version of a data folder is
+a manifest that lists the chunks of each one of its files, so identical files (and identical chunks of modified
+files) are shared by all the versions
+Chunks that are not referenced by any version are removed by the garbage collector. Versions are created and
+garbage is collected while holding the lock file of the store, so the garbage collector of other process never removes
+the chunks of a version that is being created
+"""
+
+from __future__ import print_function, division, absolute_import
+
+import os
+import json
+import stat
+import time
+import shutil
+import hashlib
+import logging
+import tempfile
+import threading
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+    import msvcrt
+
+from tpRigToolkit.core import cache
+
+LOGGER = logging.getLogger('tpRigToolkit-core')
+
+OBJECT_STORE_ENV = 'TPRIGTOOLKIT_OBJECT_STORE_PATH'
+OBJECT_STORE_FOLDER = '.store'
+OBJECT_STORE_VERSION = 1
+OBJECT_STORE_LOCK_FILE = 'lock'
+CHUNK_SIZE = 4 * 1024 * 1024
+
+_STORES = dict()
+_LOCK = threading.Lock()
+
+
+class ObjectStore(object):
+    """
+    Class that stores versions of files and folders as manifests of deduplicated chunks
+    """
+
+    def __init__(self, root, chunk_size=CHUNK_SIZE):
+        """
+        :param root: str, directory where objects and versions are stored
+        :param chunk_size: int, maximum size (in bytes) of a chunk
+        """
+
+        super(ObjectStore, self).__init__()
+
+        self._root = os.path.normpath(os.path.abspath(root))
+        self._chunk_size = chunk_size
+        self._lock = StoreLock(os.path.join(self._root, OBJECT_STORE_LOCK_FILE))
+        self.written = 0
+        self.reused = 0
+
+    @property
+    def root(self):
+        return self._root
+
+    def get_object_path(self, digest):
+        """
+        Returns the path where the object with the given hash is stored
+        :param digest: str
+        :return: str
+        """
+
+        return os.path.join(self._root, 'objects', digest[:2], digest[2:])
+
+    def has_object(self, digest):
+        """
+        Returns whether the object with the given hash is stored
+        :param digest: str
+        :return: bool
+        """
+
+        return os.path.isfile(self.get_object_path(digest))
+
+    def put_file(self, file_path):
+        """
+        Stores the chunks of the given file. Chunks that are already stored are not written again
+        Chunks are only protected from garbage collection by the grace period until a version references them, so
+        create_version function should be used to store versions
+        :param file_path: str
+        :return: dict, size and chunk hashes of the file
+        """
+
+        chunks = list()
+        size = 0
+        with open(file_path, 'rb') as fh:
+            while True:
+                data = fh.read(self._chunk_size)
+                if not data:
+                    break
+                chunks.append(self._put_object(data))
+                size += len(data)
+
+        return {'size': size, 'chunks': chunks}
+
+    def put_tree(self, source):
+        """
+        Stores all the files of the given file or folder
+        :param source: str, file or folder
+        :return: dict, manifest entries of the stored files and folders
+        """
+
+        source = os.path.normpath(os.path.abspath(source))
+        if os.path.isfile(source):
+            return {'type': 'file', 'files': {'': self.put_file(source)}, 'folders': list()}
+
+        files = dict()
+        folders = list()
+        for root, dir_names, file_names in os.walk(source):
+            # Store folder is never stored, even if it is located inside the source folder
+            dir_names[:] = sorted(
+                dir_name for dir_name in dir_names if os.path.join(root, dir_name) != self._root)
+            relative_root = os.path.relpath(root, source)
+            relative_root = '' if relative_root == os.curdir else relative_root.replace(os.sep, '/')
+            if relative_root:
+                folders.append(relative_root)
+            for file_name in sorted(file_names):
+                relative_path = '/'.join([relative_root, file_name]) if relative_root else file_name
+                files[relative_path] = self.put_file(os.path.join(root, file_name))
+
+        return {'type': 'folder', 'files': files, 'folders': folders}
+
+    def create_version(self, name, source, comment=''):
+        """
+        Stores a new version of the given file or folder
+        :param name: str, name used to identify the versions of the file or folder
+        :param source: str, file or folder
+        :param comment: str
+        :return: int, number of the new version
+        """
+
+        with self._lock:
+            manifest = self.put_tree(source)
+            versions = self.get_version_numbers(name)
+            version = versions[-1] + 1 if versions else 1
+            manifest.update({
+                'store_version': OBJECT_STORE_VERSION,
+                'name': name,
+                'version': version,
+                'comment': comment,
+                'user': os.environ.get('USERNAME') or os.environ.get('USER') or '',
+                'date': time.time()
+            })
+            manifest_path = self._get_manifest_path(name, version)
+            if not cache.write_atomic(manifest_path, json.dumps(manifest, sort_keys=True)):
+                raise IOError('Impossible to write version file "{}"'.format(manifest_path))
+
+        return version
+
+    def get_version_numbers(self, name):
+        """
+        Returns the numbers of all the stored versions of the given name
+        :param name: str
+        :return: list(int)
+        """
+
+        versions_directory = self._get_versions_directory(name)
+        if not os.path.isdir(versions_directory):
+            return list()
+
+        return sorted(
+            int(os.path.splitext(file_name)[0]) for file_name in os.listdir(versions_directory)
+            if file_name.endswith('.json') and os.path.splitext(file_name)[0].isdigit())
+
+    def get_version(self, name, version=None):
+        """
+        Returns the manifest of the given version
+        :param name: str
+        :param version: int or None, if None, latest version is returned
+        :return: dict or None
+        """
+
+        if version is None:
+            versions = self.get_version_numbers(name)
+            if not versions:
+                return None
+            version = versions[-1]
+
+        return cache.read_json(self._get_manifest_path(name, version))
+
+    def remove_version(self, name, version):
+        """
+        Removes given version. Its chunks are removed by the garbage collector if no other version uses them
+        :param name: str
+        :param version: int
+        :return: bool
+        """
+
+        manifest_path = self._get_manifest_path(name, version)
+        if not os.path.isfile(manifest_path):
+            return False
+        os.remove(manifest_path)
+
+        return True
+
+    def checkout(self, name, target, version=None, link=False):
+        """
+        Restores the given version into the target file or folder
+        Target files that are not part of the version are removed and files whose contents did not change are not
+        written again
+        :param name: str
+        :param target: str
+        :param version: int or None, if None, latest version is restored
+        :param link: bool, whether single chunk files are hard linked to the store instead of copied. Stored objects
+            are read-only, so linked files must be replaced (not modified in place) when saved
+        :return: dict, manifest of the restored version
+        """
+
+        manifest = self.get_version(name, version=version)
+        if not manifest:
+            raise ValueError('Version {} of "{}" not found in object store "{}"'.format(
+                version or 'latest', name, self._root))
+
+        target = os.path.normpath(os.path.abspath(target))
+        if manifest.get('type') == 'file':
+            self._restore_file(manifest['files'][''], target, link=link)
+            return manifest
+
+        if os.path.isfile(target):
+            os.remove(target)
+        target_files = set()
+        for folder_path in manifest.get('folders', list()):
+            folder_path = os.path.join(target, *folder_path.split('/'))
+            if not os.path.isdir(folder_path):
+                os.makedirs(folder_path)
+        for relative_path, entry in manifest.get('files', dict()).items():
+            file_path = os.path.join(target, *relative_path.split('/'))
+            target_files.add(file_path)
+            self._restore_file(entry, file_path, link=link)
+
+        # Store can be located inside the target folder, so the walk never enters it or removes its parent folders
+        target_folders = set(os.path.join(target, *folder_path.split('/')) for folder_path in manifest['folders'])
+        for root, dir_names, file_names in os.walk(target):
+            for file_name in file_names:
+                file_path = os.path.join(root, file_name)
+                if file_path not in target_files:
+                    _remove_file(file_path)
+            kept_dir_names = list()
+            for dir_name in dir_names:
+                dir_path = os.path.join(root, dir_name)
+                if dir_path == self._root or os.path.islink(dir_path):
+                    continue
+                if dir_path not in target_folders and not _is_parent_path(dir_path, self._root):
+                    shutil.rmtree(dir_path, onerror=_on_remove_error)
+                    continue
+                kept_dir_names.append(dir_name)
+            dir_names[:] = kept_dir_names
+
+        return manifest
+
+    def collect_garbage(self, grace_period=3600):
+        """
+        Removes all the objects that are not referenced by any version
+        Store lock is held while collecting, so versions cannot be created meanwhile
+        :param grace_period: float, objects stored or reused in the last seconds are never removed, so objects stored
+            with put_file or put_tree functions that are not referenced by a version yet are kept
+        :return: tuple(int, int), number of removed objects and number of freed bytes
+        """
+
+        with self._lock:
+            referenced = set()
+            versions_root = os.path.join(self._root, 'versions')
+            for root, _, file_names in os.walk(versions_root):
+                for file_name in file_names:
+                    if not file_name.endswith('.json'):
+                        continue
+                    manifest = cache.read_json(os.path.join(root, file_name))
+                    if manifest is None:
+                        # Keep everything if a version cannot be read, so no referenced object is removed
+                        LOGGER.warning('Skipping garbage collection: invalid version file "{}"'.format(
+                            os.path.join(root, file_name)))
+                        return 0, 0
+                    for entry in manifest.get('files', dict()).values():
+                        referenced.update(entry.get('chunks', list()))
+
+            removed = freed = 0
+            now = time.time()
+            objects_root = os.path.join(self._root, 'objects')
+            for root, _, file_names in os.walk(objects_root):
+                for file_name in file_names:
+                    digest = os.path.basename(root) + file_name
+                    if digest in referenced:
+                        continue
+                    object_path = os.path.join(root, file_name)
+                    object_stat = os.stat(object_path)
+                    if now - object_stat.st_mtime < grace_period:
+                        continue
+                    _remove_file(object_path)
+                    removed += 1
+                    freed += object_stat.st_size
+
+        if removed:
+            LOGGER.info('Removed {} unreferenced object/s ({} bytes) from object store "{}"'.format(
+                removed, freed, self._root))
+
+        return removed, freed
+
+    def _put_object(self, data):
+        digest = hashlib.sha1(data).hexdigest()
+        object_path = self.get_object_path(digest)
+        if os.path.isfile(object_path):
+            # Reused objects are touched, so the grace period of the garbage collector also protects them
+            try:
+                os.utime(object_path, None)
+            except OSError as exc:
+                LOGGER.debug('Impossible to update modification time of object "{}": {}'.format(object_path, exc))
+            self.reused += 1
+            return digest
+
+        directory = os.path.dirname(object_path)
+        if not os.path.isdir(directory):
+            try:
+                os.makedirs(directory)
+            except OSError:
+                if not os.path.isdir(directory):
+                    raise
+        fd, temp_path = tempfile.mkstemp(prefix='.tmp', dir=directory)
+        with os.fdopen(fd, 'wb') as fh:
+            fh.write(data)
+        os.chmod(temp_path, stat.S_IREAD | stat.S_IRGRP | stat.S_IROTH)
+        try:
+            os.rename(temp_path, object_path)
+        except OSError:
+            # Other process stored the same object
+            _remove_file(temp_path)
+            if not os.path.isfile(object_path):
+                raise
+        self.written += 1
+
+        return digest
+
+    def _restore_file(self, entry, file_path, link=False):
+        chunks = entry.get('chunks', list())
+        if os.path.isfile(file_path) and os.path.getsize(file_path) == entry.get('size') and \
+                self._get_file_chunks(file_path) == chunks:
+            return
+
+        directory = os.path.dirname(file_path)
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+        if os.path.isdir(file_path):
+            shutil.rmtree(file_path, onerror=_on_remove_error)
+
+        if link and len(chunks) == 1 and hasattr(os, 'link'):
+            try:
+                temp_path = os.path.join(directory, '.tmp{}'.format(chunks[0]))
+                os.link(self.get_object_path(chunks[0]), temp_path)
+                _replace_file(temp_path, file_path)
+                return
+            except OSError as exc:
+                LOGGER.debug('Impossible to link object into "{}": {}'.format(file_path, exc))
+
+        fd, temp_path = tempfile.mkstemp(prefix='.tmp', dir=directory)
+        with os.fdopen(fd, 'wb') as fh:
+            for digest in chunks:
+                with open(self.get_object_path(digest), 'rb') as object_fh:
+                    shutil.copyfileobj(object_fh, fh)
+        os.chmod(temp_path, cache.get_file_mode(file_path))
+        _replace_file(temp_path, file_path)
+
+    def _get_file_chunks(self, file_path):
+        chunks = list()
+        with open(file_path, 'rb') as fh:
+            while True:
+                data = fh.read(self._chunk_size)
+                if not data:
+                    break
+                chunks.append(hashlib.sha1(data).hexdigest())
+
+        return chunks
+
+    def _get_versions_directory(self, name):
+        # Names can be paths, so the folder of each name is named by its hash
+        return os.path.join(self._root, 'versions', hashlib.sha1(name.encode('utf-8')).hexdigest())
+
+    def _get_manifest_path(self, name, version):
+        return os.path.join(self._get_versions_directory(name), '{}.json'.format(version))
+
+
+class StoreLock(object):
+    """
+    Lock shared by the threads and the processes that use the same object store
+    It is reentrant and is held by locking a lock file of the store
+    """
+
+    def __init__(self, file_path):
+        """
+        :param file_path: str, path of the lock file
+        """
+
+        super(StoreLock, self).__init__()
+
+        self._file_path = file_path
+        self._lock = threading.RLock()
+        self._count = 0
+        self._fh = None
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.release()
+
+    def acquire(self):
+        """
+        Waits until the lock is acquired
+        """
+
+        self._lock.acquire()
+        if not self._count:
+            try:
+                self._fh = _lock_file(self._file_path)
+            except Exception:
+                self._lock.release()
+                raise
+        self._count += 1
+
+    def release(self):
+        """
+        Releases the lock. Lock file is unlocked once all the nested acquisitions are released
+        """
+
+        self._count -= 1
+        try:
+            if not self._count:
+                fh, self._fh = self._fh, None
+                _unlock_file(fh)
+        finally:
+            self._lock.release()
+
+
+def get_object_store(directory):
+    """
+    Returns the object store used to version the given file or folder
+    By default, the store is located in a .store folder next to the given path, so all the data folders of the same
+    parent folder share their objects. It can be overridden with TPRIGTOOLKIT_OBJECT_STORE_PATH environment variable
+    :param directory: str
+    :return: ObjectStore
+    """
+
+    root = os.environ.get(OBJECT_STORE_ENV, '') or os.path.join(
+        os.path.dirname(os.path.normpath(os.path.abspath(directory))), OBJECT_STORE_FOLDER)
+    root = os.path.normpath(os.path.abspath(root))
+    with _LOCK:
+        store = _STORES.get(root, None)
+        if store is None:
+            store = _STORES[root] = ObjectStore(root)
+
+    return store
+
+
+def get_version_name(store, file_path):
+    """
+    Returns the name that identifies the versions of the given file or folder in the given object store
+    Paths located next to the store are stored relative to it, so versions are kept if data folders are moved
+    :param store: ObjectStore
+    :param file_path: str
+    :return: str
+    """
+
+    file_path = os.path.normpath(os.path.abspath(file_path))
+    store_directory = os.path.dirname(store.root)
+    if os.path.dirname(file_path) == store_directory:
+        return os.path.basename(file_path)
+
+    return file_path.replace('\\', '/')
+
+
+def _lock_file(file_path):
+    directory = os.path.dirname(file_path)
+    if not os.path.isdir(directory):
+        try:
+            os.makedirs(directory)
+        except OSError:
+            if not os.path.isdir(directory):
+                raise
+    fh = open(file_path, 'a+b')
+    try:
+        if fcntl:
+            fcntl.flock(fh.fileno(), fcntl.LOCK_EX)
+        else:
+            # Windows blocking locks give up after some seconds, so we wait until the lock is acquired
+            fh.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(fh.fileno(), msvcrt.LK_NBLCK, 1)
+                    break
+                except (IOError, OSError):
+                    time.sleep(0.05)
+    except Exception:
+        fh.close()
+        raise
+
+    return fh
+
+
+def _unlock_file(fh):
+    try:
+        if fcntl:
+            fcntl.flock(fh.fileno(), fcntl.LOCK_UN)
+        else:
+            fh.seek(0)
+            msvcrt.locking(fh.fileno(), msvcrt.LK_UNLCK, 1)
+    finally:
+        fh.close()
+
+
+def _is_parent_path(parent_path, path):
+    """
+    Internal function that returns whether the given path is located inside the given parent path
+    :param parent_path: str
+    :param path: str
+    :return: bool
+    """
+
+    return os.path.normcase(path).startswith(os.path.normcase(os.path.join(parent_path, '')))
+
+
+def _replace_file(source, target):
+    if os.name == 'nt' and os.path.isfile(target):
+        _remove_file(target)
+    os.rename(source, target)
+
+
+def _remove_file(file_path):
+    # Read-only files can only be removed in Windows if they are made writable
+    if os.name == 'nt' and not os.access(file_path, os.W_OK):
+        os.chmod(file_path, stat.S_IWRITE | stat.S_IREAD)
+    os.remove(file_path)
+
+
+def _on_remove_error(fn, path, exc_info):
+    os.chmod(path, stat.S_IWRITE | stat.S_IREAD)
+    fn(path)
@@ -0,0 +1,356 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains implementation for tpRigToolkit startup profiler
+Records the time spent importing each module and executing each startup section (configurations, tools, etc) and
+writes a JSON report and a collapsed stacks file (compatible with flame graph tools)
+"""
+
+from __future__ import print_function, division, absolute_import
+
+import os
+import sys
+import json
+import time
+import timeit
+import logging
+import importlib
+import threading
+import contextlib
+from collections import OrderedDict
+
+try:
+    import builtins
+except ImportError:
+    import __builtin__ as builtins
+
+LOGGER = logging.getLogger('tpRigToolkit-core')
+
+PROFILE_ENV = 'TPRIGTOOLKIT_PROFILE'
+
+_PROFILER = None
+
+
+class ProfileRecord(object):
+    """
+    Class that stores the timing of a profiled import or section
+    """
+
+    def __init__(self, category, name, stack, thread_name):
+        super(ProfileRecord, self).__init__()
+
+        self.category = category
+        self.name = name
+        self.stack = stack
+        self.thread_name = thread_name
+        self.duration = 0.0
+        self.children_duration = 0.0
+
+    @property
+    def self_duration(self):
+        return max(self.duration - self.children_duration, 0.0)
+
+    def data(self):
+        return OrderedDict([
+            ('category', self.category),
+            ('name', self.name),
+            ('duration', self.duration),
+            ('self', self.self_duration),
+            ('thread', self.thread_name),
+            ('stack', list(self.stack))
+        ])
+
+
+class ImportProfiler(object):
+    """
+    Class that profiles module imports and startup sections
+    """
+
+    def __init__(self):
+        super(ImportProfiler, self).__init__()
+
+        self._records = list()
+        self._running = False
+        self._original_import = builtins.__import__
+        self._original_import_module = importlib.import_module
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._start = None
+        self._end = None
+
+    @property
+    def is_running(self):
+        return self._running
+
+    def records(self):
+        """
+        Returns all profiled records
+        :return: list(ProfileRecord)
+        """
+
+        with self._lock:
+            return list(self._records)
+
+    def start(self):
+        """
+        Starts profiling imports
+        """
+
+        if self.is_running:
+            return
+
+        self._original_import = builtins.__import__
+        self._original_import_module = importlib.import_module
+        builtins.__import__ = self._import
+        importlib.import_module = self._import_module
+        self._running = True
+        self._start = timeit.default_timer()
+
+    def stop(self):
+        """
+        Stops profiling imports
+        """
+
+        if not self.is_running:
+            return
+
+        if builtins.__import__ == self._import:
+            builtins.__import__ = self._original_import
+        if importlib.import_module == self._import_module:
+            importlib.import_module = self._original_import_module
+        self._running = False
+        self._end = timeit.default_timer()
+
+    @contextlib.contextmanager
+    def section(self, category, name):
+        """
+        Context manager that profiles the code executed inside it
+        :param category: str, category of the section ('config', 'tool', 'task', etc)
+        :param name: str, name of the section
+        """
+
+        record = self._push(category, name)
+        start = timeit.default_timer()
+        try:
+            yield record
+        finally:
+            self._pop(record, timeit.default_timer() - start)
+
+    def wrap(self, category, name, fn):
+        """
+        Returns a version of the given function that is profiled each time it is called
+        :param category: str
+        :param name: str
+        :param fn: callable
+        :return: callable
+        """
+
+        def _profiled(*args, **kwargs):
+            with self.section(category, name):
+                return fn(*args, **kwargs)
+
+        return _profiled
+
+    def report(self):
+        """
+        Returns profiling report data
+        :return: OrderedDict
+        """
+
+        records = sorted(self.records(), key=lambda r: r.duration, reverse=True)
+        categories = OrderedDict()
+        for record in records:
+            if len(record.stack) > 1:
+                continue
+            categories[record.category] = categories.get(record.category, 0.0) + record.duration
+
+        end = self._end if self._end is not None else timeit.default_timer()
+
+        return OrderedDict([
+            ('created', time.strftime('%Y-%m-%d %H:%M:%S')),
+            ('python', sys.version.split()[0]),
+            ('total', end - self._start if self._start is not None else 0.0),
+            ('categories', categories),
+            ('records', [record.data() for record in records])
+        ])
+
+    def collapsed_stacks(self):
+        """
+        Returns profiled records in collapsed stack format (one line per stack with its self time in microseconds)
+        :return: list(str)
+        """
+
+        stacks = OrderedDict()
+        for record in self.records():
+            stack = list(record.stack)
+            if record.thread_name != 'MainThread':
+                stack.insert(0, '[{}]'.format(record.thread_name))
+            key = ';'.join(stack)
+            stacks[key] = stacks.get(key, 0) + int(record.self_duration * 1000000)
+
+        return ['{} {}'.format(stack, value) for stack, value in stacks.items() if value > 0]
+
+    def write_report(self, directory, name='startup'):
+        """
+        Writes profile report (JSON) and collapsed stacks file into given directory
+        :param directory: str
+        :param name: str, prefix of the report files
+        :return: tuple(str, str), paths of the JSON report and the collapsed stacks file
+        """
+
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+
+        file_name = '{}_profile_{}'.format(name, time.strftime('%Y%m%d_%H%M%S'))
+        report_path = os.path.join(directory, '{}.json'.format(file_name))
+        stacks_path = os.path.join(directory, '{}.folded'.format(file_name))
+
+        with open(report_path, 'w') as fh:
+            json.dump(self.report(), fh, indent=4)
+        with open(stacks_path, 'w') as fh:
+            fh.write('\n'.join(self.collapsed_stacks()))
+
+        return report_path, stacks_path
+
+    def _get_stack(self):
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = list()
+
+        return stack
+
+    def _push(self, category, name):
+        stack = self._get_stack()
+        frame_name = name if category == 'import' else '{}:{}'.format(category, name)
+        parent_stack = stack[-1].stack if stack else list()
+        record = ProfileRecord(category, name, parent_stack + [frame_name], threading.current_thread().name)
+        stack.append(record)
+
+        return record
+
+    def _pop(self, record, duration):
+        stack = self._get_stack()
+        if stack and stack[-1] is record:
+            stack.pop()
+        record.duration = duration
+        if stack:
+            stack[-1].children_duration += duration
+        with self._lock:
+            self._records.append(record)
+
+    def _import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        module_name = _resolve_module_name(name, globals, level)
+        original_import = self._original_import
+        if not self._running or not module_name:
+            return original_import(name, globals, locals, fromlist, level)
+
+        # Submodules imported through from list (from package import module) are loaded by the parent import
+        if module_name in sys.modules:
+            missing = list()
+            module = sys.modules[module_name]
+            if fromlist and hasattr(module, '__path__'):
+                missing = [
+                    '{}.{}'.format(module_name, item) for item in fromlist
+                    if item != '*' and not hasattr(module, item)]
+                missing = [item for item in missing if item not in sys.modules]
+            if not missing:
+                return original_import(name, globals, locals, fromlist, level)
+            module_name = missing[0] if len(missing) == 1 else '{}.{{{}}}'.format(
+                module_name, ','.join(item.rpartition('.')[-1] for item in missing))
+
+        record = self._push('import', module_name)
+        start = timeit.default_timer()
+        try:
+            return original_import(name, globals, locals, fromlist, level)
+        finally:
+            self._pop(record, timeit.default_timer() - start)
+
+    def _import_module(self, name, package=None):
+        original_import_module = self._original_import_module
+        module_name = name
+        if name.startswith('.'):
+            level = len(name) - len(name.lstrip('.'))
+            module_name = _resolve_module_name(name[level:], {'__package__': package}, level) if package else None
+        if not self._running or not module_name or module_name in sys.modules:
+            return original_import_module(name, package)
+
+        record = self._push('import', module_name)
+        start = timeit.default_timer()
+        try:
+            return original_import_module(name, package)
+        finally:
+            self._pop(record, timeit.default_timer() - start)
+
+
+def _resolve_module_name(name, globals_dict, level):
+    """
+    Internal function that returns absolute name of the imported module
+    :param name: str
+    :param globals_dict: dict or None
+    :param level: int
+    :return: str or None
+    """
+
+    if level is None or level <= 0:
+        return name
+    if not globals_dict:
+        return None
+
+    package = globals_dict.get('__package__') or globals_dict.get('__name__', '')
+    if not package:
+        return None
+    if '__path__' not in globals_dict and not globals_dict.get('__package__'):
+        package = package.rpartition('.')[0]
+    for _ in range(level - 1):
+        package = package.rpartition('.')[0]
+
+    return '{}.{}'.format(package, name) if name else package
+
+
+def is_enabled():
+    """
+    Returns whether startup profiling is enabled through TPRIGTOOLKIT_PROFILE environment variable
+    :return: bool
+    """
+
+    return os.environ.get(PROFILE_ENV, '').lower() in ('1', 'true', 'yes')
+
+
+def get_profiler():
+    """
+    Returns tpRigToolkit profiler instance
+    :return: ImportProfiler
+    """
+
+    global _PROFILER
+    if _PROFILER is None:
+        _PROFILER = ImportProfiler()
+
+    return _PROFILER
+
+
+def get_active_profiler():
+    """
+    Returns tpRigToolkit profiler instance only if it is running
+    :return: ImportProfiler or None
+    """
+
+    return _PROFILER if _PROFILER is not None and _PROFILER.is_running else None
+
+
+@contextlib.contextmanager
+def section(category, name):
+    """
+    Profiles the code executed inside the context if tpRigToolkit profiler is running
+    :param category: str
+    :param name: str
+    """
+
+    active_profiler = get_active_profiler()
+    if not active_profiler:
+        yield None
+        return
+
+    with active_profiler.section(category, name) as record:
+        yield record
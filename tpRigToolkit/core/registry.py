@@ -0,0 +1,217 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains the data registry used by tpRigToolkit data manager
+Data classes (FileData) and data items (DataItem) are indexed by data type, file extension and menu name when the
+registry is updated, so resolving the class of a file does not need to check every registered class
+"""
+
+from __future__ import print_function, division, absolute_import
+
+import os
+import logging
+from collections import OrderedDict
+
+LOGGER = logging.getLogger('tpRigToolkit-core')
+
+
+class DataRegistry(object):
+    """
+    Class that indexes data classes and data items
+    """
+
+    def __init__(self, data_classes=None, data_items=None):
+        """
+        :param data_classes: list(FileData) or None
+        :param data_items: list(DataItem) or None
+        """
+
+        super(DataRegistry, self).__init__()
+
+        self._data_classes = list()
+        self._data_items = list()
+        self._classes_by_type = dict()
+        self._classes_by_extension = dict()
+        self._items_by_type = dict()
+        self._items_by_extension = dict()
+        self._items_by_menu_name = dict()
+
+        self.update(data_classes=data_classes, data_items=data_items)
+
+    def update(self, data_classes=None, data_items=None):
+        """
+        Rebuilds registry indexes with the given classes. Duplicated classes are only registered once
+        :param data_classes: list(FileData) or None
+        :param data_items: list(DataItem) or None
+        """
+
+        self._data_classes = list(OrderedDict.fromkeys(data_classes or list()))
+        self._data_items = list(OrderedDict.fromkeys(data_items or list()))
+        self._classes_by_type.clear()
+        self._classes_by_extension.clear()
+        self._items_by_type.clear()
+        self._items_by_extension.clear()
+        self._items_by_menu_name.clear()
+
+        for data_class in self._data_classes:
+            data_type = _call(data_class, 'get_data_type')
+            if data_type:
+                self._classes_by_type.setdefault(data_type, data_class)
+            extension = _call(data_class, 'get_data_extension')
+            if extension:
+                self._classes_by_extension.setdefault(normalize_extension(extension), data_class)
+
+        for data_item in self._data_items:
+            data_type = getattr(data_item, 'DataType', None)
+            if data_type:
+                self._items_by_type.setdefault(data_type, data_item)
+            extensions = list(getattr(data_item, 'Extensions', None) or list())
+            extension = getattr(data_item, 'Extension', None)
+            if extension:
+                extensions.insert(0, extension)
+            for extension in extensions:
+                self._items_by_extension.setdefault(normalize_extension(extension), data_item)
+            menu_name = getattr(data_item, 'MenuName', None)
+            if menu_name:
+                self._items_by_menu_name.setdefault(menu_name, data_item)
+
+    def get_data_classes(self):
+        """
+        Returns all registered data classes
+        :return: list(FileData)
+        """
+
+        return list(self._data_classes)
+
+    def get_data_items(self):
+        """
+        Returns all registered data items
+        :return: list(DataItem)
+        """
+
+        return list(self._data_items)
+
+    def get_data_types(self):
+        """
+        Returns the data types of all registered data classes
+        :return: list(str)
+        """
+
+        return [_call(data_class, 'get_data_type') for data_class in self._data_classes]
+
+    def get_data_class(self, data_type):
+        """
+        Returns data class of the given data type
+        Classes that match the type using their own is_type_match implementation are also found
+        :param data_type: str
+        :return: FileData or None
+        """
+
+        data_class = self._classes_by_type.get(data_type, None)
+        if data_class is not None:
+            return data_class
+
+        for data_class in self._data_classes:
+            if hasattr(data_class, 'is_type_match') and data_class.is_type_match(data_type):
+                self._classes_by_type[data_type] = data_class
+                return data_class
+
+        return None
+
+    def get_data_class_for_extension(self, extension):
+        """
+        Returns data class that stores files with the given extension
+        :param extension: str
+        :return: FileData or None
+        """
+
+        return self._classes_by_extension.get(normalize_extension(extension), None)
+
+    def get_data_class_for_path(self, file_path):
+        """
+        Returns data class that stores the given file
+        :param file_path: str
+        :return: FileData or None
+        """
+
+        return _find_by_path(self._classes_by_extension, file_path)
+
+    def get_data_item(self, data_type):
+        """
+        Returns data item of the given data type
+        :param data_type: str
+        :return: DataItem or None
+        """
+
+        return self._items_by_type.get(data_type, None)
+
+    def get_data_item_for_extension(self, extension):
+        """
+        Returns data item that handles files with the given extension
+        :param extension: str
+        :return: DataItem or None
+        """
+
+        return self._items_by_extension.get(normalize_extension(extension), None)
+
+    def get_data_item_for_path(self, file_path):
+        """
+        Returns data item that handles the given file
+        :param file_path: str
+        :return: DataItem or None
+        """
+
+        return _find_by_path(self._items_by_extension, file_path)
+
+    def get_data_item_by_menu_name(self, menu_name):
+        """
+        Returns data item with the given menu name
+        :param menu_name: str
+        :return: DataItem or None
+        """
+
+        return self._items_by_menu_name.get(menu_name, None)
+
+
+def normalize_extension(extension):
+    """
+    Returns given extension in lower case and with a leading dot
+    :param extension: str
+    :return: str
+    """
+
+    extension = extension.lower()
+
+    return extension if extension.startswith('.') else '.{}'.format(extension)
+
+
+def _find_by_path(index, file_path):
+    """
+    Internal function that returns the value of the longest extension of the given file found in the given index
+    Compound extensions (such as .skin.json) are checked before simple ones
+    :param index: dict(str, object)
+    :param file_path: str
+    :return: object or None
+    """
+
+    file_name = os.path.basename(file_path.rstrip('/\\')).lower()
+    dot_index = file_name.find('.', 1)
+    while dot_index != -1:
+        found = index.get(file_name[dot_index:], None)
+        if found is not None:
+            return found
+        dot_index = file_name.find('.', dot_index + 1)
+
+    return None
+
+
+def _call(data_class, method_name):
+    method = getattr(data_class, method_name, None)
+    if not method:
+        return None
+    try:
+        return method()
+    except Exception as exc:
+        LOGGER.warning('Impossible to retrieve {} of data class {}: {}'.format(method_name, data_class, exc))
+        return None
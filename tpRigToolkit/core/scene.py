@@ -0,0 +1,177 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains scene snapshots used by tpRigToolkit to rename nodes
+A snapshot queries the DCC (through tpDcc.dcc interface) only once per node and stores all the data needed to
+classify and rename those nodes, so names can be resolved without more DCC calls
+"""
+
+from __future__ import print_function, division, absolute_import
+
+import logging
+from collections import OrderedDict
+
+from tpRigToolkit.core import naming, classifier
+
+LOGGER = logging.getLogger('tpRigToolkit-core')
+
+
+class NodeInfo(object):
+    """
+    Class that stores the DCC data of a node
+    """
+
+    __slots__ = ('name', 'handle', 'node_type', 'shape_types', 'message_types', 'classified_type')
+
+    def __init__(self, name, handle, node_type, shape_types=None, message_types=None, classified_type=None):
+        super(NodeInfo, self).__init__()
+
+        self.name = name
+        self.handle = handle
+        self.node_type = node_type
+        self.shape_types = tuple(shape_types or tuple())
+        self.message_types = tuple(message_types or tuple())
+        self.classified_type = classified_type
+
+    @property
+    def short_name(self):
+        return self.name.rsplit('|', 1)[-1]
+
+
+class SceneSnapshot(object):
+    """
+    Class that contains a snapshot of the nodes to rename and of the names of the scene
+    """
+
+    def __init__(self, dcc, node_names, message_attribute='message', classifier=None):
+        """
+        :param dcc: module or object, DCC interface (tpDcc.dcc)
+        :param node_names: list(str), nodes to store in the snapshot
+        :param message_attribute: str, attribute whose connections are stored in the snapshot
+        :param classifier: NodeClassifier or None, If given, nodes already classified by it are not queried
+        """
+
+        super(SceneSnapshot, self).__init__()
+
+        self._dcc = dcc
+        self._nodes = OrderedDict()
+        self._types = dict()
+
+        for node_name in node_names:
+            handle = dcc.node_handle(node_name)
+            if not handle or handle in self._nodes:
+                continue
+            classified_type = classifier.get_cached(handle) if classifier else None
+            if classified_type is not None:
+                self._nodes[handle] = NodeInfo(node_name, handle, None, classified_type=classified_type)
+                continue
+            shapes = dcc.list_shapes(node_name, full_path=True) or list()
+            connections = dcc.list_connections(node_name, message_attribute) or list()
+            self._nodes[handle] = NodeInfo(
+                node_name, handle, self._get_type(node_name), shape_types=[self._get_type(shape) for shape in shapes],
+                message_types=[self._get_type(connection) for connection in connections])
+
+        self.names = naming.UniqueNames(dcc.all_scene_nodes(full_path=False) or list())
+
+    def __len__(self):
+        return len(self._nodes)
+
+    def nodes(self):
+        """
+        Returns data of all the nodes in the snapshot
+        :return: list(NodeInfo)
+        """
+
+        return list(self._nodes.values())
+
+    def get_node(self, handle):
+        """
+        Returns data of the node with the given handle
+        :param handle: str
+        :return: NodeInfo or None
+        """
+
+        return self._nodes.get(handle, None)
+
+    def rename_nodes(self, solved_names, unique_name=False):
+        """
+        Renames the nodes of the snapshot
+        :param solved_names: dict(str, str), new name of each node handle
+        :param unique_name: bool, whether new names are made unique against the names of the snapshot
+        :return: list(str), new names of the nodes
+        """
+
+        new_names = list()
+        for handle, solved_name in solved_names.items():
+            node_info = self._nodes.get(handle, None)
+            if not node_info or not solved_name:
+                continue
+
+            # Nodes are found by their handle because renaming a parent changes the full path of its children
+            node_name = self._dcc.find_node_by_id(handle, full_path=True) or node_info.name
+            self.names.discard(node_info.short_name)
+            if unique_name:
+                solved_name = self.names.get_unique_name(solved_name)
+            else:
+                self.names.add(solved_name)
+            new_name = self._dcc.rename_node(node_name, solved_name, uuid=handle, rename_shape=True)
+            new_names.append(new_name)
+
+        return new_names
+
+    def _get_type(self, node_name):
+        node_type = self._types.get(node_name, None)
+        if node_type is None:
+            node_type = self._types[node_name] = self._dcc.node_type(node_name)
+
+        return node_type
+
+
+def solve_node_names_by_type(snapshot, compiled_naming, auto_suffixes, node_classifier=None, **kwargs):
+    """
+    Resolves the name of all the nodes of the given snapshot taking into account their types
+    The rule of each node is retrieved from the given auto suffixes. If the type has no rule, 'node' rule is used
+    :param snapshot: SceneSnapshot
+    :param compiled_naming: CompiledNaming
+    :param auto_suffixes: dict(str, str), rule name of each node type
+    :param node_classifier: NodeClassifier or None, classifier used to retrieve node types. If not given, a classifier
+        with default rules is used
+    :param kwargs: dict, extra token values
+    :return: OrderedDict(str, str), solved name of each node handle
+    """
+
+    node_classifier = node_classifier or classifier.NodeClassifier()
+    node_types = node_classifier.classify_nodes(snapshot.nodes())
+
+    solved_names = OrderedDict()
+    for node_info in snapshot.nodes():
+        node_type = node_types[node_info.handle]
+        if node_type not in auto_suffixes:
+            rule_name = 'node'
+        else:
+            rule_name = node_type = auto_suffixes[node_type]
+
+        if not compiled_naming.has_rule(rule_name):
+            if not compiled_naming.has_rule('node'):
+                LOGGER.warning(
+                    'Impossible to rename node "{}" by its type "{}" because rule "{}" it is not defined and '
+                    'callback rule "node" either'.format(node_info.name, node_type, rule_name))
+            else:
+                rule_name = 'node'
+
+        rule = compiled_naming.get_rule(rule_name)
+        if not rule:
+            LOGGER.warning('Rule with name "{}" is not defined. Default rule used'.format(rule_name))
+            rule = compiled_naming.get_rule('default')
+        if not rule:
+            continue
+
+        if rule_name == 'node':
+            values = dict(kwargs, node_type=auto_suffixes.get(node_type, node_type))
+            solved_name = rule.solve(node_info.name, **values)
+        else:
+            solved_name = rule.solve(rule_name, node_info.name, **kwargs)
+        solved_names[node_info.handle] = solved_name or kwargs.get('default', None)
+
+    return solved_names
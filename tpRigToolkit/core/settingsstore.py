@@ -0,0 +1,250 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains the shared settings store used by tpRigToolkit library
+Settings files are read once and served from memory. Writes are coalesced and flushed to disk after a small delay
+using atomic writes. Settings are only read again when their file is modified by other process
+The store uses the same file format and interface as tpDcc JSONSettings, so it can be used as a replacement of it
+"""
+
+from __future__ import print_function, division, absolute_import
+
+import os
+import copy
+import json
+import atexit
+import timeit
+import logging
+import threading
+from collections import OrderedDict
+
+from tpRigToolkit.core import cache
+
+LOGGER = logging.getLogger('tpRigToolkit-core')
+
+_STORES = dict()
+_LOCK = threading.Lock()
+
+
+class SettingsStore(object):
+    """
+    Class that stores settings of a JSON settings file in memory
+    """
+
+    def __init__(self, file_path, flush_delay=0.5, check_interval=0.5):
+        """
+        :param file_path: str, path of the JSON settings file
+        :param flush_delay: float, time (in seconds) writes are delayed, so multiple writes are stored at once
+        :param check_interval: float, minimum time (in seconds) between two checks of settings file modifications
+        """
+
+        super(SettingsStore, self).__init__()
+
+        self._file_path = file_path
+        self._flush_delay = flush_delay
+        self._check_interval = check_interval
+        self._settings = OrderedDict()
+        self._dirty = set()
+        self._cleared = False
+        self._mtime = None
+        self._checked = None
+        self._timer = None
+        self._lock = threading.RLock()
+        self.reads = 0
+        self.writes = 0
+
+        self._read()
+        atexit.register(self.flush)
+
+    @property
+    def settings_dict(self):
+        with self._lock:
+            return copy.deepcopy(self._settings)
+
+    def data(self):
+        """
+        Returns a copy of settings data. Modifying it does not modify the settings, use set function instead
+        :return: OrderedDict
+        """
+
+        self._check_file()
+
+        return self.settings_dict
+
+    def get_file(self):
+        """
+        Returns the file path of the settings file
+        :return: str
+        """
+
+        return self._file_path
+
+    def get(self, name, default=None):
+        """
+        Returns the value of the given setting
+        :param name: str
+        :param default: object, value returned if the setting is not found
+        :return: object
+        """
+
+        self._check_file()
+        if name in self._settings:
+            return self._settings[name]
+
+        return default
+
+    def set(self, name, value):
+        """
+        Sets the value of the given setting. Setting is written into disk after the flush delay
+        :param name: str
+        :param value: object
+        """
+
+        with self._lock:
+            self._settings[name] = value
+            self._dirty.add(name)
+            self._schedule_flush()
+
+    def has_setting(self, name):
+        """
+        Returns whether the given setting exists
+        :param name: str
+        :return: bool
+        """
+
+        self._check_file()
+
+        return name in self._settings
+
+    def has_settings(self):
+        """
+        Returns whether there are settings stored or not
+        :return: bool
+        """
+
+        self._check_file()
+
+        return bool(self._settings)
+
+    def get_settings(self):
+        """
+        Returns a list with all the settings stored
+        :return: list(list(str, object))
+        """
+
+        self._check_file()
+
+        return [[name, value] for name, value in self._settings.items()]
+
+    def reload(self):
+        """
+        Forces the reading of the settings file. Settings modified and not written yet are kept
+        """
+
+        with self._lock:
+            self._read()
+
+    def clear(self):
+        """
+        Removes all stored settings
+        """
+
+        with self._lock:
+            self._settings = OrderedDict()
+            self._dirty.clear()
+            self._cleared = True
+            self._schedule_flush()
+
+    def flush(self):
+        """
+        Writes pending settings into disk
+        :return: bool
+        """
+
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not self._dirty and not self._cleared:
+                return True
+
+            # Settings modified by other processes are merged before writing
+            if not self._cleared and cache.get_file_mtime(self._file_path) != self._mtime:
+                self._read()
+            data = json.dumps([[name, value] for name, value in self._settings.items()], indent=4)
+            valid = cache.write_atomic(self._file_path, data)
+            if valid:
+                self.writes += 1
+                self._dirty.clear()
+                self._cleared = False
+                self._mtime = cache.get_file_mtime(self._file_path)
+                self._checked = timeit.default_timer()
+
+        return valid
+
+    def _schedule_flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+        if self._flush_delay <= 0:
+            self._timer = None
+            self.flush()
+            return
+        self._timer = threading.Timer(self._flush_delay, self.flush)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _check_file(self):
+        now = timeit.default_timer()
+        if self._checked is not None and now - self._checked < self._check_interval:
+            return
+        self._checked = now
+        if cache.get_file_mtime(self._file_path) != self._mtime:
+            with self._lock:
+                self._read()
+
+    def _read(self):
+        self._mtime = cache.get_file_mtime(self._file_path)
+        self._checked = timeit.default_timer()
+        file_settings = OrderedDict()
+        if self._mtime is not None:
+            try:
+                with open(self._file_path, 'r') as fh:
+                    file_settings = OrderedDict(json.load(fh) or list())
+            except Exception as exc:
+                LOGGER.warning('Impossible to read settings file "{}": {}'.format(self._file_path, exc))
+        self.reads += 1
+
+        if self._cleared:
+            return
+        for name in self._dirty:
+            file_settings[name] = self._settings.get(name, None)
+        self._settings = file_settings
+
+
+def get_settings_store(file_path, flush_delay=0.5):
+    """
+    Returns the settings store of the given settings file. Only one store is created per file
+    :param file_path: str
+    :param flush_delay: float
+    :return: SettingsStore
+    """
+
+    file_path = os.path.normpath(os.path.abspath(file_path))
+    with _LOCK:
+        store = _STORES.get(file_path, None)
+        if store is None:
+            store = _STORES[file_path] = SettingsStore(file_path, flush_delay=flush_delay)
+
+    return store
+
+
+def get_library_settings():
+    """
+    Returns the settings store of tpRigToolkit library
+    :return: SettingsStore
+    """
+
+    library_settings_root_path = os.getenv('APPDATA') or os.getenv('HOME')
+
+    return get_settings_store(os.path.join(library_settings_root_path, 'tpRigToolkit', 'library.json'))
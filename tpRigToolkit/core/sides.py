@@ -0,0 +1,291 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains side tables used by tpRigToolkit
+A side table stores the sides of a project (retrieved from project options or from its naming side token) so side
+queries (long names, mirror sides, colors, etc) do not need to walk project options and naming tokens each time
+"""
+
+from __future__ import print_function, division, absolute_import
+
+import re
+import timeit
+import logging
+from collections import OrderedDict
+
+from tpRigToolkit.core import consts, cache
+
+LOGGER = logging.getLogger('tpRigToolkit-core')
+
+# Minimum time (in seconds) between two checks of the options and naming files of the same project
+SIDE_TABLE_CHECK_INTERVAL = 0.5
+
+# Side tables keep a reference to their project, so the cache is bounded to not keep old projects alive
+_SIDE_TABLES = cache.LRUCache(capacity=16)
+_MIRROR_REGEX = re.compile(r'left|right', re.IGNORECASE)
+
+
+class SideTable(object):
+    """
+    Class that contains precomputed side data of a project
+    """
+
+    def __init__(self, sides, default_side, long_names=None, mirror_side=None, project=None):
+        """
+        :param sides: list(str), available sides
+        :param default_side: str
+        :param long_names: OrderedDict(str, str), long name of each short side name
+        :param mirror_side: str
+        :param project: Project or None, project used to retrieve side colors
+        """
+
+        super(SideTable, self).__init__()
+
+        self._sides = list(sides)
+        self._default_side = default_side
+        self._mirror_side = mirror_side
+        self._project = project
+        self._long_names = dict()
+        self._short_names = dict()
+        self._colors = dict()
+
+        for short_name, long_name in (long_names or dict()).items():
+            self._long_names.setdefault(short_name.lower(), long_name)
+            self._short_names.setdefault(long_name.lower(), short_name)
+
+        self._mirror_sides = dict()
+        for long_name in list(self._short_names.keys()):
+            mirror_long_name = _MIRROR_REGEX.sub(_swap_side, long_name)
+            if mirror_long_name == long_name or mirror_long_name not in self._short_names:
+                continue
+            self._mirror_sides[long_name] = mirror_long_name
+            self._mirror_sides[self._short_names[long_name].lower()] = self._short_names[mirror_long_name].lower()
+
+    @classmethod
+    def from_project(cls, project, default_sides=None, default_side=None, default_mirror_side=None):
+        """
+        Creates a side table with the sides of the given project
+        This is the order that is used to check the list of available sides
+            1) Check if project has already an option called sides. Default side will be the first side in the list.
+            2) Check project nomenclature rule looking for a token called side
+            3) Default sides for tpRigToolkit will be used
+        :param project: Project or None
+        :param default_sides: list(str) or None
+        :param default_side: str or None
+        :param default_mirror_side: str or None
+        :return: SideTable
+        """
+
+        sides = None
+        side_default = None
+        long_names = OrderedDict()
+        mirror_side = None
+
+        if project:
+            side_options = project.get_option('sides') if project.has_option('sides') else None
+            if side_options:
+                sides = list(side_options)
+                side_default = sides[0]
+                if isinstance(side_options, dict):
+                    for side_name, side_short in side_options.items():
+                        long_names.setdefault(side_short, side_name)
+            if project.has_option('mirror side'):
+                mirror_side = project.get_option('mirror side')
+
+            name_lib = getattr(project, 'naming_lib', None)
+            side_token = name_lib.get_token('side') if name_lib else None
+            if side_token:
+                token_items = side_token.get_items()
+                if sides is None:
+                    sides = list(token_items.keys())
+                    side_default = sides[(side_token.default or 1) - 1] if sides else ''
+                for side_key, side_value in token_items.items():
+                    long_names.setdefault(side_value, side_key)
+            mirror_side_token = name_lib.get_token('mirror side') if name_lib else None
+            if mirror_side is None and mirror_side_token:
+                token_items = list(mirror_side_token.get_items().keys())
+                mirror_side = token_items[(mirror_side_token.default or 1) - 1] if token_items else ''
+
+        if sides is None:
+            sides = list(default_sides or consts.DEFAULT_SIDES.keys())
+            side_default = default_side or consts.DEFAULT_SIDE
+        if not long_names:
+            for side_name, side_short in consts.DEFAULT_SIDES.items():
+                long_names.setdefault(side_short, side_name)
+        if mirror_side is None:
+            mirror_side = default_mirror_side or consts.DEFAULT_MIRROR_SIDE
+
+        return cls(sides, side_default, long_names=long_names, mirror_side=mirror_side, project=project)
+
+    @property
+    def default_side(self):
+        return self._default_side
+
+    @property
+    def mirror_side(self):
+        return self._mirror_side
+
+    def get_sides(self, skip_default=False):
+        """
+        Returns available sides
+        :param skip_default: bool, whether to remove default side from the list
+        :return: list(str)
+        """
+
+        if skip_default:
+            return [side for side in self._sides if side != self._default_side]
+
+        return list(self._sides)
+
+    def get_long_name(self, short_side):
+        """
+        Returns long version of the given side
+        :param short_side: str
+        :return: str
+        """
+
+        return self._long_names.get(short_side.lower(), short_side)
+
+    def get_short_name(self, long_side):
+        """
+        Returns short version of the given side
+        :param long_side: str
+        :return: str
+        """
+
+        return self._short_names.get(long_side.lower(), long_side)
+
+    def get_mirror(self, side):
+        """
+        Returns the opposite of the given side (left for right, l for r, etc). Case of the given side is kept
+        :param side: str
+        :return: str or None, None if the side has no opposite side
+        """
+
+        mirror = self._mirror_sides.get(side.lower(), None)
+        if mirror is None:
+            return None
+
+        return _match_case(side, mirror)
+
+    def get_color(self, side, sub_color=False):
+        """
+        Returns override color of the given side defined in project options
+        :param side: str
+        :param sub_color: bool, whether to return the color for sub controls or the color for main controls
+        :return: object or None
+        """
+
+        key = (side, sub_color)
+        if key in self._colors:
+            return self._colors[key]
+
+        side_color = None
+        if self._project:
+            groups = ['Controls', 'controls'] if not sub_color else ['SubControls', 'subcontrols']
+            side_long = self.get_long_name(side)
+            for group in groups:
+                for option_name in (side, side_long, side_long.title()):
+                    if self._project.has_option(option_name, group=group):
+                        side_color = self._project.get_option(option_name, group=group)
+                        if side_color:
+                            break
+                if side_color:
+                    break
+        self._colors[key] = side_color
+
+        return side_color
+
+
+class _SideTableEntry(object):
+    """
+    Internal class that stores a cached side table
+    """
+
+    __slots__ = ('side_table', 'signature', 'generation', 'checked')
+
+    def __init__(self, side_table, signature, generation, checked):
+        super(_SideTableEntry, self).__init__()
+
+        self.side_table = side_table
+        self.signature = signature
+        self.generation = generation
+        self.checked = checked
+
+
+def get_side_table(project, default_sides=None, default_side=None, default_mirror_side=None, generation=None):
+    """
+    Returns side table of the given project
+    Side tables are cached and only created again when project options or project naming file are modified. Files
+    of the same project are checked at most once every SIDE_TABLE_CHECK_INTERVAL seconds
+    :param project: Project or None
+    :param default_sides: list(str) or None
+    :param default_side: str or None
+    :param default_mirror_side: str or None
+    :param generation: int or None, extra value that invalidates the cached table when it changes
+    :return: SideTable
+    """
+
+    # Cached side tables keep a reference to their project, so project ids cannot be reused while they are cached
+    key = (id(project), tuple(default_sides) if default_sides else None, default_side, default_mirror_side)
+    entry = _SIDE_TABLES.get(key)
+    if entry is not None and entry.generation == generation:
+        now = timeit.default_timer()
+        if now - entry.checked < SIDE_TABLE_CHECK_INTERVAL:
+            return entry.side_table
+        if _get_project_signature(project) == entry.signature:
+            entry.checked = now
+            return entry.side_table
+
+    signature = _get_project_signature(project)
+    side_table = SideTable.from_project(
+        project, default_sides=default_sides, default_side=default_side, default_mirror_side=default_mirror_side)
+    _SIDE_TABLES.put(key, _SideTableEntry(side_table, signature, generation, timeit.default_timer()))
+
+    return side_table
+
+
+def clear_side_tables():
+    """
+    Removes all cached side tables
+    """
+
+    _SIDE_TABLES.clear()
+
+
+def _get_project_signature(project):
+    """
+    Internal function that returns a value that changes when the options or the naming file of the project change
+    :param project: Project or None
+    :return: tuple
+    """
+
+    if not project:
+        return None
+
+    option_file = None
+    try:
+        option_file = project.get_option_file()
+    except Exception:
+        pass
+    name_lib = getattr(project, 'naming_lib', None)
+    naming_file = getattr(name_lib, 'naming_file', None) if name_lib else None
+
+    return (
+        getattr(project, 'full_path', None), option_file, cache.get_file_mtime(option_file), naming_file,
+        cache.get_file_mtime(naming_file))
+
+
+def _swap_side(match):
+    side = match.group(0)
+    return _match_case(side, 'right' if side.lower() == 'left' else 'left')
+
+
+def _match_case(source, target):
+    if source.isupper():
+        return target.upper()
+    elif source[:1].isupper():
+        return target[:1].upper() + target[1:]
+
+    return target
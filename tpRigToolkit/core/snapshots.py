@@ -0,0 +1,165 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains configuration snapshots used by tpRigToolkit
+Configurations are loaded once and served as immutable dictionaries. They are only loaded again when their files are
+modified. Each time a configuration changes, snapshot generation is increased, so other caches built from
+configuration data can check if they are still valid
+"""
+
+from __future__ import print_function, division, absolute_import
+
+import timeit
+import logging
+import threading
+
+from tpRigToolkit.core import cache
+
+LOGGER = logging.getLogger('tpRigToolkit-core')
+
+
+class FrozenDict(dict):
+    """
+    Dictionary that cannot be modified
+    """
+
+    def _immutable(self, *args, **kwargs):
+        raise TypeError('{} object does not support item assignment'.format(type(self).__name__))
+
+    __setitem__ = __delitem__ = clear = pop = popitem = setdefault = update = _immutable
+
+    def __reduce__(self):
+        return type(self), (dict(self),)
+
+    def copy(self):
+        return dict(self)
+
+
+def freeze(value):
+    """
+    Returns an immutable version of the given value. Dictionaries are converted into FrozenDict and lists into tuples
+    :param value: object
+    :return: object
+    """
+
+    if isinstance(value, dict):
+        return FrozenDict((key, freeze(item)) for key, item in value.items())
+    elif isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+
+    return value
+
+
+class _ConfigEntry(object):
+    """
+    Internal class that stores a loaded configuration
+    """
+
+    __slots__ = ('data', 'path', 'mtime', 'checked')
+
+    def __init__(self, data, path, mtime, checked):
+        super(_ConfigEntry, self).__init__()
+
+        self.data = data
+        self.path = path
+        self.mtime = mtime
+        self.checked = checked
+
+
+class ConfigSnapshot(object):
+    """
+    Class that stores immutable snapshots of configurations
+    """
+
+    def __init__(self, loader, check_interval=0.5):
+        """
+        :param loader: callable, function that receives a configuration name and an environment and returns a tuple
+            with configuration data (dict) and configuration file path
+        :param check_interval: float, minimum time (in seconds) between two checks of the same configuration file
+        """
+
+        super(ConfigSnapshot, self).__init__()
+
+        self._loader = loader
+        self._check_interval = check_interval
+        self._entries = dict()
+        self._generation = 0
+        self._lock = threading.RLock()
+
+    @property
+    def generation(self):
+        return self._generation
+
+    def get(self, config_name, environment=None):
+        """
+        Returns data of the given configuration
+        :param config_name: str
+        :param environment: str or None
+        :return: FrozenDict
+        """
+
+        return self._get_entry(config_name, environment).data
+
+    def get_value(self, config_name, key, default=None, environment=None):
+        """
+        Returns the value stored in given key of the given configuration
+        :param config_name: str
+        :param key: str
+        :param default: object, value returned if key is not defined or its value is None
+        :param environment: str or None
+        :return: object
+        """
+
+        value = self.get(config_name, environment=environment).get(key, None)
+
+        return default if value is None else value
+
+    def get_path(self, config_name, environment=None):
+        """
+        Returns path of the file of the given configuration
+        :param config_name: str
+        :param environment: str or None
+        :return: str or None
+        """
+
+        return self._get_entry(config_name, environment).path
+
+    def invalidate(self, config_name=None):
+        """
+        Removes given configuration (or all of them) so it is loaded again next time it is requested
+        :param config_name: str or None
+        """
+
+        with self._lock:
+            for key in list(self._entries.keys()):
+                if config_name is None or key[0] == config_name:
+                    self._entries.pop(key)
+            self._generation += 1
+
+    def _get_entry(self, config_name, environment):
+        key = (config_name, environment)
+        entry = self._entries.get(key, None)
+        if entry is not None:
+            now = timeit.default_timer()
+            if now - entry.checked < self._check_interval:
+                return entry
+            if cache.get_file_mtime(entry.path) == entry.mtime:
+                entry.checked = now
+                return entry
+
+        with self._lock:
+            current_entry = self._entries.get(key, None)
+            if current_entry is not entry and current_entry is not None:
+                return current_entry
+            try:
+                data, path = self._loader(config_name, environment)
+            except Exception as exc:
+                LOGGER.warning('Impossible to load configuration "{}": {}'.format(config_name, exc))
+                data, path = dict(), None
+            new_entry = _ConfigEntry(freeze(data or dict()), path, cache.get_file_mtime(path), timeit.default_timer())
+            self._entries[key] = new_entry
+            if entry is None or entry.data != new_entry.data:
+                self._generation += 1
+
+        return new_entry
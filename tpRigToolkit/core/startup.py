@@ -0,0 +1,308 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains implementation for tpRigToolkit startup pipeline
+Startup work is described as a graph of tasks. Tasks that are not tied to the main thread (module imports, file
+parsing, etc) are executed in a thread pool while main thread tasks (Qt and DCC work) are executed in the caller thread
+"""
+
+from __future__ import print_function, division, absolute_import
+
+import logging
+import traceback
+import timeit
+from collections import OrderedDict
+from multiprocessing.pool import ThreadPool
+
+try:
+    import queue
+except ImportError:
+    import Queue as queue
+
+LOGGER = logging.getLogger('tpRigToolkit-core')
+
+
+class StartupTask(object):
+    """
+    Class that defines a unit of work executed by the startup pipeline
+    """
+
+    def __init__(self, name, fn, depends=None, main_thread=False, stage=None):
+        super(StartupTask, self).__init__()
+
+        self.name = name
+        self.fn = fn
+        self.depends = list(depends or list())
+        self.main_thread = main_thread
+        self.stage = stage or name.split('.')[0]
+
+        self.start = None
+        self.end = None
+        self.result = None
+        self.error = None
+        self.skipped = False
+
+    def __repr__(self):
+        return '<{}: {}>'.format(self.__class__.__name__, self.name)
+
+    @property
+    def duration(self):
+        """
+        Returns the time (in seconds) this task took to execute
+        :return: float
+        """
+
+        if self.start is None or self.end is None:
+            return 0.0
+
+        return self.end - self.start
+
+    @property
+    def succeeded(self):
+        """
+        Returns whether or not the task was executed without errors
+        :return: bool
+        """
+
+        return self.end is not None and not self.error and not self.skipped
+
+    def execute(self):
+        """
+        Executes the task function storing its result and timings
+        """
+
+        self.start = timeit.default_timer()
+        try:
+            self.result = self.fn()
+        except Exception as exc:
+            self.error = exc
+            LOGGER.error('Startup task "{}" failed: {}'.format(self.name, exc))
+            LOGGER.debug(traceback.format_exc())
+        finally:
+            self.end = timeit.default_timer()
+
+        return self
+
+
+class StartupPipeline(object):
+    """
+    Class that executes a dependency graph of startup tasks
+    Tasks whose dependencies are satisfied are executed as soon as possible: worker tasks are sent to a thread pool
+    and main thread tasks are executed in the thread that called run function
+    """
+
+    def __init__(self, max_workers=None):
+        """
+        :param max_workers: int or None, number of worker threads. If None, pool default is used. If 0, all tasks
+            are executed serially in the main thread
+        """
+
+        super(StartupPipeline, self).__init__()
+
+        self._max_workers = max_workers
+        self._tasks = OrderedDict()
+        self._start = None
+        self._end = None
+
+    @property
+    def duration(self):
+        """
+        Returns the time (in seconds) the whole pipeline took to execute
+        :return: float
+        """
+
+        if self._start is None or self._end is None:
+            return 0.0
+
+        return self._end - self._start
+
+    def tasks(self):
+        """
+        Returns all tasks added to the pipeline
+        :return: list(StartupTask)
+        """
+
+        return list(self._tasks.values())
+
+    def get_task(self, name):
+        """
+        Returns task with given name
+        :param name: str
+        :return: StartupTask or None
+        """
+
+        return self._tasks.get(name, None)
+
+    def add_task(self, name, fn, depends=None, main_thread=False, stage=None):
+        """
+        Adds a new task into the pipeline
+        :param name: str, unique name of the task
+        :param fn: callable, function that will be called with no arguments
+        :param depends: list(str), names of the tasks that need to be finished before executing this one
+        :param main_thread: bool, whether the task must be executed in the main thread or not
+        :param stage: str, name of the stage this task belongs to. If not given, the first part of the name is used
+        :return: StartupTask
+        """
+
+        if name in self._tasks:
+            raise ValueError('Startup task "{}" is already registered!'.format(name))
+
+        task = StartupTask(name, fn, depends=depends, main_thread=main_thread, stage=stage)
+        self._tasks[name] = task
+
+        return task
+
+    def run(self):
+        """
+        Executes all the tasks of the pipeline taking into account their dependencies
+        :return: OrderedDict(str, object), task results
+        """
+
+        self._validate()
+
+        use_pool = self._max_workers != 0 and any(not task.main_thread for task in self._tasks.values())
+        pool = ThreadPool(self._max_workers) if use_pool else None
+        finished_queue = queue.Queue()
+
+        pending = list(self._tasks.values())
+        finished = set()
+        running = 0
+
+        def _on_finished(task):
+            finished_queue.put(task)
+
+        self._start = timeit.default_timer()
+        try:
+            while pending or running:
+                while True:
+                    try:
+                        finished_task = finished_queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    finished.add(finished_task.name)
+                    running -= 1
+
+                ready = [task for task in pending if all(dep in finished for dep in task.depends)]
+                main_task = None
+                for task in ready:
+                    failed_deps = [dep for dep in task.depends if not self._tasks[dep].succeeded]
+                    if failed_deps:
+                        LOGGER.warning('Skipping startup task "{}" because its dependencies failed: {}'.format(
+                            task.name, ', '.join(failed_deps)))
+                        task.skipped = True
+                        pending.remove(task)
+                        finished.add(task.name)
+                        continue
+                    if task.main_thread or not pool:
+                        main_task = main_task or task
+                        continue
+                    pending.remove(task)
+                    running += 1
+                    pool.apply_async(task.execute, callback=_on_finished)
+
+                if main_task:
+                    pending.remove(main_task)
+                    main_task.execute()
+                    finished.add(main_task.name)
+                    continue
+
+                if running:
+                    finished_task = finished_queue.get()
+                    finished.add(finished_task.name)
+                    running -= 1
+        finally:
+            if pool:
+                pool.close()
+                pool.join()
+            self._end = timeit.default_timer()
+
+        return OrderedDict((task.name, task.result) for task in self._tasks.values())
+
+    def critical_path(self, stage=None):
+        """
+        Returns the chain of tasks that determined the total duration of the pipeline (or of the given stage)
+        :param stage: str or None
+        :return: list(StartupTask)
+        """
+
+        tasks = [task for task in self._tasks.values() if task.end is not None and (not stage or task.stage == stage)]
+        if not tasks:
+            return list()
+
+        path = list()
+        current = max(tasks, key=lambda t: t.end)
+        while current:
+            path.append(current)
+            deps = [self._tasks[dep] for dep in current.depends]
+            deps = [dep for dep in deps if dep.end is not None and (not stage or dep.stage == stage)]
+            current = max(deps, key=lambda t: t.end) if deps else None
+
+        return list(reversed(path))
+
+    def report(self):
+        """
+        Returns a dictionary with the timings of each one of the stages of the pipeline
+        :return: OrderedDict(str, dict)
+        """
+
+        stages = OrderedDict()
+        for task in self._tasks.values():
+            stages.setdefault(task.stage, list()).append(task)
+
+        report = OrderedDict()
+        for stage, tasks in stages.items():
+            executed = [task for task in tasks if task.end is not None]
+            start = min(task.start for task in executed) if executed else 0.0
+            end = max(task.end for task in executed) if executed else 0.0
+            report[stage] = {
+                'duration': end - start,
+                'tasks': len(tasks),
+                'failed': [task.name for task in tasks if task.error or task.skipped],
+                'critical_path': [(task.name, task.duration) for task in self.critical_path(stage=stage)]
+            }
+
+        return report
+
+    def log_report(self, logger=None):
+        """
+        Logs pipeline report
+        :param logger: Logger or None
+        """
+
+        logger = logger or LOGGER
+
+        logger.info('Startup finished in {:.3f} seconds'.format(self.duration))
+        for stage, stage_data in self.report().items():
+            critical_path = ' > '.join(
+                '{} ({:.3f}s)'.format(name, duration) for name, duration in stage_data['critical_path'])
+            logger.info('\t{}: {:.3f}s | {} task/s | critical path: {}'.format(
+                stage, stage_data['duration'], stage_data['tasks'], critical_path))
+            if stage_data['failed']:
+                logger.warning('\t{}: failed task/s: {}'.format(stage, ', '.join(stage_data['failed'])))
+
+    def _validate(self):
+        """
+        Internal function that checks that all dependencies exist and that there are no cycles in the graph
+        """
+
+        for task in self._tasks.values():
+            for dep in task.depends:
+                if dep not in self._tasks:
+                    raise ValueError('Startup task "{}" depends on unknown task "{}"'.format(task.name, dep))
+
+        visited = dict()
+
+        def _visit(task_name, stack):
+            state = visited.get(task_name)
+            if state == 1:
+                return
+            if state == 0:
+                raise ValueError('Startup tasks contain a dependency cycle: {}'.format(' > '.join(stack + [task_name])))
+            visited[task_name] = 0
+            for dep in self._tasks[task_name].depends:
+                _visit(dep, stack + [task_name])
+            visited[task_name] = 1
+
+        for name in self._tasks:
+            _visit(name, list())
@@ -11,10 +11,14 @@ import os
 import logging
 
 from tpDcc import dcc
-from tpDcc.libs.python import folder, fileio, version, path as path_utils
+from tpDcc.libs.python import path as path_utils
+
+from tpRigToolkit.core import cache, objectstore
 
 LOGGER = logging.getLogger('tpRigToolkit-core')
 
+LEGACY_VERSION_FOLDER = '__version__'
+
 
 def get_data_files_directory():
     """
@@ -35,6 +39,8 @@ def get_data_files_directory():
 def copy(source, target, description=''):
     """
     Copies given file or files and creates a new version of the file with the given description
+    Versions are stored in the object store of the target, so files shared by multiple versions are only stored once
+    Copied files are not hard linked to the object store because data files are modified in place when saved
     :param source: str, source file or folder we want to copy
     :param target: str, destination file or folder we want to copy into
     :param description: str, description of the new version
@@ -42,25 +48,110 @@ def copy(source, target, description=''):
 
     is_source_a_file = path_utils.is_file(source)
 
-    if is_source_a_file:
-        copied_path = fileio.copy_file(source, target)
-    else:
-        if not path_utils.exists(source):
-            LOGGER.info('Nothing to copy: {}\t\tData was probably created but not saved yet.'.format(
-                path_utils.get_dirname(is_source_a_file)))
-            return
-        if path_utils.exists(target):
-            folder.delete_folder(target)
-        copied_path = folder.copy_folder(source, target)
-
-    if not copied_path:
-        LOGGER.warning('Error copying {}\t to\t{}'.format(source, target))
+    if not is_source_a_file and not path_utils.exists(source):
+        LOGGER.info('Nothing to copy: {}\t\tData was probably created but not saved yet.'.format(
+            path_utils.get_dirname(is_source_a_file)))
         return
 
-    if copied_path > -1:
-        LOGGER.info('Finished copying {} from {} to {}'.format(description, source, target))
-        version_file = version.VersionFile(copied_path)
-        version_file.save('Copied from {}'.format(source))
+    try:
+        version = create_version(target, comment='Copied from {}'.format(source), source=source)
+        restore_version(target, version=version)
+    except Exception as exc:
+        LOGGER.warning('Error copying {}\t to\t{}: {}'.format(source, target, exc))
+        return
+
+    LOGGER.info('Finished copying {} from {} to {}'.format(description, source, target))
+
+
+def create_version(file_path, comment='', source=None):
+    """
+    Stores a new version of the given file or folder in its object store
+    Object store versions replace the version folders of tpDcc VersionFile
+    :param file_path: str, file or folder whose version is created
+    :param comment: str
+    :param source: str or None, file or folder stored as the new version. If None, given file or folder is stored
+    :return: int, number of the new version
+    """
+
+    store = objectstore.get_object_store(file_path)
+
+    return store.create_version(objectstore.get_version_name(store, file_path), source or file_path, comment=comment)
+
+
+def get_versions(file_path):
+    """
+    Returns the data of all the stored versions of the given file or folder, from the oldest to the newest one
+    Versions saved with tpDcc VersionFile are returned first, flagged as legacy versions. They are only listed, they
+    cannot be restored with restore_version function
+    :param file_path: str
+    :return: list(dict), number, comment, user and date of each version
+    """
+
+    store = objectstore.get_object_store(file_path)
+    version_name = objectstore.get_version_name(store, file_path)
+
+    versions = get_legacy_versions(file_path)
+    for version in store.get_version_numbers(version_name):
+        manifest = store.get_version(version_name, version)
+        if not manifest:
+            continue
+        versions.append({
+            'version': version,
+            'comment': manifest.get('comment', ''),
+            'user': manifest.get('user', ''),
+            'date': manifest.get('date', None),
+            'legacy': False
+        })
+
+    return versions
+
+
+def get_legacy_versions(file_path):
+    """
+    Returns the data of the versions of the given file or folder saved with tpDcc VersionFile
+    VersionFile stores the versions of a folder in its __version__ folder and the versions of a file in the
+    __version__ folder of its directory, so the versions of all the files of a directory are returned
+    :param file_path: str
+    :return: list(dict), number, comment, user and path of each legacy version
+    """
+
+    if os.path.isdir(file_path):
+        version_folder = os.path.join(file_path, LEGACY_VERSION_FOLDER)
+    else:
+        version_folder = os.path.join(os.path.dirname(file_path), LEGACY_VERSION_FOLDER)
+    comments_file = os.path.join(version_folder, 'comments.json')
+    comments_data = cache.read_json(comments_file) if os.path.isfile(comments_file) else None
+    if not isinstance(comments_data, list):
+        return list()
+
+    versions = list()
+    for version_data in comments_data:
+        version = str(version_data.get('version', '')) if isinstance(version_data, dict) else ''
+        if not version.isdigit():
+            continue
+        versions.append({
+            'version': int(version),
+            'comment': version_data.get('comment', ''),
+            'user': version_data.get('user', ''),
+            'date': None,
+            'legacy': True,
+            'path': os.path.join(version_folder, '.{}'.format(version))
+        })
+
+    return sorted(versions, key=lambda version_data: version_data['version'])
+
+
+def restore_version(file_path, version=None, link=False):
+    """
+    Restores given version of the given file or folder
+    :param file_path: str
+    :param version: int or None, if None, latest version is restored
+    :param link: bool, whether restored files are hard linked to the object store. Linked files are read-only, so
+        they can only be used by code that replaces files instead of modifying them in place
+    """
+
+    store = objectstore.get_object_store(file_path)
+    store.checkout(objectstore.get_version_name(store, file_path), file_path, version=version, link=link)
 
 
 def get_custom(name, default=''):
@@ -7,10 +7,14 @@ Module that contains Space Switch data
 
 from __future__ import print_function, division, absolute_import
 
+import logging
+
 from tpDcc.core import data
 from tpDcc.libs.qt.widgets.library import savewidget
 
-from tpRigToolkit.core import data as rig_data
+from tpRigToolkit.core import container, data as rig_data
+
+LOGGER = logging.getLogger('tpRigToolkit-core')
 
 
 class SpaceSwitchFileData(data.CustomData, object):
@@ -29,6 +33,50 @@ class SpaceSwitchFileData(data.CustomData, object):
     def get_data_title():
         return 'Space Switch'
 
+    def read_sections(self, section_names=None):
+        """
+        Returns the given sections of the space switch file
+        Container files only read the given sections. Legacy JSON files are fully read
+        :param section_names: list(str) or None, sections to read. If None, all sections are read
+        :return: OrderedDict
+        """
+
+        return container.read_document(self.get_file(), section_names=section_names)
+
+    def get_section_names(self):
+        """
+        Returns the names of the sections stored in the space switch file
+        Container files only read their index, so large files can be previewed without reading their sections
+        :return: list(str)
+        """
+
+        file_path = self.get_file()
+        if container.is_container(file_path):
+            with container.ContainerReader(file_path) as reader:
+                return reader.get_section_names()
+
+        document = container.read_document(file_path)
+
+        return list(document.keys()) if isinstance(document, dict) else list()
+
+    def write_sections(self, sections, metadata=None):
+        """
+        Stores given sections into the space switch file using the chunked container format
+        :param sections: dict(str, object)
+        :param metadata: dict or None
+        """
+
+        container.write_document(self.get_file(), sections, metadata=metadata)
+
+    def convert_to_container(self):
+        """
+        Converts legacy JSON space switch file into the chunked container format
+        Converted files must be read with read_sections or get_section_names functions, which support both formats
+        :return: str
+        """
+
+        return container.convert_json_file(self.get_file())
+
 
 class SpaceSwitchPreviewWidget(rig_data.DataPreviewWidget, object):
     def __init__(self, item, parent=None):
@@ -66,3 +114,25 @@ class SpaceSwitch(rig_data.DataItem, object):
         super(SpaceSwitch, self).__init__(*args, **kwargs)
 
         self.set_data_class(SpaceSwitchFileData)
+
+    def load_schema(self):
+        """
+        Overrides base items.BaseItem load_schema function
+        Shows the sections stored in the space switch file. Only the index of container files is read
+        :return: list(dict)
+        """
+
+        schema = super(SpaceSwitch, self).load_schema() or list()
+
+        try:
+            section_names = self.data_object().get_section_names()
+        except (IOError, OSError, ValueError) as exc:
+            LOGGER.warning('Impossible to read space switch file sections: {}'.format(exc))
+            section_names = list()
+
+        schema.extend([
+            {'name': 'spaceSwitchGroup', 'title': 'Space Switch', 'type': 'group'},
+            {'name': 'sections', 'type': 'label', 'value': ', '.join(section_names) or '-'}
+        ])
+
+        return schema
@@ -14,30 +14,80 @@ __email__ = "tpovedatd@gmail.com"
 
 import os
 import logging.config
+import importlib
+from functools import partial
+
+# Profiler is started before importing any other module so their import times are also recorded
+from tpRigToolkit.core import profiler
+if profiler.is_enabled():
+    profiler.get_profiler().start()
 
-import tpDcc.loader as dcc_loader
-from tpDcc.libs.python import contexts
 from tpDcc.core import dcc as core_dcc
-from tpDcc.managers import configs, resources, libs, tools, menus
-from tpDcc.libs.qt.managers import toolsets as qt_toolsets
+from tpDcc.managers import configs, libs
 
 import tpRigToolkit.config
 import tpRigToolkit.toolsets
+from tpRigToolkit.core import logs, startup, lazytools, manifest
 
 # =================================================================================
 
 PACKAGE = 'tpRigToolkit'
+HEADLESS_ENV = 'TPRIGTOOLKIT_HEADLESS'
+
+LOGGER = logging.getLogger('tpRigToolkit-core')
+
+_LAZY_TOOLS = None
+_LOGGER_CONFIGURED = False
 
 # =================================================================================
 
 
-def init(import_libs=True, dev=False):
+def init(import_libs=True, dev=False, parallel=True, lazy_tools=False, use_cache=True, headless=None, profile=None):
     """
     Initializes tpRigToolkit module
     :param import_libs: bool, Whether to import deps libraries by default or not
     :param dev: bool, Whether tpRigToolkit is initialized in dev mode or not
+    :param parallel: bool, Whether libraries and tools modules are imported in a thread pool or not
+    :param lazy_tools: bool, Whether tools are registered as stubs and imported the first time they are launched
+    :param use_cache: bool, Whether startup manifest cache is used to skip file system discovery or not
+    :param headless: bool or None, Whether to initialize tpRigToolkit without UI. If None, TPRIGTOOLKIT_HEADLESS
+        environment variable is checked
+    :param profile: bool or None, Whether to write a startup profile report into the logs folder. If None,
+        TPRIGTOOLKIT_PROFILE environment variable is checked
+    """
+
+    if profile is None:
+        profile = profiler.is_enabled()
+    if not profile:
+        return _init(
+            import_libs=import_libs, dev=dev, parallel=parallel, lazy_tools=lazy_tools, use_cache=use_cache,
+            headless=headless)
+
+    import_profiler = profiler.get_profiler()
+    import_profiler.start()
+    try:
+        with import_profiler.section('init', PACKAGE):
+            return _init(
+                import_libs=import_libs, dev=dev, parallel=parallel, lazy_tools=lazy_tools, use_cache=use_cache,
+                headless=headless)
+    finally:
+        import_profiler.stop()
+        report_path, stacks_path = import_profiler.write_report(get_logs_directory())
+        LOGGER.info('Startup profile report written: {} | {}'.format(report_path, stacks_path))
+
+
+def _init(import_libs=True, dev=False, parallel=True, lazy_tools=False, use_cache=True, headless=None):
+    """
+    Internal function that initializes tpRigToolkit module
     """
 
+    if headless is None:
+        headless = is_headless()
+    if headless:
+        return init_headless(dev=dev, use_cache=use_cache)
+
+    import tpDcc.loader as dcc_loader
+
     logger = create_logger(dev=dev)
 
     if import_libs:
@@ -50,46 +100,227 @@ def init(import_libs=True, dev=False):
     register_resources()
 
     # Register configuration files
-    configs.register_package_configs(PACKAGE, os.path.dirname(tpRigToolkit.config.__file__))
-    core_config = configs.get_config('tpRigToolkit-core', environment='development' if dev else 'production')
-    if not core_config:
+    startup_data = get_startup_data(dev=dev, use_cache=use_cache)
+    if not startup_data:
         logger.warning(
             'tpRigToolkit-core configuration file not found! '
             'Make sure that you have tpRigToolkit-config package installed!')
         return None
 
-    libs_to_load = core_config.get('libs', list())
+    pipeline = create_startup_pipeline(
+        libs_to_load=startup_data['libs'], tools_to_load=startup_data['tools'],
+        dependencies=startup_data['dependencies'], dev=dev, parallel=parallel, lazy_tools=lazy_tools,
+        tools_ui=startup_data['tools_ui'], toolsets_path=startup_data['toolsets_path'],
+        toolsets_menus=startup_data['menus'])
+    active_profiler = profiler.get_active_profiler()
+    if active_profiler:
+        for task in pipeline.tasks():
+            task.fn = active_profiler.wrap('task', task.name, task.fn)
+    pipeline.run()
+    pipeline.log_report(logger)
+
+    return pipeline
+
+
+def init_headless(dev=False, use_cache=True):
+    """
+    Initializes tpRigToolkit without importing any Qt dependent module (batch/farm rig builds)
+    Configuration files, naming library and data directories are registered. Libraries, tools, toolsets and menus
+    are not loaded
+    :param dev: bool
+    :param use_cache: bool
+    :return: dict or None, startup data
+    """
+
+    from tpRigToolkit.core import utils
+    from tpRigToolkit.managers import names, scripts
+
+    logger = create_logger(dev=dev)
+
+    startup_data = get_startup_data(dev=dev, use_cache=use_cache)
+    if not startup_data:
+        logger.warning(
+            'tpRigToolkit-core configuration file not found! '
+            'Make sure that you have tpRigToolkit-config package installed!')
+        return None
+
+    with profiler.section('config', 'tpRigToolkit-names'):
+        names.init_lib(dev=dev)
+
+    for data_directory in utils.get_data_files_directory():
+        scripts.add_directory(data_directory)
+
+    logger.info('tpRigToolkit initialized in headless mode')
+
+    return startup_data
+
+
+def is_headless():
+    """
+    Returns whether tpRigToolkit should be initialized in headless mode
+    :return: bool
+    """
+
+    return os.environ.get(HEADLESS_ENV, '').lower() in ('1', 'true', 'yes')
+
+
+def get_startup_data(dev=False, use_cache=True):
+    """
+    Registers tpRigToolkit configuration files and returns all the data needed to initialize tpRigToolkit
+    If a valid startup manifest exists, its data is used instead of scanning and parsing configuration files
+    :param dev: bool
+    :param use_cache: bool
+    :return: dict or None
+    """
+
+    environment = 'development' if dev else 'production'
+    config_path = os.path.dirname(os.path.abspath(tpRigToolkit.config.__file__))
+    toolsets_path = os.path.dirname(os.path.abspath(tpRigToolkit.toolsets.__file__))
+
+    startup_manifest = manifest.StartupManifest(name='startup_{}'.format(environment))
+    fingerprint = None
+    if use_cache:
+        fingerprint = startup_manifest.get_fingerprint(
+            [os.path.dirname(os.path.abspath(__file__)), config_path], versions=[_get_version()])
+        startup_data = startup_manifest.load(fingerprint)
+        if startup_data:
+            for config_environment, module_names in startup_data['config_modules'].items():
+                for module_name in module_names:
+                    configs.register_package_path(
+                        PACKAGE, module_name, config_path, environment=config_environment, config_extension='.yml')
+            return startup_data
+
+    with profiler.section('config', 'register_package_configs'):
+        configs.register_package_configs(PACKAGE, config_path)
+    with profiler.section('config', 'tpRigToolkit-core'):
+        core_config = configs.get_config('tpRigToolkit-core', environment=environment)
+    if not core_config:
+        return None
+
     tools_to_load = core_config.get('tools', list())
+    startup_data = {
+        'config_modules': manifest.get_config_modules(config_path),
+        'libs': core_config.get('libs', list()),
+        'tools': tools_to_load,
+        'tool_ids': ['{}-tools-{}'.format(PACKAGE, tool_name) for tool_name in tools_to_load],
+        'dependencies': core_config.get('dependencies', dict()) or dict(),
+        'tools_ui': core_config.get('tools_ui', dict()) or dict(),
+        'toolsets_path': toolsets_path,
+        'menus': lazytools.get_toolsets_menus(toolsets_path)
+    }
+    if use_cache:
+        startup_manifest.save(fingerprint, startup_data)
+
+    return startup_data
+
+
+def create_startup_pipeline(
+        libs_to_load, tools_to_load, dependencies=None, dev=False, parallel=True, lazy_tools=False, tools_ui=None,
+        toolsets_path=None, toolsets_menus=None):
+    """
+    Returns the startup pipeline used to load tpRigToolkit libraries, tools, toolsets and menus
+    Libraries and tools modules are imported in worker threads while their registration and all Qt related work
+    is done in the main thread
+    :param libs_to_load: list(str), names of the libraries to load
+    :param tools_to_load: list(str), names of the tools to load
+    :param dependencies: dict(str, list(str)), maps library/tool names with the libraries/tools they depend on
+    :param dev: bool
+    :param parallel: bool
+    :param lazy_tools: bool, whether tools are registered as stubs instead of being imported
+    :param tools_ui: dict(str, dict), label and icon used by the stub of each tool
+    :param toolsets_path: str or None, path where toolsets are located
+    :param toolsets_menus: dict(str, list(str)) or None, menus of each tool defined in toolsets
+    :return: StartupPipeline
+    """
+
+    dependencies = dependencies or dict()
+    pipeline = startup.StartupPipeline(max_workers=None if parallel else 0)
+
+    import_tasks = dict()
+    for category, names in (('libs', libs_to_load), ('tools', list() if lazy_tools else tools_to_load)):
+        for name in names:
+            module_path = '{}.{}.{}'.format(PACKAGE, category, name)
+            import_tasks[name] = '{}.import.{}'.format(category, name)
+            pipeline.add_task(import_tasks[name], partial(_import_module, module_path), stage=category)
+
+    for name, task_name in import_tasks.items():
+        task = pipeline.get_task(task_name)
+        for dependency in dependencies.get(name, list()):
+            if dependency in import_tasks and import_tasks[dependency] != task_name:
+                task.depends.append(import_tasks[dependency])
+            else:
+                LOGGER.warning('Startup dependency "{}" of "{}" is not a registered library or tool'.format(
+                    dependency, name))
+        if task_name.startswith('tools.'):
+            task.depends.append('libs.load')
+
+    pipeline.add_task(
+        'libs.load', partial(_load_libs, libs_to_load, dev=dev), main_thread=True,
+        depends=[import_tasks[name] for name in libs_to_load])
+    if lazy_tools:
+        pipeline.add_task(
+            'tools.load', partial(
+                _register_tool_stubs, tools_to_load, tools_ui=tools_ui, toolsets_menus=toolsets_menus,
+                toolsets_path=toolsets_path, dev=dev), main_thread=True, depends=['libs.load'])
+    else:
+        pipeline.add_task(
+            'tools.load', partial(_load_tools, tools_to_load, dev=dev), main_thread=True,
+            depends=['libs.load'] + [import_tasks[name] for name in tools_to_load])
+    pipeline.add_task(
+        'toolsets.load', partial(
+            _load_toolsets, list() if lazy_tools else tools_to_load, toolsets_path=toolsets_path), main_thread=True,
+        depends=['tools.load'])
+    pipeline.add_task('menus.create', partial(_create_menus, dev=dev), main_thread=True, depends=['toolsets.load'])
+    if lazy_tools:
+        pipeline.add_task('menus.stubs', _create_tool_stubs_menus, main_thread=True, depends=['menus.create'])
+
+    return pipeline
+
+
+def get_lazy_tools_registry():
+    """
+    Returns registry that contains the tool stubs registered when tpRigToolkit was initialized in lazy tools mode
+    :return: LazyToolsRegistry or None
+    """
 
-    with contexts.Timer('Libraries loaded', logger=logger):
-        libs.LibsManager().register_package_libs(PACKAGE, libs_to_register=libs_to_load, dev=dev)
-        libs.LibsManager().load_registered_libs(PACKAGE)
+    return _LAZY_TOOLS
 
-    with contexts.Timer('Tools loaded', logger=logger):
-        tools.ToolsManager().register_package_tools(PACKAGE, tools_to_register=tools_to_load, dev=dev)
-        tools.ToolsManager().load_registered_tools(PACKAGE)
 
-    with contexts.Timer('Toolsets loaded', logger=logger):
-        qt_toolsets.ToolsetsManager().register_path(
-            PACKAGE, os.path.dirname(os.path.abspath(tpRigToolkit.toolsets.__file__)))
-        qt_toolsets.ToolsetsManager().load_registered_toolsets(package_name=PACKAGE, tools_to_load=tools_to_load)
+def get_logs_directory():
+    """
+    Returns directory where tpRigToolkit logs are stored
+    :return: str
+    """
 
-    with contexts.Timer('Menu created', logger=logger):
-        menus.create_menus(package_name=PACKAGE, dev=dev)
+    return os.path.normpath(os.path.join(os.path.expanduser('~'), 'tpRigToolkit', 'logs'))
 
 
-def create_logger(dev=False):
+def create_logger(dev=False, async_logging=None):
     """
     Returns logger of current module
+    Logging configuration file is only loaded the first time this function is called
+    :param dev: bool
+    :param async_logging: bool or None, Whether log files are written from a background thread or not. If None,
+        TPRIGTOOLKIT_ASYNC_LOGGING environment variable is checked
     """
 
-    logger_dir = os.path.normpath(os.path.join(os.path.expanduser('~'), 'tpRigToolkit', 'logs'))
-    if not os.path.isdir(logger_dir):
-        os.makedirs(logger_dir)
+    global _LOGGER_CONFIGURED
+
+    if not _LOGGER_CONFIGURED:
+        logger_dir = get_logs_directory()
+        if not os.path.isdir(logger_dir):
+            os.makedirs(logger_dir)
 
-    logging_config = os.path.normpath(os.path.join(os.path.dirname(__file__), '__logging__.ini'))
+        logging_config = os.path.normpath(os.path.join(os.path.dirname(__file__), '__logging__.ini'))
+
+        logging.config.fileConfig(logging_config, disable_existing_loggers=False)
+        _LOGGER_CONFIGURED = True
+
+    if async_logging is None:
+        async_logging = logs.is_async_logging_enabled()
+    if async_logging:
+        logs.make_file_handlers_async(logging.getLogger('tpRigToolkit-core'))
 
-    logging.config.fileConfig(logging_config, disable_existing_loggers=False)
     logger = logging.getLogger('tpRigToolkit')
     if dev:
         logger.setLevel(logging.DEBUG)
@@ -104,8 +335,174 @@ def register_resources():
     Registers tpDcc.libs.qt resources path
     """
 
+    from tpDcc.managers import resources
+
     resources_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'resources')
     resources.register_resource(resources_path, key='tpRigToolkit-core')
 
 
+def _import_module(module_path):
+    """
+    Internal function that imports given module so later registration does not need to wait for it
+    Import errors are not raised: the managers will report them during registration
+    :param module_path: str
+    :return: module or None
+    """
+
+    try:
+        return importlib.import_module(module_path)
+    except Exception as exc:
+        LOGGER.debug('Impossible to import "{}" during startup: {}'.format(module_path, exc))
+        return None
+
+
+def _load_libs(libs_to_load, dev=False):
+    """
+    Internal function that registers and loads tpRigToolkit libraries
+    :param libs_to_load: list(str)
+    :param dev: bool
+    """
+
+    libs.LibsManager().register_package_libs(PACKAGE, libs_to_register=libs_to_load, dev=dev)
+    libs.LibsManager().load_registered_libs(PACKAGE)
+
+
+def _load_tools(tools_to_load, dev=False):
+    """
+    Internal function that registers and loads tpRigToolkit tools
+    :param tools_to_load: list(str)
+    :param dev: bool
+    """
+
+    from tpDcc.managers import tools
+
+    # Each tool is registered and loaded in its own profiler section so slow tools can be found in startup reports
+    for tool_name in tools_to_load:
+        with profiler.section('tool', tool_name):
+            tools.ToolsManager().register_package_tools(PACKAGE, tools_to_register=[tool_name], dev=dev)
+            tools.ToolsManager().load_registered_tools(PACKAGE)
+
+
+def _load_toolsets(tools_to_load, toolsets_path=None):
+    """
+    Internal function that registers and loads tpRigToolkit toolsets
+    :param tools_to_load: list(str)
+    :param toolsets_path: str or None
+    """
+
+    from tpDcc.libs.qt.managers import toolsets as qt_toolsets
+
+    qt_toolsets.ToolsetsManager().register_path(
+        PACKAGE, toolsets_path or os.path.dirname(os.path.abspath(tpRigToolkit.toolsets.__file__)))
+    qt_toolsets.ToolsetsManager().load_registered_toolsets(package_name=PACKAGE, tools_to_load=tools_to_load)
+
+
+def _get_version():
+    """
+    Internal function that returns current tpRigToolkit version
+    :return: str or None
+    """
+
+    try:
+        from tpRigToolkit import __version__
+        return __version__.get_version()
+    except Exception:
+        return None
+
+
+def _register_tool_stubs(tools_to_load, tools_ui=None, toolsets_menus=None, toolsets_path=None, dev=False):
+    """
+    Internal function that registers stubs for tpRigToolkit tools instead of loading them
+    :param tools_to_load: list(str)
+    :param tools_ui: dict(str, dict)
+    :param toolsets_menus: dict(str, list(str)) or None
+    :param toolsets_path: str or None
+    :param dev: bool
+    :return: LazyToolsRegistry
+    """
+
+    from tpDcc.managers import tools
+
+    global _LAZY_TOOLS
+
+    tools_ui = tools_ui or dict()
+    if toolsets_menus is None:
+        toolsets_menus = lazytools.get_toolsets_menus(
+            toolsets_path or os.path.dirname(os.path.abspath(tpRigToolkit.toolsets.__file__)))
+
+    registry = lazytools.LazyToolsRegistry(load_fn=partial(_load_lazy_tools, dev=dev))
+    for tool_name in tools_to_load:
+        tool_id = '{}-tools-{}'.format(PACKAGE, tool_name)
+        tool_ui = tools_ui.get(tool_name, dict())
+        registry.register_stub(lazytools.ToolStub(
+            tool_id, tool_name, label=tool_ui.get('label'), icon=tool_ui.get('icon'),
+            menu=toolsets_menus.get(tool_id, list())))
+    registry.install(tools.ToolsManager())
+    _LAZY_TOOLS = registry
+
+    return registry
+
+
+def _load_lazy_tools(tools_to_load, dev=False):
+    """
+    Internal function used by lazy tools registry to load the real tools the first time they are used
+    :param tools_to_load: list(str)
+    :param dev: bool
+    """
+
+    _load_tools(tools_to_load, dev=dev)
+    with profiler.section('toolsets', ', '.join(tools_to_load)):
+        _load_toolsets(tools_to_load)
+
+
+def _create_tool_stubs_menus():
+    """
+    Internal function that adds a menu entry for each one of the registered tool stubs
+    """
+
+    from Qt.QtWidgets import QMenu
+    from tpDcc.managers import resources, menus
+
+    if not _LAZY_TOOLS:
+        return
+
+    main_menu = menus.get_menu(PACKAGE, package_name=PACKAGE)
+    if main_menu is None:
+        LOGGER.warning('Impossible to create tools stubs menus because {} menu was not found!'.format(PACKAGE))
+        return
+
+    for stub in _LAZY_TOOLS.stubs():
+        parent_menu = main_menu
+        for menu_label in stub.menu or list():
+            sub_menu = parent_menu.findChild(QMenu, menu_label)
+            if sub_menu is None:
+                sub_menu = parent_menu.addMenu(menu_label)
+                sub_menu.setObjectName(menu_label)
+            parent_menu = sub_menu
+        action = parent_menu.addAction(resources.icon(stub.icon), stub.label)
+        action.triggered.connect(partial(_launch_tool, stub.id))
+
+
+def _create_menus(dev=False):
+    """
+    Internal function that creates tpRigToolkit menus
+    :param dev: bool
+    """
+
+    from tpDcc.managers import menus
+
+    return menus.create_menus(package_name=PACKAGE, dev=dev)
+
+
+def _launch_tool(tool_id, *args):
+    """
+    Internal function that launches tool with given ID from a menu entry
+    :param tool_id: str
+    """
+
+    from tpDcc.managers import tools
+
+    return tools.ToolsManager().launch_tool_by_id(tool_id)
+
+
 create_logger()
@@ -9,30 +9,56 @@ from __future__ import print_function, division, absolute_import
 
 import os
 import logging
-import pkgutil
-import inspect
-import traceback
+import threading
+from collections import OrderedDict
 
+from tpDcc import dcc
 from tpDcc.core import scripts, data as core_data
-from tpDcc.libs.python import path, decorators
+from tpDcc.libs.python import decorators
 from tpDcc.libs.qt.widgets.library import manager
 
-from tpRigToolkit.core import data, utils
+from tpRigToolkit.core import data, utils, batch, registry, discovery, indexer
 
 LOGGER = logging.getLogger('tpRigToolkit-core')
 
+BACKGROUND_INDEXING_ENV = 'TPRIGTOOLKIT_BACKGROUND_DATA_INDEXING'
+
+_DATA_CLASSES_DISCOVERY = discovery.ClassDiscovery('data_classes', core_data.FileData)
+_DATA_ITEMS_DISCOVERY = discovery.ClassDiscovery('data_items', data.DataItem)
+
 
 @decorators.add_metaclass(decorators.Singleton)
 class DataManager(manager.LibraryManager, object):
-    def __init__(self, settings=None, directories=None, update_on_init=True):
+    def __init__(self, settings=None, directories=None, update_on_init=True, background=None):
+        """
+        :param settings: settings or None
+        :param directories: list(str) or None, extra directories where data should be find
+        :param update_on_init: bool
+        :param background: bool or None, whether data directories are scanned in a background thread. If None,
+            TPRIGTOOLKIT_BACKGROUND_DATA_INDEXING environment variable is checked (disabled by default)
+        """
+
         super(DataManager, self).__init__(settings=settings)
 
         data_dirs = utils.get_data_files_directory()
         data_dirs.extend(directories or list())
 
+        if background is None:
+            background = os.environ.get(BACKGROUND_INDEXING_ENV, '').lower() in ('1', 'true', 'yes', 'on')
+
         self._directories = list(set(data_dirs))
         self._loaded_data_items = list()
         self._loaded_data_classes = list()
+        self._registry = None
+        self._background = background
+        self._indexed_items = OrderedDict()
+        self._scanned_directories = list()
+        self._registered_items = set()
+        self._index_listeners = list()
+        self._index_lock = threading.RLock()
+        self._indexer = indexer.BackgroundIndexer(
+            _scan_directory, on_indexed=self._on_directory_indexed, extensions=('.py',),
+            name='tpRigToolkit-data-indexer')
 
         self.standard_data_classes = [
             scripts.ScriptManifestData,
@@ -66,11 +92,7 @@ class DataManager(manager.LibraryManager, object):
         :return: list<str>
         """
 
-        data_types = list()
-        for data_class in self.get_all_data_classes():
-            data_types.append(data_class.get_data_type())
-
-        return data_types
+        return self.get_registry().get_data_types()
 
     # def add_directory(self, directory, do_update=False):
     #     """
@@ -98,7 +120,8 @@ class DataManager(manager.LibraryManager, object):
 
         if new_dir:
             self.update_data_classes(do_reload=True)
-            self.update_data_items(do_reload=True)
+            # Only new directories are indexed
+            self.update_data_items()
 
     # def update_data_classes(self, do_reload=False):
     #     """
@@ -116,16 +139,98 @@ class DataManager(manager.LibraryManager, object):
     def update_data_items(self, do_reload=False):
         """
         Adds custom dat files located in the current data manager registered directories
+        By default, directories are indexed and their items registered before returning. If background indexing is
+        enabled, directories are scanned in a background thread and only the items of the directories scanned until
+        now are returned. Items of the rest of directories are added the next time items or registry are requested
+        :param do_reload: bool, whether all directories are indexed again
+        :return: list
         """
 
-        if not self._loaded_data_items or do_reload:
-            for d in self._directories:
-                self._loaded_data_items.extend(self._load_data_items(d))
-            for data_item in self._loaded_data_items:
-                self.register_item(data_item)
+        self._indexer.add_directories(self._directories)
+        if do_reload:
+            self._indexer.refresh()
+        if self._background:
+            self._indexer.start()
+        else:
+            self._indexer.index_pending()
+
+        self._flush_indexed_items()
 
         return self._loaded_data_items
 
+    def wait_for_index(self, timeout=None):
+        """
+        Waits until all data directories are indexed
+        :param timeout: float or None
+        :return: bool, True if all directories were indexed
+        """
+
+        indexed = self._indexer.wait(timeout)
+        self._flush_indexed_items()
+
+        return indexed
+
+    def is_indexing(self):
+        """
+        Returns whether data directories are being indexed
+        :return: bool
+        """
+
+        return self._indexer.is_indexing()
+
+    def add_index_listener(self, callback):
+        """
+        Adds a function that is called each time a data directory is scanned, with the directory and the paths of its
+        modules. If background indexing is enabled, listeners are called from the indexer thread. Listeners must not
+        access the scene or Qt widgets directly: Qt consumers must marshal the call back to the main thread (for
+        example, emitting a signal connected with a queued connection) and then call get_all_data_items or
+        get_registry from there to import and register the new items
+        :param callback: callable
+        """
+
+        if callback not in self._index_listeners:
+            self._index_listeners.append(callback)
+
+    def remove_index_listener(self, callback):
+        """
+        Removes given index listener
+        :param callback: callable
+        """
+
+        if callback in self._index_listeners:
+            self._index_listeners.remove(callback)
+
+    def stop_indexing(self):
+        """
+        Stops background indexing thread
+        """
+
+        self._indexer.stop()
+
+    def update_data_classes(self, *args, **kwargs):
+        """
+        Overrides base manager.LibraryManager update_data_classes function
+        Registry indexes are rebuilt next time they are used
+        """
+
+        self._registry = None
+
+        return super(DataManager, self).update_data_classes(*args, **kwargs)
+
+    def get_registry(self):
+        """
+        Returns the registry that indexes data classes and data items by data type, extension and menu name
+        Registry is built once after data classes or data items are updated
+        :return: DataRegistry
+        """
+
+        self._flush_indexed_items()
+        if self._registry is None:
+            self._registry = registry.DataRegistry(
+                data_classes=self.get_all_data_classes(), data_items=self._loaded_data_items)
+
+        return self._registry
+
     def get_type_instance(self, data_type):
         """
         Returns a new instance of data type
@@ -133,63 +238,155 @@ class DataManager(manager.LibraryManager, object):
         :return: variant
         """
 
-        for data_class in self.get_all_data_classes():
-            if data_class.is_type_match(data_type):
-                return data_class()
+        data_class = self.get_registry().get_data_class(data_type)
+        if data_class is None:
+            return None
 
-    def _load_data_classes(self, directory):
+        return data_class()
 
-        imported = list()
+    def get_data_class_for_path(self, file_path):
+        """
+        Returns data class (FileData) that stores the given file
+        :param file_path: str
+        :return: FileData or None
+        """
 
-        if directory is None or not os.path.exists(directory):
-            LOGGER.warning('Data Path {} does not exists!'.format(directory))
-            return imported
+        return self.get_registry().get_data_class_for_path(file_path)
 
-        for loader, mod_name, is_package in pkgutil.walk_packages([directory]):
-            try:
-                module = loader.find_module(mod_name).load_module(mod_name)
-                for cname, obj in inspect.getmembers(module, inspect.isclass):
-                    if not issubclass(obj, core_data.FileData):
-                        continue
-                    # globals()[cname] = obj
-                    imported.append(obj)
-            except Exception as exc:
-                LOGGER.warning('Aborting loading Data Class {} : {}'.format(mod_name, str(exc)))
-                LOGGER.debug(traceback.format_exc())
+    def get_data_item_for_path(self, file_path):
+        """
+        Returns data item class (DataItem) that handles the given file
+        :param file_path: str
+        :return: DataItem or None
+        """
 
-        # TODO: Not working in Python 3
-        # return sorted(list(set(imported)))
+        return self.get_registry().get_data_item_for_path(file_path)
 
-        return list(set(imported))
+    def get_data_item_by_menu_name(self, menu_name):
+        """
+        Returns data item class (DataItem) with the given menu name
+        :param menu_name: str
+        :return: DataItem or None
+        """
 
-    def _load_data_items(self, directory):
+        return self.get_registry().get_data_item_by_menu_name(menu_name)
+
+    def export_items(self, data_items, comment='', objects=None, create_version=False, max_workers=None):
         """
-        Internal function that loads data classes
+        Exports the data of the given items
+        Items whose data class implements collect_data and write_data gather scene data in the main thread while their
+        files are written into disk in a thread pool. Other items are exported serially in the main thread
+        :param data_items: list(DataItem), item instances to export
+        :param comment: str
+        :param objects: list(str) or None
+        :param create_version: bool
+        :param max_workers: int or None, number of worker threads. If 0, items are exported serially
+        :return: BatchRunner, runner with the result, timings and errors of each item
+        """
+
+        runner = batch.BatchRunner(max_workers=max_workers)
+        for data_item in data_items:
+            runner.add_task(
+                data_item.get_export_task(comment=comment, objects=objects, create_version=create_version))
+        runner.run()
+        runner.log_report(name='Data export')
+
+        return runner
+
+    def import_items(self, data_items, objects=None, max_workers=None):
+        """
+        Imports the data of the given items into current scene
+        Items whose data class implements read_data and apply_data read their files in a thread pool while data is
+        applied into the scene in the main thread. Other items are imported serially in the main thread
+        :param data_items: list(DataItem), item instances to import
+        :param objects: list(str) or None, objects data is imported into. If None, selected nodes are used
+        :param max_workers: int or None, number of worker threads. If 0, items are imported serially
+        :return: BatchRunner, runner with the result, timings and errors of each item
+        """
+
+        objects = dcc.selected_nodes() if objects is None else objects
+
+        runner = batch.BatchRunner(max_workers=max_workers)
+        for data_item in data_items:
+            runner.add_task(data_item.get_import_task(objects=objects))
+        runner.run()
+        runner.log_report(name='Data import')
+
+        return runner
+
+    def _on_directory_indexed(self, directory, module_paths):
+        """
+        Internal callback function that is called by the indexer each time a directory is scanned
+        Modules are imported and their items registered later in the thread that uses the manager
         :param directory: str
-        :return: list
+        :param module_paths: list(str)
         """
 
-        data_classes = list()
+        with self._index_lock:
+            if directory not in self._scanned_directories:
+                self._scanned_directories.append(directory)
 
-        if directory is None or not path.is_dir(directory):
-            LOGGER.warning('Data Path {} does not exists!'.format(directory))
-            return data_classes
+        for listener in list(self._index_listeners):
+            listener(directory, module_paths)
 
-        for loader, mod_name, is_package in pkgutil.walk_packages([directory]):
-            try:
-                module = loader.find_module(mod_name).load_module(mod_name)
-                for cname, obj in inspect.getmembers(module, inspect.isclass):
-                    if not issubclass(obj, data.DataItem):
-                        continue
-                    data_classes.append(obj)
-            except Exception as exc:
-                LOGGER.warning('Aborting loading Data Class {} : {}'.format(mod_name, str(exc)))
-                LOGGER.error(traceback.format_exc())
+    def _flush_indexed_items(self):
+        """
+        Internal function that imports and registers the items of the directories scanned since last flush
+        Data item modules can import Qt, so they are always imported in the thread that uses the manager and never
+        in the indexer thread
+        """
+
+        with self._index_lock:
+            if not self._scanned_directories:
+                return
+            scanned_directories = self._scanned_directories[:]
+            del self._scanned_directories[:]
+            for directory in scanned_directories:
+                self._indexed_items[directory] = self._load_data_items(directory)
+            indexed_items = list()
+            for directory in self._directories:
+                indexed_items.extend(self._indexed_items.get(directory, list()))
+            self._loaded_data_items = list(OrderedDict.fromkeys(indexed_items))
+            # Items are registered only once, even if they are found in multiple directories or reloaded
+            for data_item in self._loaded_data_items:
+                if data_item not in self._registered_items:
+                    self._registered_items.add(data_item)
+                    self.register_item(data_item)
+            self._registry = None
+
+    def _load_data_classes(self, directory):
+        """
+        Internal function that loads data classes (FileData) located in the given directory
+        Modules that were not modified since last time are not imported again
+        :param directory: str
+        :return: list
+        """
+
+        return list(OrderedDict.fromkeys(_DATA_CLASSES_DISCOVERY.load_classes(directory)))
 
+    def _load_data_items(self, directory):
+        """
+        Internal function that loads data items (DataItem) located in the given directory
+        Modules that were not modified since last time are not imported again
+        :param directory: str
+        :return: list
+        """
+
+        data_classes = list(OrderedDict.fromkeys(_DATA_ITEMS_DISCOVERY.load_classes(directory)))
         for data_cls in data_classes:
             LOGGER.info('Found Data Class: {}'.format(data_cls))
 
-        # TODO: Not working in Python 3
-        # '<' not supported between instances of 'Shiboken.ObjectType' and 'Shiboken.ObjectType'
-        # return sorted(list(set(data_classes)))
-        return list(set(data_classes))
+        return data_classes
+
+
+def _scan_directory(directory):
+    """
+    Internal function used by data items indexer to list the modules of the given directory without importing them
+    :param directory: str
+    :return: list(str)
+    """
+
+    if not directory or not os.path.isdir(directory):
+        return list()
+
+    return [module_info.file_path for module_info in discovery.iter_modules(directory)]
@@ -7,6 +7,7 @@ Module that contains implementation for names manager
 
 from __future__ import print_function, division, absolute_import
 
+import os
 import logging
 
 from tpDcc import dcc
@@ -14,25 +15,168 @@ from tpDcc.managers import configs
 from tpDcc.libs.python import python
 from tpDcc.libs.nameit.core import namelib
 
+from tpRigToolkit.core import cache, naming, scene, snapshots, classifier
+
 LOGGER = logging.getLogger('tpRigToolkit-core')
 
 
-_NAME_LIB = None
-_NAMING_FILE = None
+NAMING_CACHE_SIZE_ENV = 'TPRIGTOOLKIT_NAMING_CACHE_SIZE'
+NAMING_DISK_CACHE_ENV = 'TPRIGTOOLKIT_NAMING_DISK_CACHE'
+# DCC callbacks that discard cached node classifications
+SCENE_CHANGED_CALLBACKS = ('SceneNewFinished', 'SceneOpenFinished', 'NodeAdded', 'NodeDeleted')
+
+
+def _get_naming_cache_directory():
+    """
+    Internal function that returns the directory where parsed naming files are cached
+    Disk cache can be disabled by setting TPRIGTOOLKIT_NAMING_DISK_CACHE environment variable to 0
+    :return: str or None
+    """
+
+    if os.environ.get(NAMING_DISK_CACHE_ENV, '1').lower() in ('0', 'false', 'no', 'off'):
+        return None
+
+    return cache.get_cache_directory('naming')
+
+
+class CachedNameLib(namelib.NameLib, object):
+    """
+    Naming library that reads its naming file through tpRigToolkit naming disk cache
+    """
+
+    def init_naming_data(self):
+        # Naming files with data are loaded directly from the cache. Empty ones are initialized by NameLib
+        if self._parser_format == 'yaml' and self.has_valid_naming_file() and os.path.getsize(self.naming_file):
+            self.load_session()
+            return None
+
+        return super(CachedNameLib, self).init_naming_data()
+
+    def load_naming_data(self):
+        if self._parser_format != 'yaml' or not self.has_valid_naming_file():
+            return super(CachedNameLib, self).load_naming_data()
+
+        return naming.read_naming_data(self.naming_file, cache_directory=_ENGINE.cache_directory)
+
+
+_ENGINE = naming.NamingEngine(
+    name_lib_factory=CachedNameLib, capacity=int(os.environ.get(NAMING_CACHE_SIZE_ENV, '') or 8),
+    cache_directory=_get_naming_cache_directory())
+_CLASSIFIERS = dict()
+_SCENE_CALLBACKS = list()
+
+
+def _load_config(config_name, environment):
+    """
+    Internal function that loads given configuration
+    :param config_name: str
+    :param environment: str
+    :return: tuple(dict, str)
+    """
+
+    config = configs.get_config(config_name=config_name, environment=environment)
+    if not config:
+        return dict(), None
+
+    return config.data or dict(), config.get_path()
+
+
+_CONFIGS = snapshots.ConfigSnapshot(_load_config)
+
+
+def get_engine():
+    """
+    Returns naming engine used by tpRigToolkit
+    :return: NamingEngine
+    """
+
+    return _ENGINE
 
 
 def init_lib(naming_file=None, dev=True):
-    global _NAME_LIB
-    global _NAMING_FILE
-    if _NAME_LIB and naming_file and _NAMING_FILE == naming_file:
-        return _NAME_LIB
+    """
+    Returns naming library of the given naming file
+    :param naming_file: str or None, If not given, naming file defined in tpRigToolkit-names configuration is used
+    :param dev: bool
+    :return: NameLib
+    """
+
+    return _ENGINE.get_name_lib(naming_file or get_naming_file(dev=dev))
+
+
+def get_naming_file(dev=True):
+    """
+    Returns path of the naming file defined in tpRigToolkit-names configuration
+    :param dev: bool
+    :return: str
+    """
 
     environment = 'development' if dev else 'production'
-    config = configs.get_config('tpRigToolkit-names', environment=environment)
-    _NAMING_FILE = naming_file or config.get_path()
-    _NAME_LIB = namelib.NameLib(naming_file=_NAMING_FILE)
+    naming_file = _CONFIGS.get_path('tpRigToolkit-names', environment=environment)
+
+    return os.path.abspath(naming_file) if naming_file else naming_file
+
+
+def get_config(config_name, dev=True):
+    """
+    Returns an immutable snapshot of the given naming configuration (tpRigToolkit-naming or tpRigToolkit-names)
+    Configuration is only loaded again when its file is modified
+    :param config_name: str
+    :param dev: bool
+    :return: FrozenDict
+    """
+
+    return _CONFIGS.get(config_name, environment='development' if dev else 'production')
+
+
+def get_config_generation():
+    """
+    Returns generation of naming configurations. It is increased each time a naming configuration changes, so caches
+    built from naming configuration data can be invalidated
+    :return: int
+    """
+
+    return _CONFIGS.generation
+
+
+def set_cache_capacity(capacity):
+    """
+    Sets the maximum number of naming files kept in memory
+    :param capacity: int
+    """
+
+    _ENGINE.set_capacity(capacity)
 
-    return _NAME_LIB
+
+def get_cache_stats():
+    """
+    Returns hits and misses of naming caches
+    :return: dict
+    """
+
+    return _ENGINE.stats()
+
+
+def clear_cache():
+    """
+    Clears all cached naming data. Naming files and configuration are read again next time they are used
+    """
+
+    _CONFIGS.invalidate()
+    _CLASSIFIERS.clear()
+    _ENGINE.clear()
+
+
+def get_compiled_naming(naming_file=None, dev=True):
+    """
+    Returns compiled rules and tokens of the given naming file
+    Naming file is only compiled again if it is modified
+    :param naming_file: str or None, If not given, naming file defined in tpRigToolkit-names configuration is used
+    :param dev: bool
+    :return: CompiledNaming
+    """
+
+    return _ENGINE.get_naming(naming_file or get_naming_file(dev=dev))
 
 
 def get_auto_suffixes(dev=True):
@@ -41,16 +185,77 @@ def get_auto_suffixes(dev=True):
     :return:
     """
 
-    environment = 'development' if dev else 'production'
-    naming_config = configs.get_config(config_name='tpRigToolkit-naming', environment=environment)
-    if not naming_config:
-        return dict()
+    return get_config('tpRigToolkit-naming', dev=dev).get('auto_suffixes', None) or snapshots.FrozenDict()
+
+
+def get_classifier(dev=True):
+    """
+    Returns node classifier used to retrieve the type of the nodes when they are renamed by their type
+    Classification rules are retrieved from type_rules key of tpRigToolkit-naming configuration (if not defined,
+    default rules are used)
+    :param dev: bool
+    :return: NodeClassifier
+    """
+
+    naming_config = get_config('tpRigToolkit-naming', dev=dev)
+    generation = get_config_generation()
+    cached = _CLASSIFIERS.get(dev, None)
+    if cached and cached[0] == generation:
+        return cached[1]
+
+    node_classifier = classifier.NodeClassifier(rules=naming_config.get('type_rules', None))
+    _CLASSIFIERS[dev] = (generation, node_classifier)
+
+    return node_classifier
+
+
+def invalidate_scene_cache(*args, **kwargs):
+    """
+    Discards all the node classifications cached in current scene
+    It is called by DCC callbacks each time a scene is opened or nodes are added or deleted
+    """
+
+    for _, node_classifier in _CLASSIFIERS.values():
+        node_classifier.invalidate()
 
-    auto_suffixes_dict = naming_config.get('auto_suffixes', default=dict())
-    if not auto_suffixes_dict:
-        return dict()
 
-    return auto_suffixes_dict
+def register_scene_callbacks():
+    """
+    Registers the DCC callbacks that discard cached node classifications when current scene changes
+    :return: bool, True if callbacks are registered
+    """
+
+    if _SCENE_CALLBACKS:
+        return True
+
+    # Callbacks manager initialization does nothing if it was already initialized by tpDcc
+    try:
+        from tpDcc.managers import callbacks
+        callbacks.CallbacksManager.initialize()
+    except Exception as exc:
+        LOGGER.debug('Impossible to register scene callbacks: {}'.format(exc))
+        return False
+
+    for callback_type in SCENE_CHANGED_CALLBACKS:
+        callbacks.CallbacksManager.register(callback_type, invalidate_scene_cache)
+        _SCENE_CALLBACKS.append(callback_type)
+
+    return True
+
+
+def unregister_scene_callbacks():
+    """
+    Unregisters the DCC callbacks that discard cached node classifications
+    """
+
+    if not _SCENE_CALLBACKS:
+        return
+
+    from tpDcc.managers import callbacks
+
+    for callback_type in _SCENE_CALLBACKS:
+        callbacks.CallbacksManager.unregister(callback_type, invalidate_scene_cache)
+    del _SCENE_CALLBACKS[:]
 
 
 def parse_name(node_name, rule_name=None, naming_file=None, dev=False):
@@ -62,25 +267,79 @@ def parse_name(node_name, rule_name=None, naming_file=None, dev=False):
     :return: dict(str)
     """
 
-    name_lib = init_lib(naming_file=naming_file, dev=dev)
+    compiled_naming = get_compiled_naming(naming_file=naming_file, dev=dev)
     rule_name = rule_name or 'default'
-    rule = None
-    if name_lib.has_rule(rule_name):
-        rule = name_lib.get_rule(rule_name)
+    rule = compiled_naming.get_rule(rule_name)
     if not rule:
         LOGGER.warning('Impossible to retrieve name because rule name "{}" is not defined!'.format(rule_name))
         return None
 
-    current_rule = name_lib.active_rule()
-    name_lib.set_active_rule(rule_name)
-    parsed_name = name_lib.parse(node_name)
-    if current_rule:
-        if rule_name != current_rule.name:
-            name_lib.set_active_rule(current_rule.name)
-    else:
-        name_lib.set_active_rule(None)
+    return rule.parse(node_name)
 
-    return parsed_name
+
+def parse_names(node_names, rule_name=None, naming_file=None, dev=False):
+    """
+    Parses all given names with the same rule
+    :param node_names: list(str)
+    :param rule_name: str
+    :param naming_file: str
+    :param dev: bool
+    :return: list(dict(str))
+    """
+
+    compiled_naming = get_compiled_naming(naming_file=naming_file, dev=dev)
+    rule_name = rule_name or 'default'
+    rule = compiled_naming.get_rule(rule_name)
+    if not rule:
+        LOGGER.warning('Impossible to retrieve names because rule name "{}" is not defined!'.format(rule_name))
+        return None
+
+    return naming.parse_names(rule, python.force_list(node_names))
+
+
+def match_name(node_name, naming_file=None, dev=False, get_keys=False):
+    """
+    Finds the rule used to solve the given name and parses the name with it
+    :param node_name: str
+    :param naming_file: str
+    :param dev: bool
+    :param get_keys: bool
+    :return: tuple(str, dict(str)) or tuple(None, None), name of the matched rule and parsed fields
+    """
+
+    rule, parsed_name = get_compiled_naming(naming_file=naming_file, dev=dev).get_parse_index().parse(
+        node_name, get_keys=get_keys)
+
+    return (rule.name, parsed_name) if rule else (None, None)
+
+
+def match_names(node_names, naming_file=None, dev=False, get_keys=False):
+    """
+    Finds the rule used to solve each one of the given names and parses the names with them
+    Names solved with different rules can be parsed in the same call
+    :param node_names: list(str)
+    :param naming_file: str
+    :param dev: bool
+    :param get_keys: bool
+    :return: list(tuple(str, dict(str))), name of the matched rule and parsed fields of each name
+    """
+
+    parse_index = get_compiled_naming(naming_file=naming_file, dev=dev).get_parse_index()
+    matched_names = list()
+    for node_name in python.force_list(node_names):
+        rule, parsed_name = parse_index.parse(node_name, get_keys=get_keys)
+        matched_names.append((rule.name, parsed_name) if rule else (None, None))
+
+    return matched_names
+
+
+def get_scene_names():
+    """
+    Returns a snapshot of the names of all nodes in current DCC scene that can be used to solve unique names
+    :return: UniqueNames
+    """
+
+    return naming.UniqueNames(dcc.all_scene_nodes(full_path=False))
 
 
 def solve_node_name_by_type(node_names=None, naming_file=None, dev=False, **kwargs):
@@ -88,20 +347,14 @@ def solve_node_name_by_type(node_names=None, naming_file=None, dev=False, **kwar
     Resolves node name taking into account its type
     In this case, the type of the node will be used to retrieve an an automatic rule
     The rule name will be retrieved using auto_suffix dict from tpDcc-naming configuration file
+    All nodes are queried once into a scene snapshot, so nodes are classified and renamed without querying DCC again
     :param node_names: str or list, name of the node we want to take name of
     :param naming_file: str
     :param dev: bool
     :return: str
     """
 
-    if not dcc.is_maya():
-        LOGGER.warning('Solve Node Name by type functionality is only supported in Maya!')
-        return None
-
-    import maya.cmds
-    from tpDcc.dccs.maya.core import name
-
-    name_lib = init_lib(naming_file=naming_file, dev=dev)
+    compiled_naming = get_compiled_naming(naming_file=naming_file, dev=dev)
 
     auto_suffix = get_auto_suffixes()
     if not auto_suffix:
@@ -109,83 +362,62 @@ def solve_node_name_by_type(node_names=None, naming_file=None, dev=False, **kwar
             'Impossible to launch auto suffix functionality because no auto suffixes are defined!')
         return None
 
-    solved_names = dict()
-    return_names = list()
-
     if not node_names:
         node_names = dcc.selected_nodes()
     if not node_names:
         return
     node_names = python.force_list(node_names)
 
-    for obj_name in node_names:
-        obj_uuid = maya.cmds.ls(obj_name, uuid=True)
-        if not obj_uuid:
-            continue
-        obj_uuid = obj_uuid[0]
-        if obj_uuid in solved_names:
-            LOGGER.warning(
-                'Node with name: "{} and UUID "{}" already renamed to "{}"! Skipping ...'.format(
-                    obj_name, obj_uuid, solved_names[obj_name]))
-            continue
-
-        # TODO: This code is a duplicated version of the one in
-        #  tpDcc.dccs.maya.core.name.auto_suffix_object function. Move this code to a DCC specific function
-        obj_type = maya.cmds.objectType(obj_name)
-        if obj_type == 'transform':
-            shape_nodes = maya.cmds.listRelatives(obj_name, shapes=True, fullPath=True)
-            if not shape_nodes:
-                obj_type = 'group'
-            else:
-                obj_type = maya.cmds.objectType(shape_nodes[0])
-        elif obj_type == 'joint':
-            shape_nodes = maya.cmds.listRelatives(obj_name, shapes=True, fullPath=True)
-            if shape_nodes and maya.cmds.objectType(shape_nodes[0]) == 'nurbsCurve':
-                obj_type = 'controller'
-        if obj_type == 'nurbsCurve':
-            connections = maya.cmds.listConnections('{}.message'.format(obj_name))
-            if connections:
-                for node in connections:
-                    if maya.cmds.nodeType(node) == 'controller':
-                        obj_type = 'controller'
-                        break
-        if obj_type not in auto_suffix:
-            rule_name = 'node'
-            node_type = obj_type
-        else:
-            rule_name = auto_suffix[obj_type]
-            node_type = auto_suffix[obj_type]
-
-        if not name_lib.has_rule(rule_name):
-            if not name_lib.has_rule('node'):
-                LOGGER.warning(
-                    'Impossible to rename node "{}" by its type "{}" because rule "{}" it is not defined and '
-                    'callback rule "node" either'.format(obj_name, obj_type, rule_name))
-            else:
-                rule_name = 'node'
-
-        if rule_name == 'node':
-            solved_name = solve_name(obj_name, node_type=node_type, rule_name=rule_name, **kwargs)
-        else:
-            solved_name = solve_name(rule_name, obj_name, rule_name=rule_name, **kwargs)
-        solved_names[obj_uuid] = solved_name
-
+    unique_name = kwargs.pop('unique_name', False)
+    node_classifier = get_classifier(dev=dev)
+    # Without scene callbacks, scene changes cannot be detected, so nodes are classified again in each call
+    if not register_scene_callbacks():
+        node_classifier.invalidate()
+    snapshot = scene.SceneSnapshot(dcc, node_names, classifier=node_classifier)
+    solved_names = scene.solve_node_names_by_type(
+        snapshot, compiled_naming, auto_suffix, node_classifier=node_classifier, **kwargs)
     if not solved_names:
         return
 
-    unique_name = kwargs.get('unique_name', False)
+    return snapshot.rename_nodes(solved_names, unique_name=unique_name)
 
-    for obj_id, solved_name in solved_names.items():
-        obj_name = maya.cmds.ls(obj_id, long=True)[0]
-        if not solved_names:
-            return_names.append(obj_name)
-        else:
-            if unique_name:
-                solved_name = dcc.find_unique_name(solved_name)
-            new_name = name.rename(obj_name, solved_name, uuid=obj_id, rename_shape=True)
-            return_names.append(new_name)
 
-    return return_names
+def solve_names(records, rule_name=None, naming_file=None, dev=False, use_auto_suffix=True, unique_name=False,
+                scene_names=None, default=None):
+    """
+    Resolves a name for each one of the given records with the same rule
+    Rule and auto suffixes are retrieved only once and, if unique names are requested, they are resolved against a
+    single snapshot of the scene names instead of querying the DCC once per name
+    :param records: list(dict) or dict(str, list), token values of each name or column oriented dictionary
+        (e.g: {'description': ['arm', 'leg'], 'side': 'left'})
+    :param rule_name: str
+    :param naming_file: str
+    :param dev: bool
+    :param use_auto_suffix: bool
+    :param unique_name: bool
+    :param scene_names: UniqueNames or None, snapshot of existing names. If not given and unique names are requested,
+        it is retrieved from current DCC scene
+    :param default: str or None, name used for records that cannot be solved
+    :return: list(str)
+    """
+
+    rule_name = rule_name or 'default'
+    compiled_naming = get_compiled_naming(naming_file=naming_file, dev=dev)
+    rule = compiled_naming.get_rule(rule_name)
+    if not rule:
+        LOGGER.warning('Rule with name "{}" is not defined. Default rule used'.format(rule_name))
+        rule = compiled_naming.get_rule('default')
+    if not rule:
+        LOGGER.warning('Impossible to retrieve names because rule name "{}" is not defined!'.format(rule_name))
+        return None
+
+    auto_suffixes = get_auto_suffixes() if use_auto_suffix else None
+    if unique_name and scene_names is None:
+        scene_names = get_scene_names()
+
+    return naming.solve_names(
+        rule, records, auto_suffixes=auto_suffixes, unique_names=scene_names if unique_name else None,
+        default=default)
 
 
 def solve_name(*args, **kwargs):
@@ -199,35 +431,27 @@ def solve_name(*args, **kwargs):
     dev = kwargs.get('dev', False)
     use_auto_suffix = kwargs.pop('use_auto_suffix', True)
     node_type = kwargs.get('node_type', None)
-    rule_name = kwargs.pop('rule_name') or 'default'
+    rule_name = kwargs.pop('rule_name', None) or 'default'
 
     if use_auto_suffix and node_type:
         auto_suffixes = get_auto_suffixes() or dict()
         if node_type in auto_suffixes:
             kwargs['node_type'] = auto_suffixes[node_type]
 
-    name_lib = init_lib(naming_file=naming_file, dev=dev)
+    compiled_naming = get_compiled_naming(naming_file=naming_file, dev=dev)
 
     fallback_default = False
-    if name_lib.has_rule(rule_name):
-        rule = name_lib.get_rule(rule_name)
-    else:
+    rule = compiled_naming.get_rule(rule_name)
+    if not rule:
         LOGGER.warning('Rule with name "{}" is not defined. Default rule used'.format(rule_name))
-        rule = name_lib.get_rule('default')
+        rule = compiled_naming.get_rule('default')
         fallback_default = True
 
     if not rule:
         LOGGER.warning('Impossible to retrieve name because rule name "{}" is not defined!'.format(rule_name))
         return None
 
-    current_rule = name_lib.active_rule()
-    name_lib.set_active_rule(rule)
-    solved_name = name_lib.solve(*args, **kwargs)
-    if current_rule:
-        if rule_name != current_rule.name:
-            name_lib.set_active_rule(current_rule.name)
-    else:
-        name_lib.set_active_rule(None)
+    solved_name = rule.solve(*args, **kwargs)
 
     solved_name = solved_name or kwargs.get('default', None)
 
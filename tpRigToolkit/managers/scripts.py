@@ -7,14 +7,13 @@ Module that contains data manager widgets
 
 from __future__ import print_function, division, absolute_import
 
-import os
 import logging
-import pkgutil
-import inspect
-import traceback
+from collections import OrderedDict
 
 from tpDcc.core import data as core_data, scripts
 
+from tpRigToolkit.core import discovery
+
 LOGGER = logging.getLogger('tpRigToolkit-core')
 
 _DIRECTORIES = list()
@@ -23,6 +22,8 @@ _LOADED_DATA_CLASSES = list()
 
 STANDARD_DATA_CLASSES = [scripts.ScriptManifestData, scripts.ScriptPythonData]
 
+_DISCOVERY = discovery.ClassDiscovery('script_data_classes', core_data.FileData)
+
 
 def get_all_data_classes(_reload=False):
     """
@@ -71,7 +72,8 @@ def load_data_classes(_reload=False):
 
     for d in _DIRECTORIES:
         loaded_classes = _load_data_classes(directory=d, _reload=_reload)
-        _LOADED_DATA_CLASSES.extend(loaded_classes)
+        _LOADED_DATA_CLASSES.extend(
+            loaded_class for loaded_class in loaded_classes if loaded_class not in _LOADED_DATA_CLASSES)
 
     return _LOADED_DATA_CLASSES
 
@@ -102,25 +104,12 @@ def get_type_instance(data_type):
 
 
 def _load_data_classes(directory, _reload=False):
+    """
+    Internal function that loads data classes (FileData) located in the given directory
+    Modules that were not modified since last time are not imported again, unless a reload is forced
+    :param directory: str
+    :param _reload: bool
+    :return: list
+    """
 
-    imported = list()
-
-    if directory is None or not os.path.exists(directory):
-        LOGGER.warning('Data Path {} does not exists!'.format(directory))
-        return imported
-
-    for loader, mod_name, is_package in pkgutil.walk_packages([directory]):
-        try:
-            module = loader.find_module(mod_name).load_module(mod_name)
-            if _reload:
-                reload(module)
-            for cname, obj in inspect.getmembers(module, inspect.isclass):
-                if not issubclass(obj, core_data.FileData):
-                    continue
-                # globals()[cname] = obj
-                imported.append(obj)
-        except Exception as e:
-            LOGGER.warning('Aborting loading Data Class {} : {}'.format(mod_name, str(e)))
-            LOGGER.debug(traceback.format_exc())
-
-    return sorted(list(set(imported)))
+    return list(OrderedDict.fromkeys(_DISCOVERY.load_classes(directory, force=_reload)))
@@ -8,7 +8,6 @@ Module that contains options to select rig bones/joints
 from __future__ import print_function, division, absolute_import
 
 import os
-import json
 
 from Qt.QtCore import Qt, QFileInfo
 from Qt.QtWidgets import QDialog, QTreeWidget, QTreeWidgetItem
@@ -18,6 +17,7 @@ from tpDcc.libs.qt.core import base
 from tpDcc.libs.qt.widgets import layouts, lineedit, buttons, dividers
 from tpDcc.libs.qt.widgets.options import option, list, text
 
+from tpRigToolkit.core import container
 from tpRigToolkit.data import skeleton
 
 
@@ -157,8 +157,7 @@ class BoneHierarchyWidget(base.BaseWidget, object):
         if not self._file_path or not os.path.isfile(self._file_path):
             return
 
-        with open(self._file_path, 'r') as fh:
-            skeleton_data = json.load(fh)
+        skeleton_data = container.read_document(self._file_path)
         if not skeleton_data:
             return
 
@@ -17,6 +17,7 @@ from tpDcc.managers import resources, tools
 from tpDcc.libs.qt.core import base
 from tpDcc.libs.qt.widgets import layouts, dividers, buttons, combobox
 
+from tpRigToolkit.core import cache
 from tpRigToolkit.widgets.options import rigoptionsviewer
 
 LOGGER = logging.getLogger('tpRigToolkit-core')
@@ -129,6 +130,7 @@ class NamingWidget(base.BaseWidget, object):
     def __init__(self, project=None, parent=None):
 
         self._project = project
+        self._naming_session = None
 
         super(NamingWidget, self).__init__(parent=parent)
 
@@ -172,7 +174,12 @@ class NamingWidget(base.BaseWidget, object):
             naming_lib = self._project.naming_lib
             if not naming_lib:
                 return
-            naming_lib.load_session()
+            # Naming session is only loaded again if the naming file was modified since it was loaded
+            naming_file = naming_lib.naming_file
+            naming_session = (id(naming_lib), naming_file, cache.get_file_mtime(naming_file))
+            if naming_session != self._naming_session:
+                naming_lib.load_session()
+                self._naming_session = naming_session
             rules = naming_lib.rules
             for rule in rules:
                 self._name_rules.addItem(rule.name, userData=rule)